@@ -0,0 +1,21 @@
+import os
+from flask import Flask
+from flask_jwt_extended import JWTManager
+from flask_cors import CORS
+from dotenv import load_dotenv
+from controllers.controller_api import api_bp
+
+load_dotenv()
+jwt = JWTManager()
+
+def create_app():
+    app = Flask(__name__)
+    CORS(app)
+    app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "secretkey")
+    app.config['INTERNAL_SERVICE_TOKEN'] = os.getenv('INTERNAL_SERVICE_TOKEN')
+
+    jwt.init_app(app)
+
+    app.register_blueprint(api_bp)
+
+    return app
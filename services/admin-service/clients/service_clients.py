@@ -0,0 +1,12 @@
+from ev_common.service_client import get_client
+import os
+
+SERVICE_URLS = {
+    "users": os.environ.get('USER_SERVICE_URL', 'http://user-service:5000'),
+    "listings": os.environ.get('LISTING_SERVICE_URL', 'http://listing-service:5001'),
+    "vehicles": os.environ.get('VEHICLE_SERVICE_URL', 'http://vehicle-service:5002'),
+    "transactions": os.environ.get('TRANSACTION_SERVICE_URL', 'http://transaction-service:5003'),
+}
+
+def service_client(name):
+    return get_client(name, SERVICE_URLS[name])
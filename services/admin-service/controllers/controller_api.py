@@ -0,0 +1,40 @@
+from flask import request, jsonify, Blueprint
+from functools import wraps
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
+from services.dashboardService import DashboardService, FANOUT_DEADLINE
+from ev_common.service_client import all_stats
+
+api_bp = Blueprint('api', __name__, url_prefix='/api')
+
+MIN_DEADLINE = 0.1
+MAX_DEADLINE = 10.0
+
+def admin_required():
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            verify_jwt_in_request()
+            claim = get_jwt()
+            if claim.get("role")!= "Admin":
+                return jsonify({"error": "Admin access required"}), 403
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
+
+@api_bp.route('/dashboard', methods=['GET'])
+@admin_required()
+def dashboard():
+    sections = [s for s in request.args.get("sections", "").split(",") if s] or None
+    deadline = max(MIN_DEADLINE, min(request.args.get("deadline", FANOUT_DEADLINE, type=float), MAX_DEADLINE))
+    if request.args.get("refresh") == "1":
+        DashboardService.invalidate()
+    payload, error = DashboardService.dashboard(sections, deadline)
+    if error:
+        return jsonify({"error": error}), 400
+    status_code = 503 if payload["errors"] and not payload["sections"] else 200
+    return jsonify(payload), status_code
+
+@api_bp.route('/service-clients', methods=['GET'])
+@admin_required()
+def service_clients():
+    return jsonify(all_stats()), 200
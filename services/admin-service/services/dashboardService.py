@@ -0,0 +1,81 @@
+from flask import current_app
+from clients.service_clients import service_client, SERVICE_URLS
+from services.localCache import LocalTTLCache
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+import requests
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+FANOUT_WORKERS = int(os.getenv("ADMIN_FANOUT_WORKERS", 16))
+FANOUT_DEADLINE = float(os.getenv("ADMIN_FANOUT_DEADLINE", 2.0))
+CACHE_TTL = float(os.getenv("ADMIN_CACHE_TTL", 10))
+
+DASHBOARD_SECTIONS = {
+    "users": "/internal/stats",
+    "listings": "/internal/stats",
+    "vehicles": "/internal/stats",
+    "transactions": "/internal/stats",
+}
+
+_executor = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix="admin-fanout")
+_cache = LocalTTLCache(256, CACHE_TTL)
+
+def _fetch(name, path, headers, deadline):
+    response = service_client(name).get(path, headers=headers, timeout=(min(0.5, deadline), deadline))
+    response.raise_for_status()
+    return response.json()
+
+class DashboardService:
+    @staticmethod
+    def fan_out(calls, deadline=FANOUT_DEADLINE):
+        token = current_app.config.get('INTERNAL_SERVICE_TOKEN')
+        headers = {'X-Internal-Token': token} if token else {}
+        results, errors, cached = {}, {}, []
+        futures = {}
+        for name, path in calls.items():
+            hit = _cache.get((name, path))
+            if hit is not None:
+                results[name] = hit
+                cached.append(name)
+            else:
+                futures[_executor.submit(_fetch, name, path, dict(headers), deadline)] = name
+        done, pending = wait(futures, timeout=deadline)
+        for future in done:
+            name = futures[future]
+            try:
+                results[name] = future.result()
+                _cache.set((name, calls[name]), results[name])
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Admin fan-out to {name} failed: {e}")
+                errors[name] = str(e) or e.__class__.__name__
+            except ValueError:
+                errors[name] = "Invalid response"
+        for future in pending:
+            future.cancel()
+            errors[futures[future]] = f"Timed out after {deadline}s"
+        return results, errors, cached
+    @staticmethod
+    def dashboard(sections=None, deadline=FANOUT_DEADLINE):
+        sections = sections or list(DASHBOARD_SECTIONS)
+        unknown = [s for s in sections if s not in DASHBOARD_SECTIONS]
+        if unknown:
+            return None, f"Unknown sections: {', '.join(unknown)}"
+        results, errors, cached = DashboardService.fan_out(
+            {name: DASHBOARD_SECTIONS[name] for name in sections}, deadline
+        )
+        return {
+            "sections": results,
+            "errors": errors,
+            "partial": bool(errors),
+            "cached": sorted(cached),
+            "generated_at": datetime.now(timezone.utc).isoformat()
+        }, None
+    @staticmethod
+    def invalidate():
+        _cache.clear()
+    @staticmethod
+    def service_urls():
+        return dict(SERVICE_URLS)
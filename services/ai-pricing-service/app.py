@@ -0,0 +1,48 @@
+import os
+from flask import Flask
+from flask_cors import CORS
+from extensions import db, jwt, migrate
+import click
+from models.pricing_model import PricingModel
+from services.pricingService import PricingService, RIDGE_ALPHA
+from services.benchmarkService import BenchmarkService
+from controllers.controller_api import api_bp
+import sys
+
+
+def create_app():
+    app = Flask(__name__)
+    CORS(app)
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv("DATABASE_URL")
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "secretkey")
+    app.config['INTERNAL_SERVICE_TOKEN'] = os.getenv('INTERNAL_SERVICE_TOKEN')
+
+    db.init_app(app)
+    migrate.init_app(app, db)
+    jwt.init_app(app)
+
+    app.register_blueprint(api_bp)
+
+    @app.cli.command("train-pricing-model")
+    @click.option("--alpha", default=RIDGE_ALPHA)
+    def train_pricing_model_command(alpha):
+        record, message = PricingService.train(alpha)
+        if not record:
+            print(message)
+            sys.exit(1)
+        mape = f"{record.holdout_mape * 100:.1f}%" if record.holdout_mape is not None else "n/a"
+        print(f"Đã huấn luyện mô hình {record.version} trên {record.training_rows} tin đăng, MAPE kiểm tra {mape}.")
+
+    @app.cli.command("bench-pricing")
+    @click.option("--rows", default=100000)
+    @click.option("--batch-size", default=1000)
+    def bench_pricing_command(rows, batch_size):
+        report = BenchmarkService.prediction_throughput(rows, batch_size)
+        if report is None:
+            print("Chưa có mô hình định giá, hãy chạy flask train-pricing-model trước.")
+            sys.exit(1)
+        for key, value in report.items():
+            print(f"{key:>18}: {value}")
+
+    return app
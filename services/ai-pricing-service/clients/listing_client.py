@@ -0,0 +1,23 @@
+from ev_common.service_client import get_client
+import os
+
+LISTING_SERVICE_URL = os.environ.get('LISTING_SERVICE_URL', 'http://listing-service:5001')
+EXPORT_BATCH_SIZE = 5000
+
+def listing_client():
+    return get_client("listing-service", LISTING_SERVICE_URL)
+
+def iter_training_rows(batch_size=EXPORT_BATCH_SIZE):
+    after_id = 0
+    while True:
+        response = listing_client().get(
+            "/internal/listings/training-data",
+            params={"after_id": after_id, "limit": batch_size},
+            timeout=(1, 30)
+        )
+        response.raise_for_status()
+        rows = response.json().get("rows", [])
+        if not rows:
+            return
+        yield from rows
+        after_id = rows[-1]['listing_id']
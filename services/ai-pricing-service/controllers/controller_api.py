@@ -0,0 +1,65 @@
+from flask import request, jsonify, Blueprint
+from functools import wraps
+from flask_jwt_extended import get_jwt, verify_jwt_in_request, jwt_required
+from services.pricingService import PricingService, MAX_BATCH_SIZE
+from models.pricing_model import PricingModel
+
+api_bp = Blueprint('api', __name__, url_prefix='/api')
+
+def admin_required():
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            verify_jwt_in_request()
+            claim = get_jwt()
+            if claim.get("role")!= "Admin":
+                return jsonify({"error": "Admin access required"}), 403
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
+
+def serialize_pricing_model(record):
+    if not record: return None
+    return {
+        'version': record.version,
+        'training_rows': record.training_rows,
+        'holdout_rows': record.holdout_rows,
+        'holdout_mape': record.holdout_mape,
+        'residual_std': record.residual_std,
+        'alpha': record.alpha,
+        'is_active': record.is_active,
+        'trained_at': record.trained_at.isoformat() if record.trained_at else None
+    }
+
+@api_bp.route('/price-suggestion', methods=['POST'])
+@jwt_required()
+def price_suggestion():
+    result, error = PricingService.suggest_prices([request.get_json(silent=True)])
+    if error:
+        return jsonify({"error": error}), 503
+    item = result["items"][0]
+    if "error" in item:
+        return jsonify(item), 400
+    return jsonify(dict(item, model_version=result["model_version"])), 200
+
+@api_bp.route('/price-suggestions', methods=['POST'])
+@jwt_required()
+def price_suggestions():
+    data = request.get_json(silent=True) or {}
+    vehicles = data.get("vehicles")
+    if not isinstance(vehicles, list):
+        return jsonify({"error": "vehicles must be a list"}), 400
+    if len(vehicles) > MAX_BATCH_SIZE:
+        return jsonify({"error": f"At most {MAX_BATCH_SIZE} vehicles per request"}), 400
+    result, error = PricingService.suggest_prices(vehicles)
+    if error:
+        return jsonify({"error": error}), 503
+    return jsonify(result), 200
+
+@api_bp.route('/models/active', methods=['GET'])
+@admin_required()
+def active_pricing_model():
+    record = PricingModel.query.filter_by(is_active=True).order_by(PricingModel.model_id.desc()).first()
+    if not record:
+        return jsonify({"error": "No pricing model has been trained yet."}), 404
+    return jsonify(serialize_pricing_model(record)), 200
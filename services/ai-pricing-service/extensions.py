@@ -0,0 +1,10 @@
+import os
+from flask_sqlalchemy import SQLAlchemy
+from flask_jwt_extended import JWTManager
+from flask_migrate import Migrate
+from dotenv import load_dotenv
+
+load_dotenv()
+db = SQLAlchemy()
+jwt = JWTManager()
+migrate = Migrate(version_table = 'alembic_version_pricing')
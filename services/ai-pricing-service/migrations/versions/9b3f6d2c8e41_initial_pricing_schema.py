@@ -0,0 +1,39 @@
+"""initial pricing schema
+
+Revision ID: 9b3f6d2c8e41
+Revises: 
+Create Date: 2026-10-18 16:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b3f6d2c8e41'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('pricing_models',
+    sa.Column('model_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.String(length=50), nullable=False),
+    sa.Column('path', sa.String(length=255), nullable=False),
+    sa.Column('training_rows', sa.Integer(), nullable=False),
+    sa.Column('holdout_rows', sa.Integer(), nullable=False),
+    sa.Column('holdout_mape', sa.Float(), nullable=True),
+    sa.Column('residual_std', sa.Float(), nullable=False),
+    sa.Column('alpha', sa.Float(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('trained_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('model_id'),
+    sa.UniqueConstraint('version')
+    )
+    op.create_index('ix_pricing_models_is_active', 'pricing_models', ['is_active'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_pricing_models_is_active', table_name='pricing_models')
+    op.drop_table('pricing_models')
@@ -0,0 +1,19 @@
+from extensions import db
+from datetime import datetime, timezone
+
+class PricingModel(db.Model):
+    __tablename__ = 'pricing_models'
+
+    model_id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.String(50), nullable=False, unique=True)
+    path = db.Column(db.String(255), nullable=False)
+    training_rows = db.Column(db.Integer, nullable=False)
+    holdout_rows = db.Column(db.Integer, nullable=False)
+    holdout_mape = db.Column(db.Float, nullable=True)
+    residual_std = db.Column(db.Float, nullable=False)
+    alpha = db.Column(db.Float, nullable=False)
+    is_active = db.Column(db.Boolean, nullable=False, default=False, index=True)
+    trained_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    def __repr__(self):
+        return f"<PricingModel {self.version}{' (active)' if self.is_active else ''}>"
@@ -0,0 +1,41 @@
+from services.pricingService import PricingService
+import numpy as np
+import time
+
+class BenchmarkService:
+    @staticmethod
+    def synthetic_vehicles(model, rows, seed=0):
+        rng = np.random.default_rng(seed)
+        pairs = [m.split("|", 1) for m in model.models] or [["toyota", "vios"]]
+        picks = rng.integers(0, len(pairs), rows)
+        years = rng.integers(model.reference_year - 15, model.reference_year + 1, rows)
+        mileages = rng.integers(0, 250000, rows)
+        return [
+            {"brand": pairs[p][0], "model": pairs[p][1], "year": int(y), "mileage": int(m)}
+            for p, y, m in zip(picks, years, mileages)
+        ]
+    @staticmethod
+    def prediction_throughput(rows=100000, batch_size=1000, single_rows=2000):
+        model, version = PricingService.active_model()
+        if model is None:
+            return None
+        vehicles = BenchmarkService.synthetic_vehicles(model, rows)
+
+        started = time.perf_counter()
+        for vehicle in vehicles[:single_rows]:
+            PricingService.suggest_prices([vehicle])
+        single_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for start in range(0, rows, batch_size):
+            PricingService.suggest_prices(vehicles[start:start + batch_size])
+        batch_elapsed = time.perf_counter() - started
+
+        return {
+            "model_version": version,
+            "single_rows": single_rows,
+            "single_per_second": round(single_rows / single_elapsed, 1),
+            "batch_rows": rows,
+            "batch_size": batch_size,
+            "batch_per_second": round(rows / batch_elapsed, 1)
+        }
@@ -0,0 +1,122 @@
+from extensions import db
+from models.pricing_model import PricingModel
+from services.ridgeModel import RidgePriceModel
+from clients.listing_client import iter_training_rows
+from datetime import datetime, timezone
+import numpy as np
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+MODEL_DIR = os.getenv("PRICING_MODEL_DIR", "model_store")
+MODEL_REFRESH_SECONDS = float(os.getenv("PRICING_MODEL_REFRESH_SECONDS", 30))
+RIDGE_ALPHA = float(os.getenv("PRICING_RIDGE_ALPHA", 1.0))
+SOLD_WEIGHT = float(os.getenv("PRICING_SOLD_WEIGHT", 2.0))
+MIN_TRAINING_ROWS = int(os.getenv("PRICING_MIN_TRAINING_ROWS", 50))
+HOLDOUT_EVERY = 10
+MAX_BATCH_SIZE = int(os.getenv("PRICING_MAX_BATCH_SIZE", 10000))
+VEHICLE_FIELDS = ('brand', 'model', 'year', 'mileage')
+
+_model_cache = {"entry": (None, None), "checked_at": 0.0}
+_model_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+
+class PricingService:
+    @staticmethod
+    def active_model():
+        model, version = _model_cache["entry"]
+        if model is not None and time.monotonic() - _model_cache["checked_at"] < MODEL_REFRESH_SECONDS:
+            return model, version
+        if not _refresh_lock.acquire(blocking=model is None):
+            return model, version
+        try:
+            record = PricingModel.query.filter_by(is_active=True).order_by(PricingModel.model_id.desc()).first()
+            current_model, current_version = _model_cache["entry"]
+            if record is None:
+                entry = (None, None)
+            elif record.version == current_version:
+                entry = (current_model, current_version)
+            else:
+                entry = (RidgePriceModel.load(record.path), record.version)
+                logger.info(f"Loaded pricing model {record.version}")
+            with _model_lock:
+                _model_cache["entry"] = entry
+                _model_cache["checked_at"] = time.monotonic()
+            return entry
+        finally:
+            _refresh_lock.release()
+    @staticmethod
+    def train(alpha=RIDGE_ALPHA, rows=None):
+        rows = list(rows if rows is not None else iter_training_rows())
+        rows = [row for row in rows if row.get('price') and row['price'] > 0]
+        if len(rows) < MIN_TRAINING_ROWS:
+            return None, f"Need at least {MIN_TRAINING_ROWS} listings to train, got {len(rows)}."
+        columns = {field: [row[field] for row in rows] for field in VEHICLE_FIELDS}
+        prices = np.array([row['price'] for row in rows], dtype=np.float64)
+        weights = np.where(np.array([row.get('status') for row in rows]) == 'sold', SOLD_WEIGHT, 1.0)
+        holdout = np.arange(len(rows)) % HOLDOUT_EVERY == 0
+        train = ~holdout
+
+        def subset(mask):
+            return [np.asarray(columns[f], dtype=object)[mask] for f in VEHICLE_FIELDS]
+
+        evaluation = RidgePriceModel.fit(*subset(train), prices[train], weights[train], alpha)
+        predicted, _, _ = evaluation.predict(*subset(holdout))
+        mape = float(np.mean(np.abs(predicted - prices[holdout]) / prices[holdout])) if holdout.any() else None
+
+        model = RidgePriceModel.fit(columns['brand'], columns['model'], columns['year'], columns['mileage'], prices, weights, alpha)
+        version = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        path = os.path.abspath(os.path.join(MODEL_DIR, version))
+        model.save(path)
+
+        PricingModel.query.filter_by(is_active=True).update({"is_active": False}, synchronize_session=False)
+        record = PricingModel(
+            version=version,
+            path=path,
+            training_rows=len(rows),
+            holdout_rows=int(holdout.sum()),
+            holdout_mape=mape,
+            residual_std=model.residual_std,
+            alpha=alpha,
+            is_active=True
+        )
+        db.session.add(record)
+        db.session.commit()
+        return record, "Pricing model trained."
+    @staticmethod
+    def _validate(vehicle):
+        if not isinstance(vehicle, dict) or not all(vehicle.get(f) is not None for f in VEHICLE_FIELDS):
+            return None, "brand, model, year and mileage are required."
+        try:
+            year, mileage = int(vehicle['year']), int(vehicle['mileage'])
+        except (TypeError, ValueError):
+            return None, "year and mileage must be integers."
+        if mileage < 0:
+            return None, "mileage must not be negative."
+        return (str(vehicle['brand']), str(vehicle['model']), year, mileage), None
+    @staticmethod
+    def suggest_prices(vehicles):
+        model, version = PricingService.active_model()
+        if model is None:
+            return None, "No pricing model has been trained yet."
+        valid, results = [], [None] * len(vehicles)
+        for index, vehicle in enumerate(vehicles):
+            row, error = PricingService._validate(vehicle)
+            if error:
+                results[index] = {"error": error}
+            else:
+                valid.append((index, row))
+        if valid:
+            indices, rows = zip(*valid)
+            brands, models, years, mileages = zip(*rows)
+            prices, lows, highs = model.predict(brands, models, years, mileages)
+            for i, index in enumerate(indices):
+                results[index] = {
+                    "suggested_price": round(float(prices[i]), -3),
+                    "low": round(float(lows[i]), -3),
+                    "high": round(float(highs[i]), -3)
+                }
+        return {"model_version": version, "items": results}, None
@@ -0,0 +1,123 @@
+import numpy as np
+import json
+import os
+
+MIN_CATEGORY_COUNT = 5
+DESIGN_CHUNK_ROWS = 20000
+INTERVAL_Z = 1.2816
+
+def normalize(value):
+    return str(value).strip().lower()
+
+def numeric_features(years, mileages, reference_year):
+    years = np.asarray(years, dtype=np.float64)
+    mileages = np.clip(np.asarray(mileages, dtype=np.float64), 0, None)
+    age = np.clip(reference_year - years, 0, None)
+    return np.column_stack([age, age ** 2, np.log1p(mileages), mileages / np.maximum(age, 1) / 1e4])
+
+class RidgePriceModel:
+    def __init__(self, brands, models, weights, mean, std, residual_std, reference_year):
+        self.brands = list(brands)
+        self.models = list(models)
+        self.brand_index = {b: i + 1 for i, b in enumerate(self.brands)}
+        self.model_index = {m: i + 1 for i, m in enumerate(self.models)}
+        self.weights = weights
+        self.mean = mean
+        self.std = std
+        self.residual_std = float(residual_std)
+        self.reference_year = int(reference_year)
+        nb, nm = len(self.brands) + 1, len(self.models) + 1
+        self._brand_slice = slice(1, 1 + nb)
+        self._model_slice = slice(1 + nb, 1 + nb + nm)
+        self._numeric_slice = slice(1 + nb + nm, None)
+
+    def _indices(self, brands, models):
+        brand_keys = [normalize(b) for b in brands]
+        brand_idx = np.fromiter((self.brand_index.get(b, 0) for b in brand_keys), dtype=np.int64, count=len(brand_keys))
+        model_idx = np.fromiter(
+            (self.model_index.get(f"{b}|{normalize(m)}", 0) for b, m in zip(brand_keys, models)),
+            dtype=np.int64, count=len(brand_keys)
+        )
+        return brand_idx, model_idx
+
+    def predict_log(self, brands, models, years, mileages):
+        brand_idx, model_idx = self._indices(brands, models)
+        numeric = (numeric_features(years, mileages, self.reference_year) - self.mean) / self.std
+        w = self.weights
+        return w[0] + w[self._brand_slice][brand_idx] + w[self._model_slice][model_idx] + numeric @ w[self._numeric_slice]
+
+    def predict(self, brands, models, years, mileages):
+        log_price = self.predict_log(brands, models, years, mileages)
+        spread = INTERVAL_Z * self.residual_std
+        return np.exp(log_price), np.exp(log_price - spread), np.exp(log_price + spread)
+
+    @staticmethod
+    def _vocabulary(keys):
+        values, counts = np.unique(np.asarray(keys, dtype=object), return_counts=True)
+        return sorted(v for v, c in zip(values, counts) if c >= MIN_CATEGORY_COUNT)
+
+    @classmethod
+    def fit(cls, brands, models, years, mileages, prices, sample_weight=None, alpha=1.0, reference_year=None):
+        brand_keys = [normalize(b) for b in brands]
+        model_keys = [f"{b}|{normalize(m)}" for b, m in zip(brand_keys, models)]
+        years = np.asarray(years, dtype=np.float64)
+        reference_year = int(reference_year or years.max())
+        numeric = numeric_features(years, mileages, reference_year)
+        mean, std = numeric.mean(axis=0), numeric.std(axis=0)
+        std[std == 0] = 1.0
+        numeric = (numeric - mean) / std
+        target = np.log(np.asarray(prices, dtype=np.float64))
+        weight = np.ones(len(target)) if sample_weight is None else np.asarray(sample_weight, dtype=np.float64)
+
+        model = cls(cls._vocabulary(brand_keys), cls._vocabulary(model_keys), None, mean, std, 0.0, reference_year)
+        brand_idx, model_idx = model._indices(brands, models)
+        width = 1 + len(model.brands) + 1 + len(model.models) + 1 + numeric.shape[1]
+        gram, moment = np.zeros((width, width)), np.zeros(width)
+        for start in range(0, len(target), DESIGN_CHUNK_ROWS):
+            rows = slice(start, start + DESIGN_CHUNK_ROWS)
+            design = model._design(brand_idx[rows], model_idx[rows], numeric[rows], width)
+            weighted = design * weight[rows, None]
+            gram += design.T @ weighted
+            moment += weighted.T @ target[rows]
+        penalty = np.full(width, alpha)
+        penalty[0] = 0.0
+        model.weights = np.linalg.solve(gram + np.diag(penalty), moment)
+
+        residuals = target - model.weights[0] - model.weights[model._brand_slice][brand_idx] \
+            - model.weights[model._model_slice][model_idx] - numeric @ model.weights[model._numeric_slice]
+        model.residual_std = float(np.sqrt(np.average(residuals ** 2, weights=weight)))
+        return model
+
+    def _design(self, brand_idx, model_idx, numeric, width):
+        design = np.zeros((len(brand_idx), width))
+        rows = np.arange(len(brand_idx))
+        design[:, 0] = 1.0
+        design[rows, self._brand_slice.start + brand_idx] = 1.0
+        design[rows, self._model_slice.start + model_idx] = 1.0
+        design[:, self._numeric_slice] = numeric
+        return design
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "weights.npy"), self.weights)
+        np.save(os.path.join(path, "mean.npy"), self.mean)
+        np.save(os.path.join(path, "std.npy"), self.std)
+        with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({
+                "brands": self.brands,
+                "models": self.models,
+                "residual_std": self.residual_std,
+                "reference_year": self.reference_year
+            }, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path):
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        return cls(
+            meta["brands"], meta["models"],
+            np.load(os.path.join(path, "weights.npy"), mmap_mode="r"),
+            np.load(os.path.join(path, "mean.npy")),
+            np.load(os.path.join(path, "std.npy")),
+            meta["residual_std"], meta["reference_year"]
+        )
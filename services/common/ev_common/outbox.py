@@ -0,0 +1,105 @@
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime, timedelta, timezone
+import redis
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+STREAM_PREFIX = "events:"
+STREAM_MAXLEN = int(os.getenv("OUTBOX_STREAM_MAXLEN", 1000000))
+RELAY_BATCH_SIZE = int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", 500))
+RELAY_POLL_INTERVAL = float(os.getenv("OUTBOX_RELAY_POLL_INTERVAL", 0.5))
+PUBLISHED_RETENTION_HOURS = int(os.getenv("OUTBOX_RETENTION_HOURS", 72))
+
+def outbox_event_model(db):
+    class OutboxEvent(db.Model):
+        __tablename__ = 'outbox_events'
+        __table_args__ = (
+            db.Index('ix_outbox_events_unpublished', 'event_id', postgresql_where=db.text("published_at IS NULL")),
+        )
+
+        event_id = db.Column(db.BigInteger, primary_key=True)
+        aggregate = db.Column(db.String(50), nullable=False)
+        aggregate_id = db.Column(db.String(64), nullable=False)
+        event_type = db.Column(db.String(100), nullable=False)
+        payload = db.Column(JSONB, nullable=False)
+        created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+        published_at = db.Column(db.DateTime, nullable=True)
+
+        def __repr__(self):
+            return f"<OutboxEvent {self.event_id} {self.event_type} {self.aggregate_id}>"
+
+    return OutboxEvent
+
+class Outbox:
+    def __init__(self, db, r, model):
+        self.db = db
+        self.r = r
+        self.model = model
+
+    def record(self, aggregate, event_type, aggregate_id, payload):
+        self.record_many(aggregate, event_type, [(aggregate_id, payload)])
+
+    def record_many(self, aggregate, event_type, items):
+        now = datetime.now(timezone.utc)
+        rows = [{
+            "aggregate": aggregate,
+            "aggregate_id": str(aggregate_id),
+            "event_type": f"{aggregate}.{event_type}",
+            "payload": payload,
+            "created_at": now
+        } for aggregate_id, payload in items]
+        if rows:
+            self.db.session.execute(insert(self.model).values(rows))
+
+    def relay_batch(self, batch_size=RELAY_BATCH_SIZE):
+        events = (
+            self.model.query
+            .filter(self.model.published_at.is_(None))
+            .order_by(self.model.event_id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        if not events:
+            self.db.session.rollback()
+            return 0
+        pipe = self.r.pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(f"{STREAM_PREFIX}{event.aggregate}", {
+                "event_id": event.event_id,
+                "type": event.event_type,
+                "aggregate_id": event.aggregate_id,
+                "payload": json.dumps(event.payload, ensure_ascii=False, default=str),
+                "occurred_at": event.created_at.isoformat()
+            }, maxlen=STREAM_MAXLEN, approximate=True)
+        pipe.execute()
+        published_at = datetime.now(timezone.utc)
+        for event in events:
+            event.published_at = published_at
+        self.db.session.commit()
+        return len(events)
+
+    def run_relay(self, batch_size=RELAY_BATCH_SIZE, poll_interval=RELAY_POLL_INTERVAL):
+        while True:
+            try:
+                published = self.relay_batch(batch_size)
+            except redis.exceptions.RedisError as e:
+                self.db.session.rollback()
+                logger.error(f"Outbox relay could not publish to Redis: {e}")
+                time.sleep(poll_interval * 10)
+                continue
+            if published < batch_size:
+                time.sleep(poll_interval)
+
+    def purge_published(self, retention_hours=PUBLISHED_RETENTION_HOURS):
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=retention_hours)
+        deleted = self.model.query.filter(
+            self.model.published_at.isnot(None), self.model.published_at < cutoff
+        ).delete(synchronize_session=False)
+        self.db.session.commit()
+        return deleted
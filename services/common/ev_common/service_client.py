@@ -0,0 +1,160 @@
+from flask import current_app, has_app_context
+from requests.adapters import HTTPAdapter
+import requests
+import bisect
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT = float(os.getenv("SERVICE_CLIENT_CONNECT_TIMEOUT", 0.5))
+READ_TIMEOUT = float(os.getenv("SERVICE_CLIENT_READ_TIMEOUT", 3))
+POOL_SIZE = int(os.getenv("SERVICE_CLIENT_POOL_SIZE", 20))
+FAILURE_THRESHOLD = int(os.getenv("SERVICE_CLIENT_FAILURE_THRESHOLD", 5))
+RESET_TIMEOUT = float(os.getenv("SERVICE_CLIENT_RESET_TIMEOUT", 30))
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    pass
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self._lock = threading.Lock()
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+    def allow(self):
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self.probing:
+                self.probing = True
+                return True
+            return False
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+    def release_probe(self):
+        with self._lock:
+            self.probing = False
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.probing = False
+
+class LatencyHistogram:
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self._lock = threading.Lock()
+    def observe(self, elapsed_ms):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, elapsed_ms)] += 1
+            self.total += 1
+            self.sum_ms += elapsed_ms
+    def snapshot(self):
+        with self._lock:
+            labels = [f"le_{b}ms" for b in self.buckets] + ["le_inf"]
+            cumulative, running = {}, 0
+            for label, count in zip(labels, self.counts):
+                running += count
+                cumulative[label] = running
+            return {
+                "count": self.total,
+                "avg_ms": round(self.sum_ms / self.total, 2) if self.total else None,
+                "buckets": cumulative
+            }
+
+class ServiceClient:
+    def __init__(self, name, base_url, connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT,
+                 pool_size=POOL_SIZE, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.latency = LatencyHistogram()
+        self.errors = 0
+        self.rejected = 0
+
+    def request(self, method, path, **kwargs):
+        if not self.breaker.allow():
+            self.rejected += 1
+            raise CircuitOpenError(f"Circuit open for {self.name}")
+        headers = kwargs.pop("headers", None) or {}
+        if has_app_context() and current_app.config.get('INTERNAL_SERVICE_TOKEN'):
+            headers.setdefault('X-Internal-Token', current_app.config['INTERNAL_SERVICE_TOKEN'])
+        kwargs.setdefault("timeout", self.timeout)
+        started = time.perf_counter()
+        healthy = None
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", headers=headers, **kwargs)
+            healthy = response.status_code < 500
+        except requests.exceptions.RequestException:
+            healthy = False
+            raise
+        finally:
+            self.latency.observe((time.perf_counter() - started) * 1000)
+            if healthy is None:
+                self.breaker.release_probe()
+            elif healthy:
+                self.breaker.record_success()
+            else:
+                self.errors += 1
+                self.breaker.record_failure()
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def stats(self):
+        return {
+            "base_url": self.base_url,
+            "circuit": self.breaker.state,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "latency": self.latency.snapshot()
+        }
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+def get_client(name, base_url, **kwargs):
+    with _clients_lock:
+        client = _clients.get(name)
+        if client is None:
+            client = ServiceClient(name, base_url, **kwargs)
+            _clients[name] = client
+        return client
+
+def all_stats():
+    with _clients_lock:
+        clients = list(_clients.values())
+    return {client.name: client.stats() for client in clients}
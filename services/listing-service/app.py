@@ -1,5 +1,5 @@
 import os
-from flask import Flask
+from flask import Flask, send_from_directory
 from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
@@ -9,14 +9,34 @@ import redis
 import click
 from models.listing import Listing
 from models.listing_image import ListingImage
+from models.listing_image_variant import ListingImageVariant
 from models.watchlist import WatchList
+from models.vehicle_snapshot import VehicleSnapshot
+from models.outbox_event import OutboxEvent
+from models.notification import Notification
+from models.listing_stats import ListingStats
 from services.listingService import ListingService
 from controllers.controller_api import api_bp
+from clients.vehicle_client import iter_all_vehicles
+from controllers.internal_controller import internal_bp
+from services.vehicleSnapshotService import VehicleSnapshotService
+from services.eventConsumer import EventConsumer
+from services.notificationService import NotificationService, DELIVERY_BATCH_SIZE
+from services.counterService import CounterService, FLUSH_INTERVAL
+from services.imageService import ImageService, image_queue
+from services.jobQueue import JobWorker
+from services.bulkJobService import BulkJobService, bulk_queue
+from services.benchmarkService import BenchmarkService
+from services.explainService import ExplainService
+from services.listingImportService import ListingImportService
+from services.outboxService import OutboxService, RELAY_BATCH_SIZE, PUBLISHED_RETENTION_HOURS
+import sys
 
 load_dotenv()
 db = SQLAlchemy()
 jwt = JWTManager()
 migrate = Migrate(version_table = 'alembic_version_listing')
+r = redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379"), decode_responses = True)
 
 def create_app():
     app = Flask(__name__)
@@ -33,5 +53,111 @@ def create_app():
     jwt.init_app(app)
     
     app.register_blueprint(api_bp)
+    app.register_blueprint(internal_bp)
+
+    @app.route('/uploads/<path:filename>')
+    def uploaded_file(filename):
+        response = send_from_directory(os.path.abspath(app.config['UPLOAD_FOLDER']), filename)
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        return response
+
+    @app.cli.command("outbox-relay")
+    @click.option("--batch-size", default=RELAY_BATCH_SIZE)
+    @click.option("--once", is_flag=True)
+    def outbox_relay_command(batch_size, once):
+        if once:
+            print(f"Đã phát {OutboxService.relay_batch(batch_size)} sự kiện.")
+            return
+        OutboxService.run_relay(batch_size)
+
+    @app.cli.command("purge-outbox")
+    @click.option("--retention-hours", default=PUBLISHED_RETENTION_HOURS)
+    def purge_outbox_command(retention_hours):
+        print(f"Đã xóa {OutboxService.purge_published(retention_hours)} sự kiện đã phát.")
+
+    @app.cli.command("consume-events")
+    @click.option("--consumer", default=None)
+    def consume_events_command(consumer):
+        EventConsumer({
+            "events:vehicle": VehicleSnapshotService.apply_vehicle_events,
+            "events:listing": NotificationService.collect_listing_events
+        }, consumer=consumer).run()
+
+    @app.cli.command("deliver-notifications")
+    @click.option("--batch-size", default=DELIVERY_BATCH_SIZE)
+    @click.option("--once", is_flag=True)
+    def deliver_notifications_command(batch_size, once):
+        if once:
+            print(f"Đã gửi {NotificationService.deliver_due(batch_size)} thông báo.")
+            return
+        NotificationService.run(batch_size)
+
+    @app.cli.command("image-worker")
+    @click.option("--worker-id", default=None)
+    def image_worker_command(worker_id):
+        JobWorker(image_queue, ImageService.process_variants, worker_id).run_forever()
+
+    @app.cli.command("bulk-worker")
+    @click.option("--worker-id", default=None)
+    def bulk_worker_command(worker_id):
+        JobWorker(bulk_queue, BulkJobService.handler(ListingService.bulk_moderate_chunk), worker_id).run_forever()
+
+    @app.cli.command("flush-counters")
+    @click.option("--interval", default=FLUSH_INTERVAL)
+    @click.option("--once", is_flag=True)
+    def flush_counters_command(interval, once):
+        if once:
+            print(f"Đã ghi bộ đếm của {CounterService.flush()} tin đăng.")
+            return
+        CounterService.run(interval)
+
+    @app.cli.command("sync-vehicle-snapshots")
+    @click.option("--batch-size", default=1000)
+    def sync_vehicle_snapshots_command(batch_size):
+        total = 0
+        for vehicles in iter_all_vehicles(batch_size):
+            count, _ = VehicleSnapshotService.upsert_snapshots(vehicles)
+            total += count
+        print(f"Đã đồng bộ {total} xe vào listing-db.")
+
+    @app.cli.command("import-listings")
+    @click.argument("path", type=click.Path(exists=True, dir_okay=False))
+    def import_listings_command(path):
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            if path.endswith(".csv"):
+                rows = ListingImportService.parse_csv(f)
+            else:
+                rows = ListingImportService.parse_ndjson(f)
+            report = ListingImportService.import_rows(rows)
+        for error in report["errors"][:50]:
+            print(f"Dòng {error['row']}: {error['error']}")
+        print(f"Đã nhập {report['created']}/{report['processed']} tin đăng, {report['failed']} lỗi, "
+              f"{report['elapsed_seconds']}s ({report['rows_per_second']} dòng/giây).")
+
+    @app.cli.command("bench-search")
+    @click.option("--sizes", default="100000,1000000")
+    @click.option("--term", "terms", multiple=True, default=["toyota vios", "chinh chu", "bao duong"])
+    @click.option("--runs", default=20)
+    def bench_search_command(sizes, terms, runs):
+        results = BenchmarkService.search_latency([int(s) for s in sizes.split(",")], terms, runs)
+        print(f"{'rows':>9}  {'term':<16}{'ilike p50':>11}{'ilike p95':>11}{'fts p50':>11}{'fts p95':>11}")
+        for row in results:
+            print(f"{row['rows']:>9}  {row['term']:<16}{row['ilike_p50_ms']:>9.2f}ms{row['ilike_p95_ms']:>9.2f}ms"
+                  f"{row['fts_p50_ms']:>9.2f}ms{row['fts_p95_ms']:>9.2f}ms")
+
+    @app.cli.command("explain-hot-queries")
+    @click.option("--analyze", is_flag=True)
+    @click.option("--verbose", is_flag=True)
+    def explain_hot_queries_command(analyze, verbose):
+        failed = False
+        for result in ExplainService.explain_all(analyze):
+            status = "OK" if not result["seq_scans"] else "SEQ SCAN on " + ", ".join(result["seq_scans"])
+            failed = failed or bool(result["seq_scans"])
+            print(f"[{status}] {result['name']}")
+            if verbose or result["seq_scans"]:
+                for line in result["plan"]:
+                    print(f"    {line}")
+        if failed:
+            sys.exit(1)
     
     return app
\ No newline at end of file
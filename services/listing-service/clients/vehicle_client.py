@@ -0,0 +1,44 @@
+from ev_common.service_client import get_client
+import requests
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+VEHICLE_SERVICE_URL = os.environ.get('VEHICLE_SERVICE_URL', 'http://vehicle-service:5002')
+VEHICLE_BULK_CHUNK = 500
+
+def vehicle_client():
+    return get_client("vehicle-service", VEHICLE_SERVICE_URL)
+
+def get_vehicles_by_ids(vehicle_ids):
+    vehicle_ids = sorted({int(v) for v in vehicle_ids if v})
+    if not vehicle_ids: return {}
+    vehicles = {}
+    for start in range(0, len(vehicle_ids), VEHICLE_BULK_CHUNK):
+        chunk = vehicle_ids[start:start + VEHICLE_BULK_CHUNK]
+        try:
+            response = vehicle_client().post("/internal/vehicles/bulk", json={"vehicle_ids": chunk})
+            if response.status_code == 200:
+                for vehicle in response.json().get("vehicles", []):
+                    vehicles[vehicle['vehicle_id']] = vehicle
+            else:
+                logger.warning(f"Vehicle Service returned status {response.status_code} for {len(chunk)} vehicle IDs")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to fetch vehicle details from Vehicle Service: {e}")
+    return vehicles
+
+def iter_all_vehicles(batch_size=1000):
+    after_id = 0
+    while True:
+        response = vehicle_client().get(
+            "/internal/vehicles",
+            params={"after_id": after_id, "limit": batch_size},
+            timeout=(1, 30)
+        )
+        response.raise_for_status()
+        vehicles = response.json().get("vehicles", [])
+        if not vehicles:
+            return
+        yield vehicles
+        after_id = vehicles[-1]['vehicle_id']
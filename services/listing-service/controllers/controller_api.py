@@ -1,23 +1,25 @@
-from flask import Blueprint, jsonify, request
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
-from services.listingService import ListingService  
-from models.listing import Listing
-from models.listing_image import ListingImage
-from models.watchlist import WatchList
+from flask import Blueprint, jsonify, request, current_app, Response, stream_with_context
+from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt, verify_jwt_in_request
+from services.listingService import ListingService, BULK_TRANSITIONS
+from services.bulkJobService import BulkJobService, BULK_SYNC_LIMIT, parse_ids
+from services.cacheService import CacheService, COMPARE_CACHE_TTL
+from services.vehicleSnapshotService import VehicleSnapshotService
+from services.listingImportService import ListingImportService
+from services.imageService import ImageService
+from services.notificationService import NotificationService, serialize_notification
+from services.counterService import CounterService
+import io
 from functools import wraps
-from dateutil import parser
-import requests  
-import logging   
-import os
-import sys
-import traceback
-import pytz
+import redis
+import json
+import logging
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 logger = logging.getLogger(__name__)
 
-VEHICLE_SERVICE_URL = os.environ.get('VEHICLE_SERVICE_URL', 'http://vehicle-service:5001')
-REQUEST_TIMEOUT = 1
+TRENDING_DEFAULT_LIMIT = 20
+TRENDING_MAX_LIMIT = 50
+
 
 def admin_required():
     def wrapper(fn):
@@ -34,40 +36,35 @@ def role_required():
     def wrapper(fn):
         @wraps(fn)
         def decorator(*args, **kwargs):
+            verify_jwt_in_request()
             claims = get_jwt()
-            if claims.get("role") != "Admin" or claims.get("role") != "Staff":
+            if claims.get("role") not in ("Admin", "Staff"):
                 return jsonify({"error": "Admin or Staff access required"}), 403
             return fn(*args, **kwargs)
         return decorator
     return wrapper
-def get_and_serialize_vehicle_by_id(vehicle_id: int): 
-    if not vehicle_id: return None 
-    url = f"{VEHICLE_SERVICE_URL}/api/vehicle/{vehicle_id}" 
-    try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        if response.status_code == 200: 
-            return response.json() 
-        else: 
-            logger.warning(f"Listing Service returned status {response.status_code} for vehicle ID {vehicle_id} at {url}")
-            return None
-    except requests.exceptions.RequestException as e: 
-         logger.error(f"Failed to connect to Listing Service at {url} for vehicle details: {e}")
-         return None
-def serialize_listing(listing):
+def serialize_listing(listing, vehicles=None):
     if not listing: return None
     data = {
     'listing_id': listing.listing_id,
-    'listing_type': listing.listing_type,
+    'listing_type': getattr(listing, 'listing_type', None),
     'title': listing.title,
     'description': listing.description,
     'price': str(listing.price),
     'status': listing.status,
     'created_at': listing.created_at.isoformat() if listing.created_at else None,
-    'images': [img.image_url for img in listing.images] if hasattr(listing, 'images') and listing.images else []
+    'images': [img.image_url for img in listing.images] if hasattr(listing, 'images') and listing.images else [],
+    'thumbnails': [img.variant_url('thumb') for img in listing.images] if hasattr(listing, 'images') and listing.images else []
     }
     if hasattr(listing, 'vehicle_id'):
-        data['vehicle_details'] = get_and_serialize_vehicle_by_id(listing.vehicle_id)
+        if vehicles is None:
+            vehicles = VehicleSnapshotService.get_vehicles([listing.vehicle_id])
+        data['vehicle_details'] = vehicles.get(listing.vehicle_id)
     return data
+def serialize_listings(listings):
+    listings = [l for l in listings if l]
+    vehicles = VehicleSnapshotService.get_vehicles(l.vehicle_id for l in listings)
+    return [serialize_listing(l, vehicles) for l in listings]
 
 @api_bp.route("/watch-list", methods=['POST'])
 @jwt_required()
@@ -84,27 +81,53 @@ def add_to_watchlist():
 @jwt_required()
 def my_watchlist():
     current_user_id = int(get_jwt_identity())
-    watchlists = ListingService.get_watchlist(current_user_id)
-    return jsonify([serialize_listing(w) for w in watchlists]), 200
+    listings, next_cursor = ListingService.get_watchlist(
+        current_user_id,
+        request.args.get("cursor", type=int),
+        request.args.get("limit", type=int)
+    )
+    return jsonify({"items": serialize_listings(listings), "next_cursor": next_cursor}), 200
 
 @api_bp.route("/watch-list/by-listing/<int:listing_id>", methods=['DELETE'])
 @jwt_required()
 def delete_watchlist_by_listing(listing_id):
     current_user_id = int(get_jwt_identity())
-    success, message = ListingService.remove_from_watchlist_by_user(current_user_id, listing_id)
+    success, message = ListingService.remove_from_watchlist(current_user_id, listing_id)
     
     if not success:
         return jsonify({"message": message}), 404
     return jsonify({"message": "Đã xóa khỏi danh sách theo dõi"}), 200
 
-@api_bp.route('/listings', methods=['GET'])
-def search_listings():
-    listings = ListingService.get_all_listings() 
-    return jsonify([serialize_listing(l) for l in listings]), 200
+@api_bp.route("/notifications", methods=['GET'])
+@jwt_required()
+def my_notifications():
+    current_user_id = int(get_jwt_identity())
+    notifications, next_cursor = NotificationService.get_notifications(
+        current_user_id,
+        request.args.get("cursor", type=int),
+        request.args.get("limit", type=int),
+        request.args.get("unread", "").lower() in ("1", "true")
+    )
+    return jsonify({"items": [serialize_notification(n) for n in notifications], "next_cursor": next_cursor}), 200
 
-@api_bp.route('/listings/filter', methods=['GET'])
-def filter_listings():
-    filters = {
+@api_bp.route("/notifications/read", methods=['POST'])
+@jwt_required()
+def mark_notifications_read():
+    current_user_id = int(get_jwt_identity())
+    data = request.get_json(silent=True) or {}
+    notification_ids = data.get("notification_ids")
+    if notification_ids is not None:
+        if not isinstance(notification_ids, list):
+            return jsonify({"error": "notification_ids must be a list"}), 400
+        try:
+            notification_ids = [int(n) for n in notification_ids]
+        except (TypeError, ValueError):
+            return jsonify({"error": "notification_ids must contain integers"}), 400
+    updated = NotificationService.mark_read(current_user_id, notification_ids)
+    return jsonify({"updated": updated}), 200
+
+def listing_filters_from_args():
+    return {
         "title": request.args.get("title"),
         "min_price": request.args.get("min_price"),
         "max_price": request.args.get("max_price"),
@@ -115,18 +138,90 @@ def filter_listings():
         "mileage_min": request.args.get("mileage_min"),
         "mileage_max": request.args.get("mileage_max"),
     }
+
+def listing_page_payload(filters, cursor, limit):
+    listings, next_cursor = ListingService.filter_listings(filters, cursor, limit)
+    return {"items": serialize_listings(listings), "next_cursor": next_cursor}
+
+def listing_page_response(filters, cache=False):
+    cursor = request.args.get("cursor")
+    limit = request.args.get("limit", type=int)
+    if request.args.get("format") == "ndjson":
+        if cursor:
+            ListingService.decode_cursor(cursor)
+        def generate():
+            for batch in ListingService.iter_listings(filters, cursor):
+                for item in serialize_listings(batch):
+                    yield json.dumps(item, ensure_ascii=False) + "\n"
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+    if cache:
+        payload = CacheService.get_or_set(
+            ("page", cursor or "", limit or ""),
+            lambda: listing_page_payload(filters, cursor, limit)
+        )
+    else:
+        payload = listing_page_payload(filters, cursor, limit)
+    return jsonify(payload), 200
+
+@api_bp.route('/listings', methods=['GET'])
+def search_listings():
+    try:
+        return listing_page_response({}, cache=True)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+@api_bp.route('/listings/filter', methods=['GET'])
+def filter_listings():
     try:
-        listings = ListingService.filter_listings(filters)
-        return jsonify([serialize_listing(l) for l in listings]), 200
+        return listing_page_response(listing_filters_from_args())
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        print("❌ Lỗi khi lọc listings:", e)
+        logger.error(f"Failed to filter listings: {e}", exc_info=True)
         return jsonify({"error": "Lỗi khi lọc dữ liệu", "message": str(e)}), 500
 
+@api_bp.route('/listings/search', methods=['GET'])
+def full_text_search():
+    try:
+        listings, next_cursor = ListingService.search_listings(
+            request.args.get("q"),
+            listing_filters_from_args(),
+            request.args.get("cursor"),
+            request.args.get("limit", type=int)
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"items": serialize_listings(listings), "next_cursor": next_cursor}), 200
+
+@api_bp.route('/listings/trending', methods=['GET'])
+def trending_listings():
+    limit = max(1, min(request.args.get("limit", TRENDING_DEFAULT_LIMIT, type=int), TRENDING_MAX_LIMIT))
+    try:
+        listing_ids = CounterService.trending_ids(limit * 2)
+    except redis.exceptions.RedisError as e:
+        logger.warning(f"Trending feed unavailable: {e}")
+        return jsonify({"error": "Trending feed unavailable"}), 503
+    items = []
+    for listing_id in listing_ids:
+        data = CacheService.get_or_set_listing(
+            listing_id,
+            lambda listing_id=listing_id: serialize_listing(ListingService.get_listing_by_id(listing_id))
+        )
+        if data and data.get("status") == "available":
+            items.append(data)
+            if len(items) == limit:
+                break
+    return jsonify({"items": items}), 200
+
 @api_bp.route('/listings/<int:listing_id>', methods=['GET'])
 def get_listing_details(listing_id):
-    listing = ListingService.get_listing_by_id(listing_id)
-    if not listing: return jsonify({"error": "Listing not found"}), 404
-    return jsonify(serialize_listing(listing)), 200
+    data = CacheService.get_or_set_listing(
+        listing_id,
+        lambda: serialize_listing(ListingService.get_listing_by_id(listing_id))
+    )
+    if not data: return jsonify({"error": "Listing not found"}), 404
+    CounterService.record_view(listing_id)
+    return jsonify(data), 200
 
 @api_bp.route('/listings/<int:listing_id>', methods=['PUT'])
 @jwt_required()
@@ -139,6 +234,31 @@ def update_listing(listing_id):
         return jsonify({"error": message}), 403
     return jsonify({"message": message, "listing": serialize_listing(listing)}), 200
 
+@api_bp.route('/listings/<int:listing_id>/images', methods=['POST'])
+@jwt_required()
+@role_required()
+def upload_listing_image(listing_id):
+    image, message = ImageService.upload_listing_image(
+        listing_id, request.stream, request.mimetype, current_app.config['UPLOAD_FOLDER']
+    )
+    if not image:
+        return jsonify({"error": message}), 404 if message == "Listing not found." else 400
+    return jsonify({
+        "message": message,
+        "image": {
+            "image_id": image.image_id,
+            "image_url": image.image_url,
+            "status": "ready" if image.variants else "processing",
+            "variants": [{
+                "name": v.name,
+                "format": v.format,
+                "width": v.width,
+                "height": v.height,
+                "url": v.url
+            } for v in image.variants]
+        }
+    }), 200 if image.variants else 202
+
 @api_bp.route('/compare', methods=['GET'])
 def compare_listings():
     listing_ids = request.args.getlist('id', type=int)  
@@ -152,18 +272,65 @@ def compare_listings():
     if len(listing_ids) > 4:  
         return jsonify({"error": "Chỉ có thể so sánh tối đa 4 sản phẩm."}), 400
  
-    comparison_type, data, message = ListingService.get_comparison_data(listing_ids)
+    compare_ids = sorted(set(listing_ids))
+    errors = {}
+    def load():
+        data, message = ListingService.get_comparison_data(compare_ids)
+        if not data:
+            errors["message"] = message
+            return None
+        return {"message": message, "items": data}
 
-    if not comparison_type: 
-        return jsonify({"error": message}), 400 
-    
+    payload = CacheService.get_or_set(("compare", ",".join(str(i) for i in compare_ids)), load, COMPARE_CACHE_TTL)
+    if not payload:
+        return jsonify({"error": errors.get("message")}), 400
+
+    items_by_id = {item['listing_id']: item for item in payload["items"]}
     return jsonify({
-        "message": message,
-        "items": data 
+        "message": payload["message"],
+        "items": [items_by_id[i] for i in dict.fromkeys(listing_ids) if i in items_by_id]
     }), 200
 
+@api_bp.route('/listings/import', methods=['POST'])
+@admin_required()
+def import_listings():
+    if request.mimetype == "text/csv":
+        rows = ListingImportService.parse_csv(io.TextIOWrapper(request.stream, encoding="utf-8-sig", newline=""))
+    elif request.mimetype in ("application/x-ndjson", "application/jsonl"):
+        rows = ListingImportService.parse_ndjson(request.stream)
+    else:
+        return jsonify({"error": "Body must be application/x-ndjson or text/csv"}), 415
+    report = ListingImportService.import_rows(rows)
+    return jsonify(report), 200
 
+@api_bp.route('/admin/listings/bulk', methods=['POST'])
+@admin_required()
+def bulk_moderate_listings():
+    data = request.get_json(silent=True) or {}
+    action = data.get("action")
+    if action not in BULK_TRANSITIONS:
+        return jsonify({"error": f"action must be one of: {', '.join(BULK_TRANSITIONS)}"}), 400
+    try:
+        listing_ids = parse_ids(data.get("listing_ids"), "listing_ids")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if data.get("async") or len(listing_ids) > BULK_SYNC_LIMIT:
+        job_id = BulkJobService.submit("listings", action, listing_ids)
+        return jsonify({"job_id": job_id, "status": "queued", "total": len(listing_ids)}), 202
+    return jsonify(BulkJobService.run_sync(action, listing_ids, ListingService.bulk_moderate_chunk)), 200
 
+@api_bp.route('/admin/jobs/<job_id>', methods=['GET'])
+@admin_required()
+def get_bulk_job(job_id):
+    job = BulkJobService.get(job_id)
+    if not job:
+        return jsonify({"error": "Job not found or expired"}), 404
+    return jsonify(job), 200
 
-
-
+@api_bp.route('/cache/stats', methods=['GET'])
+@admin_required()
+def cache_stats():
+    stats = CacheService.stats()
+    if stats is None:
+        return jsonify({"error": "Cache unavailable"}), 503
+    return jsonify(stats), 200
@@ -0,0 +1,72 @@
+from flask import Blueprint, jsonify, request, current_app
+from functools import wraps
+from services.listingService import ListingService
+from ev_common.service_client import all_stats
+
+internal_bp = Blueprint('internal', __name__, url_prefix='/internal')
+
+MAX_EXPORT_ROWS = 5000
+
+def internal_required():
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            token = current_app.config.get('INTERNAL_SERVICE_TOKEN')
+            if not token or request.headers.get('X-Internal-Token') != token:
+                return jsonify({"error": "Internal access required"}), 403
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
+
+def transaction_id_from_body():
+    data = request.get_json(silent=True) or {}
+    try:
+        return int(data.get("transaction_id"))
+    except (TypeError, ValueError):
+        return None
+
+@internal_bp.route('/listings/<int:listing_id>/reserve', methods=['POST'])
+@internal_required()
+def reserve_listing(listing_id):
+    transaction_id = transaction_id_from_body()
+    if transaction_id is None:
+        return jsonify({"error": "transaction_id must be an integer"}), 400
+    listing, message = ListingService.reserve_listing(listing_id, transaction_id)
+    if not listing:
+        return jsonify({"error": message}), 404 if message == "Listing not found." else 409
+    return jsonify({"message": message, "listing": listing}), 200
+
+@internal_bp.route('/listings/<int:listing_id>/release', methods=['POST'])
+@internal_required()
+def release_listing(listing_id):
+    transaction_id = transaction_id_from_body()
+    if transaction_id is None:
+        return jsonify({"error": "transaction_id must be an integer"}), 400
+    released, message = ListingService.release_listing(listing_id, transaction_id)
+    return jsonify({"message": message, "released": released}), 200
+
+@internal_bp.route('/listings/training-data', methods=['GET'])
+@internal_required()
+def export_training_data():
+    after_id = request.args.get("after_id", 0, type=int)
+    limit = min(request.args.get("limit", MAX_EXPORT_ROWS, type=int), MAX_EXPORT_ROWS)
+    rows = ListingService.export_training_rows(after_id, limit)
+    return jsonify({"rows": [{
+        "listing_id": row.listing_id,
+        "price": float(row.price),
+        "status": row.status,
+        "brand": row.brand,
+        "model": row.model,
+        "year": row.year,
+        "mileage": row.mileage
+    } for row in rows]}), 200
+
+@internal_bp.route('/stats', methods=['GET'])
+@internal_required()
+def stats():
+    return jsonify(ListingService.stats()), 200
+
+@internal_bp.route('/metrics/service-clients', methods=['GET'])
+@internal_required()
+def service_client_metrics():
+    return jsonify(all_stats()), 200
@@ -0,0 +1,95 @@
+"""initial listing schema
+
+Revision ID: 3f1c2a9d8b10
+Revises: 
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9d8b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('listings',
+    sa.Column('listing_id', sa.Integer(), nullable=False),
+    sa.Column('vehicle_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('price', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('status', sa.Enum('available', 'sold', 'rejected', name='listing_statuses'), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True),
+    sa.PrimaryKeyConstraint('listing_id'),
+    sa.UniqueConstraint('vehicle_id')
+    )
+    op.create_table('listing_images',
+    sa.Column('image_id', sa.Integer(), nullable=False),
+    sa.Column('listing_id', sa.Integer(), nullable=False),
+    sa.Column('image_url', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['listing_id'], ['listings.listing_id'], ),
+    sa.PrimaryKeyConstraint('image_id')
+    )
+    op.create_table('watchlist',
+    sa.Column('watchlist_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('listing_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['listing_id'], ['listings.listing_id'], ),
+    sa.PrimaryKeyConstraint('watchlist_id')
+    )
+    op.create_table('vehicle_snapshots',
+    sa.Column('vehicle_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('brand', sa.String(length=50), nullable=False),
+    sa.Column('model', sa.String(length=50), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('mileage', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('vehicle_id')
+    )
+    op.create_index('ix_vehicle_snapshots_year', 'vehicle_snapshots', ['year'], unique=False)
+    op.create_index('ix_vehicle_snapshots_mileage', 'vehicle_snapshots', ['mileage'], unique=False)
+    op.create_index('ix_vehicle_snapshots_brand_model', 'vehicle_snapshots', [sa.text('lower(brand)'), sa.text('lower(model)')], unique=False)
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text AS $$
+            SELECT public.unaccent('public.unaccent', $1)
+        $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION listings_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('simple', immutable_unaccent(coalesce(NEW.title, ''))), 'A') ||
+                setweight(to_tsvector('simple', immutable_unaccent(coalesce(NEW.description, ''))), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER listings_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF title, description ON listings
+            FOR EACH ROW EXECUTE FUNCTION listings_search_vector_update()
+    """)
+    op.create_index('ix_listings_search_vector', 'listings', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    op.drop_index('ix_listings_search_vector', table_name='listings', postgresql_using='gin')
+    op.execute("DROP TRIGGER IF EXISTS listings_search_vector_trigger ON listings")
+    op.execute("DROP FUNCTION IF EXISTS listings_search_vector_update()")
+    op.execute("DROP FUNCTION IF EXISTS immutable_unaccent(text)")
+    op.drop_index('ix_vehicle_snapshots_brand_model', table_name='vehicle_snapshots')
+    op.drop_index('ix_vehicle_snapshots_mileage', table_name='vehicle_snapshots')
+    op.drop_index('ix_vehicle_snapshots_year', table_name='vehicle_snapshots')
+    op.drop_table('vehicle_snapshots')
+    op.drop_table('watchlist')
+    op.drop_table('listing_images')
+    op.drop_table('listings')
+    sa.Enum(name='listing_statuses').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,41 @@
+"""watchlist notifications
+
+Revision ID: 5c9e1f3a7b62
+Revises: b3d7e92f4c15
+Create Date: 2026-10-18 19:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '5c9e1f3a7b62'
+down_revision = 'b3d7e92f4c15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_watchlist_listing_user', 'watchlist', ['listing_id', 'user_id'], unique=False)
+    op.create_table('notifications',
+    sa.Column('notification_id', sa.BigInteger(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('listing_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=50), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('read_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('notification_id')
+    )
+    op.create_index('ix_notifications_user', 'notifications', ['user_id', 'notification_id'], unique=False)
+    op.create_index('ix_notifications_user_unread', 'notifications', ['user_id'], unique=False,
+                    postgresql_where=sa.text('read_at IS NULL'))
+
+
+def downgrade():
+    op.drop_index('ix_notifications_user_unread', table_name='notifications', postgresql_where=sa.text('read_at IS NULL'))
+    op.drop_index('ix_notifications_user', table_name='notifications')
+    op.drop_table('notifications')
+    op.drop_index('ix_watchlist_listing_user', table_name='watchlist')
@@ -0,0 +1,34 @@
+"""listing stats
+
+Revision ID: 7a2d4c8e1f93
+Revises: 5c9e1f3a7b62
+Create Date: 2026-10-18 20:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a2d4c8e1f93'
+down_revision = '5c9e1f3a7b62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('listing_stats',
+    sa.Column('listing_id', sa.Integer(), nullable=False),
+    sa.Column('view_count', sa.BigInteger(), nullable=False),
+    sa.Column('watch_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('listing_id')
+    )
+    op.execute("""
+        INSERT INTO listing_stats (listing_id, view_count, watch_count, updated_at)
+        SELECT listing_id, 0, COUNT(*), now() FROM watchlist GROUP BY listing_id
+    """)
+
+
+def downgrade():
+    op.drop_table('listing_stats')
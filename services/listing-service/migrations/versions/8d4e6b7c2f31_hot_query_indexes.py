@@ -0,0 +1,35 @@
+"""hot query indexes
+
+Revision ID: 8d4e6b7c2f31
+Revises: 3f1c2a9d8b10
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d4e6b7c2f31'
+down_revision = '3f1c2a9d8b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_listings_available_created', 'listings', ['created_at', 'listing_id'],
+        unique=False, postgresql_where=sa.text("status = 'available'")
+    )
+    op.create_index('ix_listing_images_listing_id', 'listing_images', ['listing_id'], unique=False)
+    op.execute("""
+        DELETE FROM watchlist a USING watchlist b
+        WHERE a.user_id = b.user_id AND a.listing_id = b.listing_id AND a.watchlist_id > b.watchlist_id
+    """)
+    op.create_unique_constraint('uq_watchlist_user_listing', 'watchlist', ['user_id', 'listing_id'])
+
+
+def downgrade():
+    op.drop_constraint('uq_watchlist_user_listing', 'watchlist', type_='unique')
+    op.drop_index('ix_listing_images_listing_id', table_name='listing_images')
+    op.drop_index('ix_listings_available_created', table_name='listings', postgresql_where=sa.text("status = 'available'"))
@@ -0,0 +1,24 @@
+"""listing reserved by
+
+Revision ID: 8e4b2f6d1c37
+Revises: 7a2d4c8e1f93
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4b2f6d1c37'
+down_revision = '7a2d4c8e1f93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('listings', sa.Column('reserved_by', sa.Integer(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('listings', 'reserved_by')
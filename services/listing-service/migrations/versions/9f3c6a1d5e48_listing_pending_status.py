@@ -0,0 +1,29 @@
+"""listing pending status
+
+Revision ID: 9f3c6a1d5e48
+Revises: 8e4b2f6d1c37
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9f3c6a1d5e48'
+down_revision = '8e4b2f6d1c37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE listing_statuses ADD VALUE IF NOT EXISTS 'pending' BEFORE 'available'")
+
+
+def downgrade():
+    op.execute("UPDATE listings SET status = 'rejected' WHERE status = 'pending'")
+    op.execute("ALTER TYPE listing_statuses RENAME TO listing_statuses_old")
+    op.execute("CREATE TYPE listing_statuses AS ENUM ('available', 'sold', 'rejected')")
+    op.execute("ALTER TABLE listings ALTER COLUMN status TYPE listing_statuses USING status::text::listing_statuses")
+    op.execute("DROP TYPE listing_statuses_old")
@@ -0,0 +1,39 @@
+"""listing image variants
+
+Revision ID: a4f8c1e7d253
+Revises: 8d4e6b7c2f31
+Create Date: 2026-10-18 11:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4f8c1e7d253'
+down_revision = '8d4e6b7c2f31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('listing_images', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_listing_images_content_hash', 'listing_images', ['content_hash'], unique=False)
+    op.create_table('listing_image_variants',
+    sa.Column('variant_id', sa.Integer(), nullable=False),
+    sa.Column('image_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=20), nullable=False),
+    sa.Column('format', sa.String(length=10), nullable=False),
+    sa.Column('width', sa.Integer(), nullable=False),
+    sa.Column('height', sa.Integer(), nullable=False),
+    sa.Column('url', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['image_id'], ['listing_images.image_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('variant_id'),
+    sa.UniqueConstraint('image_id', 'name', 'format', name='uq_listing_image_variants_image_name_format')
+    )
+
+
+def downgrade():
+    op.drop_table('listing_image_variants')
+    op.drop_index('ix_listing_images_content_hash', table_name='listing_images')
+    op.drop_column('listing_images', 'content_hash')
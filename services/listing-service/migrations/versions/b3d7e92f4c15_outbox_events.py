@@ -0,0 +1,39 @@
+"""outbox events
+
+Revision ID: b3d7e92f4c15
+Revises: a4f8c1e7d253
+Create Date: 2026-10-18 14:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3d7e92f4c15'
+down_revision = 'a4f8c1e7d253'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('outbox_events',
+    sa.Column('event_id', sa.BigInteger(), nullable=False),
+    sa.Column('aggregate', sa.String(length=50), nullable=False),
+    sa.Column('aggregate_id', sa.String(length=64), nullable=False),
+    sa.Column('event_type', sa.String(length=100), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('published_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('event_id')
+    )
+    op.create_index('ix_outbox_events_unpublished', 'outbox_events', ['event_id'], unique=False,
+                    postgresql_where=sa.text('published_at IS NULL'))
+    op.add_column('vehicle_snapshots', sa.Column('last_event_id', sa.BigInteger(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('vehicle_snapshots', 'last_event_id')
+    op.drop_index('ix_outbox_events_unpublished', table_name='outbox_events', postgresql_where=sa.text('published_at IS NULL'))
+    op.drop_table('outbox_events')
@@ -1,16 +1,23 @@
 from app import db
 from datetime import datetime, timezone
+from sqlalchemy.dialects.postgresql import TSVECTOR
 
 class Listing(db.Model):
     __tablename__ = 'listings'
+    __table_args__ = (
+        db.Index('ix_listings_search_vector', 'search_vector', postgresql_using='gin'),
+        db.Index('ix_listings_available_created', 'created_at', 'listing_id', postgresql_where=db.text("status = 'available'")),
+    )
 
     listing_id = db.Column(db.Integer, primary_key=True)
     vehicle_id = db.Column(db.Integer, nullable=False, unique=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=True)
     price = db.Column(db.Numeric(10, 2), nullable=False)
-    status = db.Column(db.Enum('available', 'sold', 'rejected', name='listing_statuses'), default='pending', nullable=False)
+    status = db.Column(db.Enum('pending', 'available', 'sold', 'rejected', name='listing_statuses'), default='pending', nullable=False)
+    reserved_by = db.Column(db.Integer, nullable=True)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    search_vector = db.deferred(db.Column(TSVECTOR, nullable=True))
      
     images = db.relationship('ListingImage', back_populates='listing', cascade='all, delete-orphan')
     watchlists = db.relationship("WatchList", back_populates="listing", cascade='all, delete-orphan')
@@ -4,10 +4,18 @@ class ListingImage(db.Model):
     __tablename__ = 'listing_images'
 
     image_id = db.Column(db.Integer, primary_key=True)
-    listing_id = db.Column(db.Integer, db.ForeignKey('listings.listing_id'), nullable=False)
+    listing_id = db.Column(db.Integer, db.ForeignKey('listings.listing_id'), nullable=False, index=True)
     image_url = db.Column(db.String(255), nullable=False)
+    content_hash = db.Column(db.String(64), nullable=True, index=True)
      
     listing = db.relationship('Listing', back_populates='images')
+    variants = db.relationship('ListingImageVariant', back_populates='image', cascade='all, delete-orphan')
+
+    def variant_url(self, name, format='webp'):
+        for variant in self.variants:
+            if variant.name == name and variant.format == format:
+                return variant.url
+        return self.image_url
 
     def __repr__(self):
         return f'<ListingImage {self.image_id} for Listing {self.listing_id}>'
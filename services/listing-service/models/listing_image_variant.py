@@ -0,0 +1,20 @@
+from app import db
+
+class ListingImageVariant(db.Model):
+    __tablename__ = 'listing_image_variants'
+    __table_args__ = (
+        db.UniqueConstraint('image_id', 'name', 'format', name='uq_listing_image_variants_image_name_format'),
+    )
+
+    variant_id = db.Column(db.Integer, primary_key=True)
+    image_id = db.Column(db.Integer, db.ForeignKey('listing_images.image_id', ondelete='CASCADE'), nullable=False)
+    name = db.Column(db.String(20), nullable=False)
+    format = db.Column(db.String(10), nullable=False)
+    width = db.Column(db.Integer, nullable=False)
+    height = db.Column(db.Integer, nullable=False)
+    url = db.Column(db.String(255), nullable=False)
+
+    image = db.relationship('ListingImage', back_populates='variants')
+
+    def __repr__(self):
+        return f'<ListingImageVariant {self.name}.{self.format} for Image {self.image_id}>'
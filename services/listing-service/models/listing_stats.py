@@ -0,0 +1,13 @@
+from app import db
+from datetime import datetime, timezone
+
+class ListingStats(db.Model):
+    __tablename__ = 'listing_stats'
+
+    listing_id = db.Column(db.Integer, primary_key=True)
+    view_count = db.Column(db.BigInteger, nullable=False, default=0)
+    watch_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    def __repr__(self):
+        return f"<ListingStats {self.listing_id} views={self.view_count} watches={self.watch_count}>"
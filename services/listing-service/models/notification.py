@@ -0,0 +1,21 @@
+from app import db
+from datetime import datetime, timezone
+from sqlalchemy.dialects.postgresql import JSONB
+
+class Notification(db.Model):
+    __tablename__ = 'notifications'
+    __table_args__ = (
+        db.Index('ix_notifications_user', 'user_id', 'notification_id'),
+        db.Index('ix_notifications_user_unread', 'user_id', postgresql_where=db.text("read_at IS NULL")),
+    )
+
+    notification_id = db.Column(db.BigInteger, primary_key=True)
+    user_id = db.Column(db.Integer, nullable=False)
+    listing_id = db.Column(db.Integer, nullable=False)
+    kind = db.Column(db.String(50), nullable=False)
+    payload = db.Column(JSONB, nullable=False)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    read_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<Notification {self.notification_id} - User {self.user_id} - Listing {self.listing_id}>"
@@ -0,0 +1,4 @@
+from app import db
+from ev_common.outbox import outbox_event_model
+
+OutboxEvent = outbox_event_model(db)
@@ -0,0 +1,18 @@
+from app import db
+from datetime import datetime, timezone
+
+class VehicleSnapshot(db.Model):
+    __tablename__ = 'vehicle_snapshots'
+
+    vehicle_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    brand = db.Column(db.String(50), nullable=False)
+    model = db.Column(db.String(50), nullable=False)
+    year = db.Column(db.Integer, nullable=False, index=True)
+    mileage = db.Column(db.Integer, nullable=False, index=True)
+    last_event_id = db.Column(db.BigInteger, nullable=True)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<VehicleSnapshot {self.brand} {self.model} (ID: {self.vehicle_id})>"
+
+db.Index('ix_vehicle_snapshots_brand_model', db.func.lower(VehicleSnapshot.brand), db.func.lower(VehicleSnapshot.model))
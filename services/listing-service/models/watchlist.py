@@ -2,6 +2,10 @@ from app import db
 
 class WatchList(db.Model):
     __tablename__ = 'watchlist'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'listing_id', name='uq_watchlist_user_listing'),
+        db.Index('ix_watchlist_listing_user', 'listing_id', 'user_id'),
+    )
 
     watchlist_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, nullable=False)
@@ -0,0 +1,65 @@
+from app import db
+from models.listing import Listing
+from services.listingService import ListingService
+from sqlalchemy import text
+import statistics
+import time
+
+SEED_LISTINGS_SQL = """
+INSERT INTO listings (vehicle_id, title, description, price, status, created_at)
+SELECT
+    2000000000 - g,
+    (ARRAY['Toyota','Honda','VinFast','Mazda','Kia','Hyundai','Ford','Mitsubishi'])[1 + g % 8] || ' ' ||
+    (ARRAY['Vios','City','VF8','CX-5','Morning','Accent','Ranger','Xpander'])[1 + (g / 8) % 8] || ' đời ' || (2010 + g % 15),
+    (ARRAY['Xe gia đình','Chính chủ bán','Bảo dưỡng định kỳ','Nội thất còn mới','Máy êm, không đâm đụng'])[1 + g % 5] ||
+    ', odo ' || (g % 200000) || ' km',
+    1000000 + (g % 98) * 1000000,
+    'available',
+    now() - (g || ' seconds')::interval
+FROM generate_series(:start, :stop) AS g
+"""
+
+class BenchmarkService:
+    @staticmethod
+    def _time_ms(fn, runs):
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - started) * 1000)
+            db.session.expunge_all()
+        samples.sort()
+        return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+    @staticmethod
+    def search_latency(sizes, terms, runs=20, limit=20):
+        def ilike_path(term):
+            pattern = f"%{term}%"
+            return (
+                Listing.query
+                .filter(Listing.status == 'available', Listing.title.ilike(pattern))
+                .order_by(Listing.created_at.desc())
+                .limit(limit).all()
+            )
+        results = []
+        seeded = 0
+        try:
+            for size in sorted(sizes):
+                db.session.execute(text(SEED_LISTINGS_SQL), {"start": seeded + 1, "stop": size})
+                seeded = size
+                db.session.execute(text("ANALYZE listings"))
+                for term in terms:
+                    ilike_p50, ilike_p95 = BenchmarkService._time_ms(lambda: ilike_path(term), runs)
+                    fts_p50, fts_p95 = BenchmarkService._time_ms(
+                        lambda: ListingService.search_listings(term, {}, None, limit), runs
+                    )
+                    results.append({
+                        "rows": size,
+                        "term": term,
+                        "ilike_p50_ms": ilike_p50,
+                        "ilike_p95_ms": ilike_p95,
+                        "fts_p50_ms": fts_p50,
+                        "fts_p95_ms": fts_p95,
+                    })
+        finally:
+            db.session.rollback()
+        return results
@@ -0,0 +1,71 @@
+from app import r
+import json
+import logging
+import os
+import redis
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL = int(os.getenv("LISTING_CACHE_TTL", 60))
+COMPARE_CACHE_TTL = int(os.getenv("COMPARE_CACHE_TTL", 300))
+CACHE_PREFIX = "listing:cache"
+VERSION_KEY = f"{CACHE_PREFIX}:version"
+STATS_KEY = f"{CACHE_PREFIX}:stats"
+
+class CacheService:
+    @staticmethod
+    def _detail_key(listing_id):
+        return f"{CACHE_PREFIX}:detail:{listing_id}"
+    @staticmethod
+    def _versioned_key(parts):
+        version = r.get(VERSION_KEY) or "0"
+        return f"{CACHE_PREFIX}:v{version}:" + ":".join(str(p) for p in parts)
+    @staticmethod
+    def _get_or_set(key_fn, loader, ttl):
+        try:
+            key = key_fn()
+            cached = r.get(key)
+            r.hincrby(STATS_KEY, "hits" if cached is not None else "misses", 1)
+            if cached is not None:
+                return json.loads(cached)
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Listing cache unavailable: {e}")
+            return loader()
+        value = loader()
+        if value is not None:
+            try:
+                r.setex(key, ttl, json.dumps(value, ensure_ascii=False))
+            except redis.exceptions.RedisError as e:
+                logger.warning(f"Failed to store listing cache key {key}: {e}")
+        return value
+    @staticmethod
+    def get_or_set(parts, loader, ttl=CACHE_TTL):
+        return CacheService._get_or_set(lambda: CacheService._versioned_key(parts), loader, ttl)
+    @staticmethod
+    def get_or_set_listing(listing_id, loader, ttl=CACHE_TTL):
+        return CacheService._get_or_set(lambda: CacheService._detail_key(listing_id), loader, ttl)
+    @staticmethod
+    def invalidate(listing_ids=()):
+        try:
+            pipe = r.pipeline()
+            pipe.incr(VERSION_KEY)
+            for listing_id in listing_ids:
+                pipe.delete(CacheService._detail_key(listing_id))
+            pipe.execute()
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Failed to invalidate listing cache: {e}")
+    @staticmethod
+    def stats():
+        try:
+            stats = r.hgetall(STATS_KEY)
+            version = r.get(VERSION_KEY) or "0"
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Listing cache unavailable: {e}")
+            return None
+        hits, misses = int(stats.get("hits", 0)), int(stats.get("misses", 0))
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+            "version": int(version)
+        }
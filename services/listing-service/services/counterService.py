@@ -0,0 +1,148 @@
+from app import db, r
+from models.listing_stats import ListingStats
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timezone
+import redis
+import logging
+import os
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "counters:listing:pending"
+FLUSHING_PREFIX = "counters:listing:flushing:"
+TRENDING_KEY = "trending:listings"
+TRENDING_EPOCH_KEY = "trending:listings:epoch"
+COUNTER_FIELDS = {"views": "view_count", "watches": "watch_count"}
+TRENDING_WEIGHTS = {"views": 1.0, "watches": 5.0}
+TRENDING_HALF_LIFE_SECONDS = float(os.getenv("TRENDING_HALF_LIFE_SECONDS", 6 * 3600))
+TRENDING_REBASE_HALF_LIVES = int(os.getenv("TRENDING_REBASE_HALF_LIVES", 20))
+TRENDING_MAX_SIZE = int(os.getenv("TRENDING_MAX_SIZE", 10000))
+TRENDING_MIN_SCORE = 0.01
+FLUSH_INTERVAL = float(os.getenv("COUNTER_FLUSH_INTERVAL", 30))
+FLUSH_BATCH_SIZE = 1000
+
+RECORD_SCRIPT = r.register_script("""
+redis.call('HINCRBY', KEYS[1], ARGV[1] .. ':' .. ARGV[2], ARGV[3])
+local weight = tonumber(ARGV[4])
+if weight <= 0 then
+    return 0
+end
+local now = tonumber(ARGV[5])
+local epoch = tonumber(redis.call('GET', KEYS[3]))
+if not epoch then
+    epoch = now
+    redis.call('SET', KEYS[3], ARGV[5])
+end
+return redis.call('ZINCRBY', KEYS[2], weight * math.pow(2, (now - epoch) / tonumber(ARGV[6])), ARGV[1])
+""")
+
+REBASE_SCRIPT = r.register_script("""
+local epoch = tonumber(redis.call('GET', KEYS[2]))
+local now = tonumber(ARGV[1])
+if not epoch or now - epoch < tonumber(ARGV[2]) * tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZUNIONSTORE', KEYS[1], 1, KEYS[1], 'WEIGHTS', math.pow(2, (epoch - now) / tonumber(ARGV[2])))
+redis.call('SET', KEYS[2], ARGV[1])
+return 1
+""")
+
+def parse_pending(fields):
+    deltas = {}
+    for field, value in fields.items():
+        listing_id, counter = field.rsplit(":", 1)
+        if counter not in COUNTER_FIELDS or not int(value):
+            continue
+        deltas.setdefault(int(listing_id), dict.fromkeys(COUNTER_FIELDS.values(), 0))[COUNTER_FIELDS[counter]] += int(value)
+    return deltas
+
+class CounterService:
+    @staticmethod
+    def _record(listing_id, counter, delta=1):
+        weight = TRENDING_WEIGHTS[counter] if delta > 0 else 0
+        try:
+            RECORD_SCRIPT(
+                keys=[PENDING_KEY, TRENDING_KEY, TRENDING_EPOCH_KEY],
+                args=[int(listing_id), counter, delta, weight, time.time(), TRENDING_HALF_LIFE_SECONDS]
+            )
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Failed to record {counter} for listing {listing_id}: {e}")
+    @staticmethod
+    def record_view(listing_id):
+        CounterService._record(listing_id, "views")
+    @staticmethod
+    def record_watch(listing_id, delta=1):
+        CounterService._record(listing_id, "watches", delta)
+    @staticmethod
+    def forget(listing_ids):
+        try:
+            r.zrem(TRENDING_KEY, *listing_ids)
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Failed to remove listings from trending: {e}")
+    @staticmethod
+    def trending_ids(limit):
+        return [int(listing_id) for listing_id in r.zrevrange(TRENDING_KEY, 0, limit - 1)]
+    @staticmethod
+    def _apply(deltas):
+        items = list(deltas.items())
+        table = ListingStats.__table__
+        for start in range(0, len(items), FLUSH_BATCH_SIZE):
+            now = datetime.now(timezone.utc)
+            stmt = insert(table).values([
+                {"listing_id": listing_id, **counts, "updated_at": now}
+                for listing_id, counts in items[start:start + FLUSH_BATCH_SIZE]
+            ])
+            db.session.execute(stmt.on_conflict_do_update(
+                index_elements=[table.c.listing_id],
+                set_={
+                    **{column: table.c[column] + stmt.excluded[column] for column in COUNTER_FIELDS.values()},
+                    "updated_at": stmt.excluded.updated_at
+                }
+            ))
+        db.session.commit()
+    @staticmethod
+    def _flush_key(key):
+        deltas = parse_pending(r.hgetall(key))
+        if deltas:
+            CounterService._apply(deltas)
+        r.delete(key)
+        return len(deltas)
+    @staticmethod
+    def flush():
+        flushed = 0
+        for key in r.scan_iter(match=f"{FLUSHING_PREFIX}*"):
+            flushed += CounterService._flush_key(key)
+        key = f"{FLUSHING_PREFIX}{uuid.uuid4().hex}"
+        try:
+            r.rename(PENDING_KEY, key)
+        except redis.exceptions.ResponseError:
+            pass
+        else:
+            flushed += CounterService._flush_key(key)
+        CounterService.trim_trending()
+        return flushed
+    @staticmethod
+    def trim_trending():
+        REBASE_SCRIPT(
+            keys=[TRENDING_KEY, TRENDING_EPOCH_KEY],
+            args=[time.time(), TRENDING_HALF_LIFE_SECONDS, TRENDING_REBASE_HALF_LIVES]
+        )
+        epoch = float(r.get(TRENDING_EPOCH_KEY) or time.time())
+        floor = TRENDING_MIN_SCORE * 2 ** ((time.time() - epoch) / TRENDING_HALF_LIFE_SECONDS)
+        pipe = r.pipeline()
+        pipe.zremrangebyscore(TRENDING_KEY, "-inf", floor)
+        pipe.zremrangebyrank(TRENDING_KEY, 0, -TRENDING_MAX_SIZE - 1)
+        pipe.execute()
+    @staticmethod
+    def run(interval=FLUSH_INTERVAL):
+        while True:
+            try:
+                flushed = CounterService.flush()
+                if flushed:
+                    logger.info(f"Flushed counters for {flushed} listings")
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Failed to flush listing counters: {e}", exc_info=True)
+            time.sleep(interval)
@@ -0,0 +1,97 @@
+from app import db, r
+import redis
+import json
+import logging
+import os
+import socket
+
+logger = logging.getLogger(__name__)
+
+CONSUMER_GROUP = os.getenv("EVENT_CONSUMER_GROUP", "listing-service")
+CONSUMER_BATCH_SIZE = int(os.getenv("EVENT_CONSUMER_BATCH_SIZE", 200))
+CONSUMER_BLOCK_MS = int(os.getenv("EVENT_CONSUMER_BLOCK_MS", 5000))
+CLAIM_IDLE_MS = int(os.getenv("EVENT_CONSUMER_CLAIM_IDLE_MS", 60000))
+MAX_DELIVERIES = int(os.getenv("EVENT_CONSUMER_MAX_DELIVERIES", 5))
+DEAD_LETTER_PREFIX = "deadletter:listing:"
+DEAD_LETTER_MAXLEN = int(os.getenv("EVENT_CONSUMER_DEAD_LETTER_MAXLEN", 100000))
+
+def parse_event(fields):
+    return {
+        "event_id": int(fields["event_id"]),
+        "type": fields["type"],
+        "aggregate_id": fields["aggregate_id"],
+        "payload": json.loads(fields["payload"]),
+        "occurred_at": fields.get("occurred_at")
+    }
+
+class EventConsumer:
+    def __init__(self, handlers, group=CONSUMER_GROUP, consumer=None, batch_size=CONSUMER_BATCH_SIZE):
+        self.handlers = handlers
+        self.group = group
+        self.consumer = consumer or socket.gethostname()
+        self.batch_size = batch_size
+    def ensure_groups(self):
+        for stream in self.handlers:
+            try:
+                r.xgroup_create(stream, self.group, id="0", mkstream=True)
+            except redis.exceptions.ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+    def _deliveries(self, stream, entry_id):
+        pending = r.xpending_range(stream, self.group, min=entry_id, max=entry_id, count=1)
+        return pending[0]["times_delivered"] if pending else 0
+    def _apply_one(self, stream, entry_id, fields):
+        try:
+            self.handlers[stream]([parse_event(fields)])
+        except Exception as e:
+            db.session.rollback()
+            deliveries = self._deliveries(stream, entry_id)
+            if deliveries < MAX_DELIVERIES:
+                logger.warning(f"Event {entry_id} from {stream} failed (delivery {deliveries}/{MAX_DELIVERIES}): {e}")
+                return False
+            logger.error(f"Dead-lettering event {entry_id} from {stream} after {deliveries} deliveries: {e}", exc_info=True)
+            r.xadd(f"{DEAD_LETTER_PREFIX}{stream}", {**fields, "entry_id": entry_id, "error": str(e)[:500]},
+                   maxlen=DEAD_LETTER_MAXLEN, approximate=True)
+        r.xack(stream, self.group, entry_id)
+        return True
+    def handle(self, stream, entries):
+        empty = [entry_id for entry_id, fields in entries if not fields]
+        if empty:
+            r.xack(stream, self.group, *empty)
+        entries = [(entry_id, fields) for entry_id, fields in entries if fields]
+        if not entries:
+            return len(empty)
+        try:
+            self.handlers[stream]([parse_event(fields) for _, fields in entries])
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"Failed to apply {len(entries)} events from {stream}, retrying one at a time: {e}")
+            return len(empty) + sum(self._apply_one(stream, entry_id, fields) for entry_id, fields in entries)
+        r.xack(stream, self.group, *[entry_id for entry_id, _ in entries])
+        return len(empty) + len(entries)
+    def drain_pending(self):
+        for stream in self.handlers:
+            last_id = "0"
+            while True:
+                response = r.xreadgroup(self.group, self.consumer, {stream: last_id}, count=self.batch_size)
+                entries = response[0][1] if response else []
+                if not entries:
+                    break
+                self.handle(stream, entries)
+                last_id = entries[-1][0]
+    def claim_stale(self):
+        for stream in self.handlers:
+            _, entries, *_ = r.xautoclaim(stream, self.group, self.consumer, CLAIM_IDLE_MS, "0-0", count=self.batch_size)
+            if entries:
+                self.handle(stream, entries)
+    def run(self):
+        self.ensure_groups()
+        self.drain_pending()
+        while True:
+            self.claim_stale()
+            response = r.xreadgroup(
+                self.group, self.consumer, {stream: ">" for stream in self.handlers},
+                count=self.batch_size, block=CONSUMER_BLOCK_MS
+            )
+            for stream, entries in response or []:
+                self.handle(stream, entries)
@@ -0,0 +1,47 @@
+from app import db
+from models.listing import Listing
+from models.listing_image import ListingImage
+from models.watchlist import WatchList
+from services.listingService import ListingService
+from sqlalchemy import text, tuple_
+from sqlalchemy.dialects import postgresql
+from datetime import datetime, timezone
+import re
+
+SEQ_SCAN_PATTERN = re.compile(r"Seq Scan on (\w+)")
+
+class ExplainService:
+    @staticmethod
+    def hot_queries():
+        now = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+        return [
+            ("listings feed, first page",
+             ListingService._filter_query({}).order_by(Listing.created_at.desc(), Listing.listing_id.desc()).limit(21)),
+            ("listings feed, next page",
+             ListingService._filter_query({})
+             .filter(tuple_(Listing.created_at, Listing.listing_id) < tuple_(now, 1))
+             .order_by(Listing.created_at.desc(), Listing.listing_id.desc()).limit(21)),
+            ("listings filtered by vehicle",
+             ListingService._filter_query({"brand": "toyota", "year": "2020"})
+             .order_by(Listing.created_at.desc(), Listing.listing_id.desc()).limit(21)),
+            ("listings full-text search",
+             ListingService._filter_query({"title": "toyota vios"}).limit(21)),
+            ("listing images by listing ids",
+             ListingImage.query.filter(ListingImage.listing_id.in_([1, 2, 3]))),
+            ("watchlist entry by user and listing",
+             WatchList.query.filter_by(user_id=1, listing_id=1)),
+            ("watchlist page by user",
+             WatchList.query.filter_by(user_id=1).order_by(WatchList.watchlist_id.desc()).limit(21)),
+        ]
+    @staticmethod
+    def explain_all(analyze=False):
+        results = []
+        for name, query in ExplainService.hot_queries():
+            sql = str(query.statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            db.session.execute(text("SET LOCAL enable_seqscan = off"))
+            prefix = "EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN "
+            plan = [row[0] for row in db.session.execute(text(prefix + sql))]
+            db.session.rollback()
+            seq_scans = sorted(set(SEQ_SCAN_PATTERN.findall("\n".join(plan))))
+            results.append({"name": name, "plan": plan, "seq_scans": seq_scans})
+        return results
@@ -0,0 +1,104 @@
+from app import db
+from models.listing import Listing
+from models.listing_image import ListingImage
+from models.listing_image_variant import ListingImageVariant
+from services.cacheService import CacheService
+from services.imageVariants import generate_variants
+from services.jobQueue import JobQueue
+import hashlib
+import logging
+import os
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MAX_IMAGE_BYTES = int(os.getenv("MAX_IMAGE_BYTES", 20 * 1024 * 1024))
+ALLOWED_IMAGE_TYPES = {"image/jpeg": "jpg", "image/png": "png", "image/webp": "webp"}
+
+image_queue = JobQueue("image-variants")
+
+class ImageService:
+    @staticmethod
+    def _store_original(stream, upload_folder, ext):
+        tmp_dir = os.path.join(upload_folder, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        digest, size = hashlib.sha256(), 0
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while True:
+                    chunk = stream.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > MAX_IMAGE_BYTES:
+                        raise ValueError(f"Image must be at most {MAX_IMAGE_BYTES // (1024 * 1024)} MB.")
+                    digest.update(chunk)
+                    out.write(chunk)
+            if not size:
+                raise ValueError("Empty upload.")
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        content_hash = digest.hexdigest()
+        relative = os.path.join("originals", content_hash[:2], f"{content_hash}.{ext}")
+        path = os.path.join(upload_folder, relative)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+            return content_hash, relative
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+        return content_hash, relative
+    @staticmethod
+    def upload_listing_image(listing_id, stream, content_type, upload_folder):
+        if not Listing.query.get(listing_id):
+            return None, "Listing not found."
+        ext = ALLOWED_IMAGE_TYPES.get(content_type)
+        if not ext:
+            return None, "Unsupported image type."
+        try:
+            content_hash, relative = ImageService._store_original(stream, upload_folder, ext)
+        except ValueError as e:
+            return None, str(e)
+
+        existing = ListingImage.query.filter_by(listing_id=listing_id, content_hash=content_hash).first()
+        if existing:
+            return existing, "Image already attached."
+
+        image = ListingImage(listing_id=listing_id, image_url=f"/uploads/{relative}", content_hash=content_hash)
+        db.session.add(image)
+        db.session.commit()
+        image_queue.enqueue({"image_id": image.image_id, "upload_folder": upload_folder, "relative_path": relative})
+        CacheService.invalidate([listing_id])
+        return image, "Image queued for processing."
+    @staticmethod
+    def process_variants(job, heartbeat=None):
+        image = ListingImage.query.get(job["image_id"])
+        if image is None or image.variants:
+            return
+        upload_folder = job["upload_folder"]
+        path = os.path.join(upload_folder, job["relative_path"])
+        try:
+            variants = generate_variants(path, os.path.join(upload_folder, "variants"), image.content_hash)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable image {image.image_id}: {e}")
+            listing_id = image.listing_id
+            shared = ListingImage.query.filter(
+                ListingImage.content_hash == image.content_hash, ListingImage.image_id != image.image_id
+            ).count()
+            db.session.delete(image)
+            db.session.commit()
+            if not shared and os.path.exists(path):
+                os.remove(path)
+            CacheService.invalidate([listing_id])
+            return
+        image.variants = [ListingImageVariant(
+            name=v["name"],
+            format=v["format"],
+            width=v["width"],
+            height=v["height"],
+            url=f"/uploads/variants/{v['relative_path']}"
+        ) for v in variants]
+        db.session.commit()
+        CacheService.invalidate([image.listing_id])
@@ -0,0 +1,29 @@
+from PIL import Image, ImageOps
+import os
+
+VARIANT_SIZES = {"thumb": 320, "medium": 1024}
+VARIANT_FORMATS = {"webp": ("WEBP", {"quality": 80, "method": 4}), "jpeg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True})}
+
+def generate_variants(source_path, variant_dir, content_hash):
+    variants = []
+    with Image.open(source_path) as img:
+        img = ImageOps.exif_transpose(img).convert("RGB")
+        for name, size in VARIANT_SIZES.items():
+            resized = img.copy()
+            resized.thumbnail((size, size), Image.LANCZOS)
+            for fmt, (pil_format, options) in VARIANT_FORMATS.items():
+                relative = os.path.join(content_hash[:2], f"{content_hash}_{name}.{fmt}")
+                path = os.path.join(variant_dir, relative)
+                if not os.path.exists(path):
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    tmp_path = f"{path}.{os.getpid()}.tmp"
+                    resized.save(tmp_path, pil_format, **options)
+                    os.replace(tmp_path, path)
+                variants.append({
+                    "name": name,
+                    "format": fmt,
+                    "width": resized.width,
+                    "height": resized.height,
+                    "relative_path": relative
+                })
+    return variants
@@ -0,0 +1,81 @@
+from app import db, r
+import json
+import logging
+import os
+import socket
+import time
+
+logger = logging.getLogger(__name__)
+
+JOB_PREFIX = "jobs"
+JOB_HEARTBEAT_TTL = int(os.getenv("JOB_HEARTBEAT_TTL", 120))
+JOB_RECOVER_INTERVAL = int(os.getenv("JOB_RECOVER_INTERVAL", 30))
+
+class JobQueue:
+    def __init__(self, name):
+        self.name = name
+        self.queue_key = f"{JOB_PREFIX}:{name}:queue"
+        self.dead_key = f"{JOB_PREFIX}:{name}:dead"
+        self.processing_prefix = f"{JOB_PREFIX}:{name}:processing"
+        self.heartbeat_prefix = f"{JOB_PREFIX}:{name}:heartbeat"
+    def enqueue(self, payload):
+        r.rpush(self.queue_key, json.dumps(payload))
+    def stats(self):
+        return {"queued": r.llen(self.queue_key), "dead": r.llen(self.dead_key)}
+
+class JobWorker:
+    def __init__(self, queue, handler, worker_id=None):
+        self.queue = queue
+        self.handler = handler
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.processing_key = f"{queue.processing_prefix}:{self.worker_id}"
+        self.heartbeat_key = f"{queue.heartbeat_prefix}:{self.worker_id}"
+        self.last_recover = 0
+
+    def heartbeat(self):
+        r.set(self.heartbeat_key, int(time.time()), ex=JOB_HEARTBEAT_TTL)
+
+    def _requeue(self, processing_key):
+        moved = 0
+        while r.lmove(processing_key, self.queue.queue_key, "RIGHT", "LEFT"):
+            moved += 1
+        return moved
+
+    def recover(self):
+        moved = self._requeue(self.processing_key)
+        for processing_key in r.scan_iter(match=f"{self.queue.processing_prefix}:*"):
+            worker_id = processing_key[len(self.queue.processing_prefix) + 1:]
+            if worker_id != self.worker_id and not r.exists(f"{self.queue.heartbeat_prefix}:{worker_id}"):
+                moved += self._requeue(processing_key)
+        self.last_recover = time.monotonic()
+        if moved:
+            logger.warning(f"Requeued {moved} {self.queue.name} jobs from stale processing lists")
+        return moved
+
+    def run_once(self, block_timeout=1):
+        self.heartbeat()
+        if time.monotonic() - self.last_recover > JOB_RECOVER_INTERVAL:
+            self.recover()
+        raw = r.blmove(self.queue.queue_key, self.processing_key, block_timeout, "LEFT", "RIGHT")
+        if raw is None:
+            return 0
+        try:
+            self.handler(json.loads(raw), self.heartbeat)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"{self.queue.name} job failed, dead-lettering: {e}", exc_info=True)
+            r.rpush(self.queue.dead_key, json.dumps({"job": raw, "error": str(e)[:500]}))
+        finally:
+            db.session.remove()
+        r.lrem(self.processing_key, 1, raw)
+        return 1
+
+    def run_forever(self):
+        self.heartbeat()
+        self.recover()
+        logger.info(f"{self.queue.name} worker {self.worker_id} started")
+        try:
+            while True:
+                self.run_once()
+        finally:
+            r.delete(self.heartbeat_key)
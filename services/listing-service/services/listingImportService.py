@@ -0,0 +1,158 @@
+from app import db
+from models.listing import Listing
+from models.listing_image import ListingImage
+from models.vehicle_snapshot import VehicleSnapshot
+from services.listingService import ListingService, listing_payload
+from services.outboxService import OutboxService
+from services.cacheService import CacheService
+from clients.vehicle_client import get_vehicles_by_ids
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from decimal import Decimal, InvalidOperation
+import csv
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+IMPORT_CHUNK_SIZE = 500
+MAX_IMAGES_PER_LISTING = 20
+
+class ListingImportService:
+    @staticmethod
+    def _validate_row(data):
+        if not isinstance(data, dict):
+            return None, "Row must be an object."
+        if not all(data.get(field) not in (None, "") for field in ('vehicle_id', 'title', 'price')):
+            return None, "Missing vehicle_id, title, or price."
+        try:
+            vehicle_id = int(data['vehicle_id'])
+            price = Decimal(str(data['price']))
+        except (TypeError, ValueError, InvalidOperation):
+            return None, "Invalid vehicle_id or price."
+        price_error = ListingService.validate_price(price)
+        if price_error:
+            return None, price_error
+        title = str(data['title']).strip()
+        if not title or len(title) > 200:
+            return None, "Invalid title."
+        images = data.get('image_urls') or []
+        if isinstance(images, str):
+            images = [url.strip() for url in images.split('|') if url.strip()]
+        if not isinstance(images, list) or len(images) > MAX_IMAGES_PER_LISTING:
+            return None, f"image_urls must be a list of at most {MAX_IMAGES_PER_LISTING} URLs."
+        if any(not isinstance(url, str) or len(url) > 255 for url in images):
+            return None, "Invalid image URL."
+        return {
+            'vehicle_id': vehicle_id,
+            'title': title,
+            'description': data.get('description') or None,
+            'price': price,
+            'image_urls': images
+        }, None
+    @staticmethod
+    def _existing_vehicle_ids(vehicle_ids):
+        known = {
+            vehicle_id for (vehicle_id,) in
+            db.session.query(VehicleSnapshot.vehicle_id).filter(VehicleSnapshot.vehicle_id.in_(vehicle_ids))
+        }
+        missing = set(vehicle_ids) - known
+        if missing:
+            known |= set(get_vehicles_by_ids(missing).keys())
+        return known
+    @staticmethod
+    def _import_chunk(chunk):
+        errors = []
+        existing = ListingImportService._existing_vehicle_ids({row['vehicle_id'] for _, row in chunk})
+        rows = []
+        for index, row in chunk:
+            if row['vehicle_id'] in existing:
+                rows.append((index, row))
+            else:
+                errors.append({"row": index, "error": "Vehicle not found."})
+        if not rows:
+            return 0, errors
+        try:
+            inserted = db.session.execute(
+                insert(Listing)
+                .values([{
+                    'vehicle_id': row['vehicle_id'],
+                    'title': row['title'],
+                    'description': row['description'],
+                    'price': row['price'],
+                    'status': 'available'
+                } for _, row in rows])
+                .on_conflict_do_nothing(index_elements=['vehicle_id'])
+                .returning(Listing.listing_id, Listing.vehicle_id, Listing.title, Listing.price, Listing.status, Listing.created_at)
+            ).all()
+            listing_ids = {row.vehicle_id: row.listing_id for row in inserted}
+            OutboxService.record_many("listing", "created", [(row.listing_id, listing_payload(row)) for row in inserted])
+            first_rows = {}
+            for _, row in rows:
+                first_rows.setdefault(row['vehicle_id'], row)
+            images = [
+                {'listing_id': listing_ids[vehicle_id], 'image_url': url}
+                for vehicle_id, row in first_rows.items() if vehicle_id in listing_ids
+                for url in row['image_urls']
+            ]
+            if images:
+                db.session.execute(insert(ListingImage).values(images))
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error(f"Listing import chunk failed: {e}", exc_info=True)
+            return 0, errors + [{"row": index, "error": "Database error."} for index, _ in rows]
+        seen = set()
+        for index, row in rows:
+            if row['vehicle_id'] not in listing_ids or row['vehicle_id'] in seen:
+                errors.append({"row": index, "error": "A listing for this vehicle already exists."})
+            seen.add(row['vehicle_id'])
+        return len(listing_ids), errors
+    @staticmethod
+    def parse_ndjson(lines):
+        for line in lines:
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield None
+    @staticmethod
+    def parse_csv(text_stream):
+        for row in csv.DictReader(text_stream):
+            yield row
+    @staticmethod
+    def import_rows(rows, chunk_size=IMPORT_CHUNK_SIZE):
+        started = time.perf_counter()
+        created, processed, errors, chunk = 0, 0, [], []
+        for index, data in enumerate(rows, start=1):
+            processed += 1
+            row, error = ListingImportService._validate_row(data)
+            if error:
+                errors.append({"row": index, "error": error})
+                continue
+            chunk.append((index, row))
+            if len(chunk) >= chunk_size:
+                count, chunk_errors = ListingImportService._import_chunk(chunk)
+                created += count
+                errors.extend(chunk_errors)
+                chunk = []
+        if chunk:
+            count, chunk_errors = ListingImportService._import_chunk(chunk)
+            created += count
+            errors.extend(chunk_errors)
+        if created:
+            CacheService.invalidate()
+        elapsed = time.perf_counter() - started
+        return {
+            "processed": processed,
+            "created": created,
+            "failed": len(errors),
+            "errors": errors,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(processed / elapsed, 1) if elapsed else None
+        }
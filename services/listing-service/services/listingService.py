@@ -2,29 +2,72 @@ from app import db
 from models.listing import Listing
 from models.listing_image import ListingImage
 from models.watchlist import WatchList
+from models.vehicle_snapshot import VehicleSnapshot
+from models.listing_stats import ListingStats
+from services.cacheService import CacheService
+from services.counterService import CounterService
+from services.outboxService import OutboxService
+from services.vehicleSnapshotService import VehicleSnapshotService
 import traceback
-from sqlalchemy import and_, or_
+import base64
+import binascii
+import re
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from sqlalchemy import and_, or_, tuple_, func, cast, Numeric, select, update
+from sqlalchemy.orm import selectinload
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+EXPORT_BATCH_SIZE = 500
+BULK_TRANSITIONS = {
+    "approve": (("pending",), "available"),
+    "reject": (("pending", "available"), "rejected"),
+    "mark_sold": (("available",), "sold")
+}
+
+def listing_payload(listing, changes=None):
+    payload = {
+        'listing_id': listing.listing_id,
+        'vehicle_id': listing.vehicle_id,
+        'title': listing.title,
+        'price': str(listing.price),
+        'status': listing.status,
+        'created_at': listing.created_at.isoformat() if listing.created_at else None
+    }
+    if changes:
+        payload['changes'] = changes
+    return payload
+
 class ListingService:
     @staticmethod
+    def validate_price(price):
+        if price >= 100000000 or price <= 0:
+            return "Giá phải trong khoảng 0 đến 100 triệu"
+        return None
+    @staticmethod
     def create_listing(vehicle_id, data):
         required_fields = ['title', 'description', 'price']
         if not all(field in data for field in required_fields):
             return None, "Missing title, description, or price."
-        if data['price'] >= 100000000 or data['price'] <= 0:
-            return None, "Giá phải trong khoảng 0 đến 100 triệu"
+        price_error = ListingService.validate_price(data['price'])
+        if price_error:
+            return None, price_error
         new_listing = Listing(
                 vehicle_id=vehicle_id,
                 title=data['title'],
                 description=data['description'],
                 price=data['price'],
-                status='available'
+                status='pending'
             )
         db.session.add(new_listing)
+        db.session.flush()
+        OutboxService.record("listing", "created", new_listing.listing_id, listing_payload(new_listing))
         db.session.commit()
+        CacheService.invalidate()
             
         return new_listing, "Listing created successfully, awaiting approval."    
     @staticmethod
@@ -33,7 +76,11 @@ class ListingService:
         if not listing:
             return False, "Listing not found."
         db.session.delete(listing)
+        ListingStats.query.filter_by(listing_id=listing_id).delete()
+        OutboxService.record("listing", "deleted", listing_id, {'listing_id': listing_id, 'vehicle_id': listing.vehicle_id})
         db.session.commit()
+        CacheService.invalidate([listing_id])
+        CounterService.forget([listing_id])
         return True, "Listing removed successfully."
     @staticmethod
     def update_listing(listing_id, user_id, data): 
@@ -41,22 +88,108 @@ class ListingService:
         if not listing:
             return None, "Listing not found."
 
+        old_price = listing.price
         listing.title = data.get('title', listing.title)
         listing.description = data.get('description', listing.description)
         listing.price = data.get('price', listing.price)
         
+        changes = None
+        if Decimal(str(listing.price)) != old_price:
+            changes = {'price': [str(old_price), str(listing.price)]}
+        OutboxService.record("listing", "updated", listing_id, listing_payload(listing, changes))
         db.session.commit()
+        CacheService.invalidate([listing_id])
         return listing, "Listing updated successfully."
     @staticmethod
-    def get_all_listings(): 
-        return Listing.query.filter(Listing.status == 'available').order_by(Listing.created_at.desc()).all()
+    def _transition_status(listing_id, from_status, to_status, criteria=(), values=None):
+        row = db.session.execute(
+            update(Listing)
+            .where(Listing.listing_id == listing_id, Listing.status == from_status, *criteria)
+            .values(status=to_status, **(values or {}))
+            .returning(Listing.listing_id, Listing.vehicle_id, Listing.title, Listing.price, Listing.status, Listing.created_at)
+        ).first()
+        if row:
+            OutboxService.record("listing", "updated", listing_id, listing_payload(row, {'status': [from_status, to_status]}))
+        db.session.commit()
+        if row:
+            CacheService.invalidate([listing_id])
+        return row
+    @staticmethod
+    def reserve_listing(listing_id, transaction_id):
+        row = ListingService._transition_status(listing_id, 'available', 'sold', values={'reserved_by': transaction_id})
+        if not row:
+            if not Listing.query.get(listing_id):
+                return None, "Listing not found."
+            return None, "Listing is no longer available."
+        return {"listing_id": row.listing_id, "vehicle_id": row.vehicle_id, "price": float(row.price)}, "Listing reserved."
+    @staticmethod
+    def release_listing(listing_id, transaction_id):
+        row = ListingService._transition_status(
+            listing_id, 'sold', 'available', (Listing.reserved_by == transaction_id,), {'reserved_by': None}
+        )
+        return bool(row), "Listing released." if row else "Listing was not reserved."
+    @staticmethod
+    def bulk_moderate_chunk(action, listing_ids):
+        from_statuses, to_status = BULK_TRANSITIONS[action]
+        previous = (
+            select(Listing.listing_id, Listing.status)
+            .where(Listing.listing_id.in_(listing_ids), Listing.status.in_(from_statuses))
+            .with_for_update()
+            .subquery()
+        )
+        rows = db.session.execute(
+            update(Listing)
+            .where(Listing.listing_id == previous.c.listing_id)
+            .values(status=to_status)
+            .returning(Listing.listing_id, Listing.vehicle_id, Listing.title, Listing.price, Listing.status, Listing.created_at, previous.c.status.label('from_status'))
+        ).all()
+        OutboxService.record_many("listing", "updated", [(row.listing_id, listing_payload(row, {'status': [row.from_status, to_status]})) for row in rows])
+        db.session.commit()
+        affected = [row.listing_id for row in rows]
+        if affected:
+            CacheService.invalidate(affected)
+        return affected
+    @staticmethod
+    def stats():
+        by_status = dict(db.session.query(Listing.status, func.count(Listing.listing_id)).group_by(Listing.status).all())
+        return {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "watchlist_entries": db.session.query(func.count(WatchList.watchlist_id)).scalar(),
+            "images": db.session.query(func.count(ListingImage.image_id)).scalar()
+        }
+    @staticmethod
+    def export_training_rows(after_id=0, limit=EXPORT_BATCH_SIZE):
+        return (
+            db.session.query(
+                Listing.listing_id, Listing.price, Listing.status,
+                VehicleSnapshot.brand, VehicleSnapshot.model, VehicleSnapshot.year, VehicleSnapshot.mileage
+            )
+            .join(VehicleSnapshot, VehicleSnapshot.vehicle_id == Listing.vehicle_id)
+            .filter(Listing.listing_id > after_id, Listing.status.in_(['available', 'sold']))
+            .order_by(Listing.listing_id)
+            .limit(limit)
+            .all()
+        )
+    @staticmethod
+    def encode_cursor(listing):
+        raw = f"{listing.created_at.isoformat()}|{listing.listing_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            created_at, listing_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+            return datetime.fromisoformat(created_at), int(listing_id)
+        except (ValueError, UnicodeDecodeError, binascii.Error):
+            raise ValueError("Invalid cursor")
     @staticmethod
-    def filter_listings(filters: dict): 
-        query = Listing.query.filter(Listing.status == 'available')
+    def _filter_query(filters: dict):
+        query = Listing.query.options(selectinload(Listing.images).selectinload(ListingImage.variants)).filter(Listing.status == 'available')
  
         if filters.get("title"):
-            title = f"%{filters['title']}%"
-            query = query.filter(Listing.title.ilike(title))
+            tsquery = ListingService._tsquery(filters["title"])
+            if tsquery is not None:
+                query = query.filter(Listing.search_vector.op('@@')(tsquery))
  
         min_price = filters.get("min_price")
         max_price = filters.get("max_price")
@@ -64,9 +197,80 @@ class ListingService:
             query = query.filter(Listing.price >= float(min_price))
         if max_price:
             query = query.filter(Listing.price <= float(max_price))
+
+        vehicle_filters = ("brand", "model", "year", "mileage_min", "mileage_max")
+        if any(filters.get(f) for f in vehicle_filters):
+            query = query.join(VehicleSnapshot, VehicleSnapshot.vehicle_id == Listing.vehicle_id)
+            if filters.get("brand"):
+                query = query.filter(func.lower(VehicleSnapshot.brand) == filters["brand"].lower())
+            if filters.get("model"):
+                query = query.filter(func.lower(VehicleSnapshot.model) == filters["model"].lower())
+            if filters.get("year"):
+                query = query.filter(VehicleSnapshot.year == int(filters["year"]))
+            if filters.get("mileage_min"):
+                query = query.filter(VehicleSnapshot.mileage >= int(filters["mileage_min"]))
+            if filters.get("mileage_max"):
+                query = query.filter(VehicleSnapshot.mileage <= int(filters["mileage_max"]))
  
-        query = query.order_by(Listing.created_at.desc()) 
-        return query.all()
+        return query
+    @staticmethod
+    def _tsquery(term):
+        words = re.findall(r"\w+", term or "")
+        if not words:
+            return None
+        return func.to_tsquery('simple', func.immutable_unaccent(' & '.join(f"{w}:*" for w in words)))
+    @staticmethod
+    def search_listings(term, filters: dict, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        tsquery = ListingService._tsquery(term)
+        if tsquery is None:
+            raise ValueError("Search term is required")
+        limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+        rank = func.round(cast(func.ts_rank_cd(Listing.search_vector, tsquery), Numeric), 6)
+        query = (
+            ListingService._filter_query(filters)
+            .filter(Listing.search_vector.op('@@')(tsquery))
+            .add_columns(rank)
+        )
+        if cursor:
+            try:
+                last_rank, last_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+                query = query.filter(tuple_(rank, Listing.listing_id) < tuple_(Decimal(last_rank), int(last_id)))
+            except (ValueError, UnicodeDecodeError, binascii.Error, InvalidOperation):
+                raise ValueError("Invalid cursor")
+        rows = query.order_by(rank.desc(), Listing.listing_id.desc()).limit(limit + 1).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_listing, last_rank = rows[-1]
+            next_cursor = base64.urlsafe_b64encode(f"{last_rank}|{last_listing.listing_id}".encode()).decode()
+        return [listing for listing, _ in rows], next_cursor
+    @staticmethod
+    def _page(query, cursor, limit):
+        if cursor:
+            created_at, listing_id = ListingService.decode_cursor(cursor)
+            query = query.filter(tuple_(Listing.created_at, Listing.listing_id) < tuple_(created_at, listing_id))
+        listings = query.order_by(Listing.created_at.desc(), Listing.listing_id.desc()).limit(limit + 1).all()
+        next_cursor = None
+        if len(listings) > limit:
+            listings = listings[:limit]
+            next_cursor = ListingService.encode_cursor(listings[-1])
+        return listings, next_cursor
+    @staticmethod
+    def get_all_listings(cursor=None, limit=DEFAULT_PAGE_SIZE): 
+        return ListingService.filter_listings({}, cursor, limit)
+    @staticmethod
+    def filter_listings(filters: dict, cursor=None, limit=DEFAULT_PAGE_SIZE): 
+        limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+        return ListingService._page(ListingService._filter_query(filters), cursor, limit)
+    @staticmethod
+    def iter_listings(filters: dict, cursor=None, batch_size=EXPORT_BATCH_SIZE):
+        while True:
+            listings, cursor = ListingService._page(ListingService._filter_query(filters), cursor, batch_size)
+            if listings:
+                yield listings
+            db.session.expunge_all()
+            if not cursor:
+                break
     @staticmethod
     def get_listing_by_id(listing_id):
         return Listing.query.get(listing_id)
@@ -79,7 +283,9 @@ class ListingService:
         
         new_entry = WatchList(user_id=user_id, listing_id=listing_id)
         db.session.add(new_entry)
+        OutboxService.record("watchlist", "added", listing_id, {'user_id': user_id, 'listing_id': listing_id})
         db.session.commit()
+        CounterService.record_watch(listing_id)
         return new_entry, "Added to watchlist."
 
     @staticmethod
@@ -93,60 +299,75 @@ class ListingService:
             return False, "watch lish not found"
         
         db.session.delete(watchlist_item)
+        OutboxService.record("watchlist", "removed", listing_id, {'user_id': user_id, 'listing_id': listing_id})
         db.session.commit()
+        CounterService.record_watch(listing_id, -1)
         return True, "Removed from watchlist."
 
     @staticmethod
     def get_watchlist_by_id(watchlist_id):
         return WatchList.query.get(watchlist_id)
     @staticmethod
-    def get_watchlist(user_id):
-        return [
-            ListingService.get_listing_by_id(item.listing_id)
-            for item in WatchList.query.filter_by(user_id=user_id).all()
-        ]
+    def get_watchlist(user_id, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+        query = (
+            db.session.query(WatchList.watchlist_id, Listing)
+            .join(Listing, Listing.listing_id == WatchList.listing_id)
+            .options(selectinload(Listing.images).selectinload(ListingImage.variants))
+            .filter(WatchList.user_id == user_id)
+        )
+        if cursor:
+            query = query.filter(WatchList.watchlist_id < cursor)
+        rows = query.order_by(WatchList.watchlist_id.desc()).limit(limit + 1).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1][0]
+        return [listing for _, listing in rows], next_cursor
     @staticmethod
     def get_comparison_data(listing_ids: list):
         if not listing_ids:
-            return None, None, "Không có ID nào được cung cấp."
+            return None, "Không có ID nào được cung cấp."
 
         try:
-            query = (
+            listings = (
                 Listing.query
+                .options(selectinload(Listing.images).selectinload(ListingImage.variants))
                 .filter(Listing.listing_id.in_(listing_ids))
+                .all()
             )
-            listings = query.all()
 
             if not listings:
-                return None, None, "Không tìm thấy tin đăng nào."
-        
+                return None, "Không tìm thấy tin đăng nào."
+
+            vehicles = VehicleSnapshotService.get_vehicles(l.vehicle_id for l in listings)
             serialized_data = [
-                ListingService._serialize_for_compare(l) for l in listings
+                ListingService._serialize_for_compare(l, vehicles) for l in listings
             ]
 
             return serialized_data, "Lấy dữ liệu so sánh thành công."
 
         except Exception as e:
             logger.error(f"Lỗi khi lấy dữ liệu so sánh: {e}", exc_info=True)
-            return None, None, "Lỗi máy chủ nội bộ."
+            return None, "Lỗi máy chủ nội bộ."
 
     @staticmethod
-    def _serialize_for_compare(listing): 
+    def _serialize_for_compare(listing, vehicles): 
         if not listing: return None 
-        v = listing.vehicle
+        v = vehicles.get(listing.vehicle_id)
         vehicle_details = {
-            'brand': v.brand,
-            'model': v.model,
-            'year': v.year,
-            'mileage': v.mileage
-        }
+            'brand': v['brand'],
+            'model': v['model'],
+            'year': v['year'],
+            'mileage': v['mileage']
+        } if v else None
         return {
             'listing_id': listing.listing_id,
-            'listing_type': listing.listing_type,
+            'listing_type': getattr(listing, 'listing_type', None),
             'title': listing.title,
             'price': str(listing.price),
             'status': listing.status,
             'images': [img.image_url for img in listing.images] if listing.images else [],
+            'thumbnails': [img.variant_url('thumb') for img in listing.images] if listing.images else [],
             'vehicle_details': vehicle_details
         }
-
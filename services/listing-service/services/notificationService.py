@@ -0,0 +1,165 @@
+from app import db, r
+from models.notification import Notification
+from models.watchlist import WatchList
+from sqlalchemy import insert, update
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+DUE_KEY = "notify:due"
+COALESCE_WINDOW_SECONDS = float(os.getenv("NOTIFY_COALESCE_WINDOW_SECONDS", 30))
+RETRY_DELAY_SECONDS = float(os.getenv("NOTIFY_RETRY_DELAY_SECONDS", 10))
+FANOUT_BATCH_SIZE = int(os.getenv("NOTIFY_FANOUT_BATCH_SIZE", 1000))
+DELIVERY_BATCH_SIZE = int(os.getenv("NOTIFY_DELIVERY_BATCH_SIZE", 100))
+POLL_INTERVAL = float(os.getenv("NOTIFY_POLL_INTERVAL", 1))
+WATCHED_FIELDS = ("price", "status")
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+def _changes_key(listing_id):
+    return f"notify:changes:{listing_id}"
+
+def _differs(field, old, new):
+    if field == "price":
+        try:
+            return Decimal(old) != Decimal(new)
+        except (InvalidOperation, TypeError):
+            pass
+    return old != new
+
+def summarize_changes(listing_id, fields):
+    changes = {}
+    for field in WATCHED_FIELDS:
+        old, new = fields.get(f"{field}:old"), fields.get(f"{field}:new")
+        if old is not None and new is not None and _differs(field, old, new):
+            changes[field] = {"old": old, "new": new}
+    if not changes:
+        return None
+    return {"listing_id": listing_id, "title": fields.get("title"), "changes": changes}
+
+def serialize_notification(notification):
+    return {
+        "notification_id": notification.notification_id,
+        "listing_id": notification.listing_id,
+        "kind": notification.kind,
+        "payload": notification.payload,
+        "created_at": notification.created_at.isoformat(),
+        "read_at": notification.read_at.isoformat() if notification.read_at else None
+    }
+
+class NotificationService:
+    @staticmethod
+    def collect_listing_events(events):
+        now = time.time()
+        pipe = r.pipeline(transaction=False)
+        for event in events:
+            if event["type"] != "listing.updated":
+                continue
+            payload = event["payload"]
+            changes = {field: value for field, value in (payload.get("changes") or {}).items() if field in WATCHED_FIELDS}
+            if not changes:
+                continue
+            key = _changes_key(event["aggregate_id"])
+            for field, (old, new) in changes.items():
+                pipe.hsetnx(key, f"{field}:old", str(old))
+                pipe.hset(key, f"{field}:new", str(new))
+            pipe.hset(key, "title", payload.get("title") or "")
+            pipe.hdel(key, "after_user")
+            pipe.zadd(DUE_KEY, {event["aggregate_id"]: now + COALESCE_WINDOW_SECONDS}, nx=True)
+        pipe.execute()
+    @staticmethod
+    def _claim(listing_id):
+        if not r.zrem(DUE_KEY, listing_id):
+            return None
+        pipe = r.pipeline()
+        pipe.hgetall(_changes_key(listing_id))
+        pipe.delete(_changes_key(listing_id))
+        fields, _ = pipe.execute()
+        return fields
+    @staticmethod
+    def _requeue(listing_id, fields, after_user):
+        key = _changes_key(listing_id)
+        pipe = r.pipeline()
+        for field, value in fields.items():
+            if field.endswith(":old"):
+                pipe.hset(key, field, value)
+            else:
+                pipe.hsetnx(key, field, value)
+        pipe.hsetnx(key, "after_user", after_user)
+        pipe.zadd(DUE_KEY, {listing_id: time.time() + RETRY_DELAY_SECONDS}, nx=True)
+        pipe.execute()
+    @staticmethod
+    def fan_out(listing_id, payload, after_user=0):
+        delivered = 0
+        while True:
+            user_ids = [row.user_id for row in (
+                db.session.query(WatchList.user_id)
+                .filter(WatchList.listing_id == listing_id, WatchList.user_id > after_user)
+                .order_by(WatchList.user_id)
+                .limit(FANOUT_BATCH_SIZE)
+            )]
+            if not user_ids:
+                break
+            now = datetime.now(timezone.utc)
+            db.session.execute(insert(Notification).values([{
+                "user_id": user_id,
+                "listing_id": listing_id,
+                "kind": "listing.changed",
+                "payload": payload,
+                "created_at": now
+            } for user_id in user_ids]))
+            db.session.commit()
+            delivered += len(user_ids)
+            after_user = user_ids[-1]
+            if len(user_ids) < FANOUT_BATCH_SIZE:
+                break
+        return delivered, after_user
+    @staticmethod
+    def deliver_due(limit=DELIVERY_BATCH_SIZE):
+        delivered = 0
+        for listing_id in r.zrangebyscore(DUE_KEY, "-inf", time.time(), start=0, num=limit):
+            fields = NotificationService._claim(listing_id)
+            payload = summarize_changes(int(listing_id), fields) if fields else None
+            if not payload:
+                continue
+            after_user = int(fields.get("after_user", 0))
+            try:
+                count, after_user = NotificationService.fan_out(int(listing_id), payload, after_user)
+                delivered += count
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Failed to notify watchers of listing {listing_id}: {e}", exc_info=True)
+                fields.pop("after_user", None)
+                NotificationService._requeue(listing_id, fields, after_user)
+        return delivered
+    @staticmethod
+    def run(limit=DELIVERY_BATCH_SIZE):
+        while True:
+            if not NotificationService.deliver_due(limit):
+                time.sleep(POLL_INTERVAL)
+    @staticmethod
+    def get_notifications(user_id, cursor=None, limit=DEFAULT_PAGE_SIZE, unread_only=False):
+        limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+        query = Notification.query.filter(Notification.user_id == user_id)
+        if unread_only:
+            query = query.filter(Notification.read_at.is_(None))
+        if cursor:
+            query = query.filter(Notification.notification_id < cursor)
+        notifications = query.order_by(Notification.notification_id.desc()).limit(limit + 1).all()
+        next_cursor = None
+        if len(notifications) > limit:
+            notifications = notifications[:limit]
+            next_cursor = notifications[-1].notification_id
+        return notifications, next_cursor
+    @staticmethod
+    def mark_read(user_id, notification_ids=None):
+        stmt = update(Notification).where(Notification.user_id == user_id, Notification.read_at.is_(None))
+        if notification_ids is not None:
+            stmt = stmt.where(Notification.notification_id.in_(notification_ids))
+        result = db.session.execute(stmt.values(read_at=datetime.now(timezone.utc)))
+        db.session.commit()
+        return result.rowcount
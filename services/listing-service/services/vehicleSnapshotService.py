@@ -0,0 +1,94 @@
+from app import db
+from models.vehicle_snapshot import VehicleSnapshot
+from models.listing import Listing
+from services.cacheService import CacheService
+from clients.vehicle_client import get_vehicles_by_ids
+from sqlalchemy import or_, func
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FIELDS = ['brand', 'model', 'year', 'mileage']
+
+class VehicleSnapshotService:
+    @staticmethod
+    def _invalidate_listings(vehicle_ids):
+        listing_ids = [row.listing_id for row in db.session.query(Listing.listing_id).filter(Listing.vehicle_id.in_(vehicle_ids))]
+        CacheService.invalidate(listing_ids)
+    @staticmethod
+    def upsert_snapshots(vehicles: list):
+        rows = []
+        for v in vehicles:
+            if not v.get('vehicle_id') or not all(v.get(f) is not None for f in SNAPSHOT_FIELDS):
+                return 0, "Each vehicle needs vehicle_id, brand, model, year and mileage."
+            rows.append({
+                'vehicle_id': int(v['vehicle_id']),
+                'brand': v['brand'],
+                'model': v['model'],
+                'year': int(v['year']),
+                'mileage': int(v['mileage']),
+                'last_event_id': v.get('last_event_id'),
+                'updated_at': datetime.now(timezone.utc)
+            })
+        if not rows:
+            return 0, "No vehicles provided."
+        stmt = insert(VehicleSnapshot).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VehicleSnapshot.vehicle_id],
+            set_={
+                **{f: stmt.excluded[f] for f in SNAPSHOT_FIELDS + ['updated_at']},
+                'last_event_id': func.greatest(VehicleSnapshot.__table__.c.last_event_id, stmt.excluded.last_event_id)
+            },
+            where=or_(
+                VehicleSnapshot.last_event_id.is_(None),
+                VehicleSnapshot.last_event_id < stmt.excluded.last_event_id
+            )
+        )
+        db.session.execute(stmt)
+        db.session.commit()
+        VehicleSnapshotService._invalidate_listings([row['vehicle_id'] for row in rows])
+        return len(rows), "Vehicle snapshots synced."
+    @staticmethod
+    def delete_snapshots(vehicle_ids):
+        deleted = VehicleSnapshot.query.filter(VehicleSnapshot.vehicle_id.in_(vehicle_ids)).delete(synchronize_session=False)
+        db.session.commit()
+        VehicleSnapshotService._invalidate_listings(vehicle_ids)
+        return deleted
+    @staticmethod
+    def apply_vehicle_events(events):
+        latest = {}
+        for event in events:
+            vehicle_id = int(event["aggregate_id"])
+            if vehicle_id not in latest or latest[vehicle_id]["event_id"] < event["event_id"]:
+                latest[vehicle_id] = event
+        upserts = [
+            dict(event["payload"], last_event_id=event["event_id"])
+            for event in latest.values() if event["type"] != "vehicle.deleted"
+        ]
+        deletes = [vehicle_id for vehicle_id, event in latest.items() if event["type"] == "vehicle.deleted"]
+        if upserts:
+            VehicleSnapshotService.upsert_snapshots(upserts)
+        if deletes:
+            VehicleSnapshotService.delete_snapshots(deletes)
+    @staticmethod
+    def get_vehicles(vehicle_ids):
+        vehicle_ids = {int(v) for v in vehicle_ids if v}
+        if not vehicle_ids:
+            return {}
+        vehicles = {
+            s.vehicle_id: {
+                'vehicle_id': s.vehicle_id,
+                'brand': s.brand,
+                'model': s.model,
+                'year': s.year,
+                'mileage': s.mileage
+            }
+            for s in VehicleSnapshot.query.filter(VehicleSnapshot.vehicle_id.in_(vehicle_ids))
+        }
+        missing = vehicle_ids - vehicles.keys()
+        if missing:
+            logger.info(f"{len(missing)} vehicles missing from snapshots, falling back to Vehicle Service")
+            vehicles.update(get_vehicles_by_ids(missing))
+        return vehicles
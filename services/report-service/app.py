@@ -0,0 +1,45 @@
+import os
+from flask import Flask
+from flask_cors import CORS
+from extensions import db, jwt, migrate, r
+import click
+from models.ingest_watermark import IngestWatermark
+from models.report_vehicle import ReportVehicle
+from models.report_listing import ReportListing
+from models.report_review import ReportReview
+from models.daily_stat import DailyStat
+from models.price_bucket_stat import PriceBucketStat
+from models.watchlist_count import WatchlistCount
+from services.ingestService import IngestService, INGEST_BATCH_SIZE
+from controllers.controller_api import api_bp
+
+
+def create_app():
+    app = Flask(__name__)
+    CORS(app)
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv("DATABASE_URL")
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "secretkey")
+
+    db.init_app(app)
+    migrate.init_app(app, db)
+    jwt.init_app(app)
+
+    app.register_blueprint(api_bp)
+
+    @app.cli.command("ingest-events")
+    @click.option("--batch-size", default=INGEST_BATCH_SIZE)
+    @click.option("--once", is_flag=True)
+    def ingest_events_command(batch_size, once):
+        if once:
+            total = 0
+            while True:
+                applied = IngestService.ingest_once(batch_size)
+                total += applied
+                if not applied:
+                    break
+            print(f"Đã tổng hợp {total} sự kiện.")
+            return
+        IngestService.run(batch_size)
+
+    return app
@@ -0,0 +1,73 @@
+from flask import request, jsonify, Blueprint
+from functools import wraps
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
+from services.reportService import ReportService
+
+api_bp = Blueprint('api', __name__, url_prefix='/api')
+
+def admin_required():
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            verify_jwt_in_request()
+            claim = get_jwt()
+            if claim.get("role") not in ("Admin", "Staff"):
+                return jsonify({"error": "Admin or Staff access required"}), 403
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
+
+def serialize_daily_stat(stat):
+    return {
+        'day': stat.day.isoformat(),
+        'listings_created': stat.listings_created,
+        'listings_sold': stat.listings_sold,
+        'listings_deleted': stat.listings_deleted,
+        'sales_count': stat.sales_count,
+        'sales_volume': float(stat.sales_volume),
+        'reviews_created': stat.reviews_created,
+        'average_rating': round(stat.rating_sum / stat.reviews_created, 2) if stat.reviews_created else None,
+        'watchlist_adds': stat.watchlist_adds
+    }
+
+@api_bp.route('/reports/daily', methods=['GET'])
+@admin_required()
+def daily_report():
+    try:
+        start, end = ReportService.date_range(request.args.get("from"), request.args.get("to"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    stats = ReportService.daily_stats(start, end)
+    return jsonify({"from": start.isoformat(), "to": end.isoformat(), "items": [serialize_daily_stat(s) for s in stats]}), 200
+
+@api_bp.route('/reports/price-distribution', methods=['GET'])
+@admin_required()
+def price_distribution():
+    rows = ReportService.price_distribution(request.args.get("brand"), request.args.get("year", type=int))
+    return jsonify({"items": [{
+        "price_bucket": bucket,
+        "active_listings": int(count),
+        "average_price": float(total / count) if count else None
+    } for bucket, count, total in rows]}), 200
+
+@api_bp.route('/reports/brands', methods=['GET'])
+@admin_required()
+def brand_summary():
+    rows = ReportService.brand_summary()
+    return jsonify({"items": [{
+        "brand": brand,
+        "year": year,
+        "active_listings": int(count),
+        "average_price": float(total / count) if count else None
+    } for brand, year, count, total in rows]}), 200
+
+@api_bp.route('/reports/watchlist/top', methods=['GET'])
+@admin_required()
+def top_watched():
+    counts = ReportService.top_watched(request.args.get("limit", type=int))
+    return jsonify({"items": [{"listing_id": c.listing_id, "watchers": c.watchers} for c in counts]}), 200
+
+@api_bp.route('/reports/ingest-status', methods=['GET'])
+@admin_required()
+def ingest_status():
+    return jsonify({"streams": ReportService.ingest_status()}), 200
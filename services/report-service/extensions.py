@@ -0,0 +1,12 @@
+import os
+from flask_sqlalchemy import SQLAlchemy
+from flask_jwt_extended import JWTManager
+from flask_migrate import Migrate
+from dotenv import load_dotenv
+import redis
+
+load_dotenv()
+db = SQLAlchemy()
+jwt = JWTManager()
+migrate = Migrate(version_table = 'alembic_version_report')
+r = redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379"), decode_responses = True)
@@ -0,0 +1,24 @@
+"""report listing vehicle index
+
+Revision ID: 2f6a9c4e8d13
+Revises: 4d1b7a9e3c52
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2f6a9c4e8d13'
+down_revision = '4d1b7a9e3c52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_report_listings_vehicle', 'report_listings', ['vehicle_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_report_listings_vehicle', table_name='report_listings')
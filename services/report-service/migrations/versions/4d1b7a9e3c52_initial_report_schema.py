@@ -0,0 +1,86 @@
+"""initial report schema
+
+Revision ID: 4d1b7a9e3c52
+Revises: 
+Create Date: 2026-10-18 15:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d1b7a9e3c52'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ingest_watermarks',
+    sa.Column('stream', sa.String(length=100), nullable=False),
+    sa.Column('last_id', sa.String(length=50), nullable=False),
+    sa.Column('events_applied', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('stream')
+    )
+    op.create_table('report_vehicles',
+    sa.Column('vehicle_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('brand', sa.String(length=50), nullable=False),
+    sa.Column('model', sa.String(length=50), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('vehicle_id')
+    )
+    op.create_table('report_listings',
+    sa.Column('listing_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('vehicle_id', sa.Integer(), nullable=True),
+    sa.Column('brand', sa.String(length=50), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('price', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('created_day', sa.Date(), nullable=False),
+    sa.PrimaryKeyConstraint('listing_id')
+    )
+    op.create_table('report_reviews',
+    sa.Column('review_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('rating', sa.Integer(), nullable=False),
+    sa.Column('created_day', sa.Date(), nullable=False),
+    sa.PrimaryKeyConstraint('review_id')
+    )
+    op.create_table('daily_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('listings_created', sa.Integer(), nullable=False),
+    sa.Column('listings_sold', sa.Integer(), nullable=False),
+    sa.Column('listings_deleted', sa.Integer(), nullable=False),
+    sa.Column('sales_count', sa.Integer(), nullable=False),
+    sa.Column('sales_volume', sa.Numeric(precision=16, scale=2), nullable=False),
+    sa.Column('reviews_created', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Integer(), nullable=False),
+    sa.Column('watchlist_adds', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+    op.create_table('price_bucket_stats',
+    sa.Column('brand', sa.String(length=50), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('price_bucket', sa.Integer(), nullable=False),
+    sa.Column('active_listings', sa.Integer(), nullable=False),
+    sa.Column('price_sum', sa.Numeric(precision=16, scale=2), nullable=False),
+    sa.PrimaryKeyConstraint('brand', 'year', 'price_bucket')
+    )
+    op.create_table('watchlist_counts',
+    sa.Column('listing_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('watchers', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('listing_id')
+    )
+    op.create_index('ix_watchlist_counts_watchers', 'watchlist_counts', ['watchers', 'listing_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_watchlist_counts_watchers', table_name='watchlist_counts')
+    op.drop_table('watchlist_counts')
+    op.drop_table('price_bucket_stats')
+    op.drop_table('daily_stats')
+    op.drop_table('report_reviews')
+    op.drop_table('report_listings')
+    op.drop_table('report_vehicles')
+    op.drop_table('ingest_watermarks')
@@ -0,0 +1,17 @@
+from extensions import db
+
+class DailyStat(db.Model):
+    __tablename__ = 'daily_stats'
+
+    day = db.Column(db.Date, primary_key=True)
+    listings_created = db.Column(db.Integer, nullable=False, default=0)
+    listings_sold = db.Column(db.Integer, nullable=False, default=0)
+    listings_deleted = db.Column(db.Integer, nullable=False, default=0)
+    sales_count = db.Column(db.Integer, nullable=False, default=0)
+    sales_volume = db.Column(db.Numeric(16, 2), nullable=False, default=0)
+    reviews_created = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    watchlist_adds = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<DailyStat {self.day}>"
@@ -0,0 +1,13 @@
+from extensions import db
+from datetime import datetime, timezone
+
+class IngestWatermark(db.Model):
+    __tablename__ = 'ingest_watermarks'
+
+    stream = db.Column(db.String(100), primary_key=True)
+    last_id = db.Column(db.String(50), nullable=False, default='0-0')
+    events_applied = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+
+    def __repr__(self):
+        return f"<IngestWatermark {self.stream} @ {self.last_id}>"
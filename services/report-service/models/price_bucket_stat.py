@@ -0,0 +1,13 @@
+from extensions import db
+
+class PriceBucketStat(db.Model):
+    __tablename__ = 'price_bucket_stats'
+
+    brand = db.Column(db.String(50), primary_key=True)
+    year = db.Column(db.Integer, primary_key=True)
+    price_bucket = db.Column(db.Integer, primary_key=True)
+    active_listings = db.Column(db.Integer, nullable=False, default=0)
+    price_sum = db.Column(db.Numeric(16, 2), nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<PriceBucketStat {self.brand} {self.year} {self.price_bucket}: {self.active_listings}>"
@@ -0,0 +1,18 @@
+from extensions import db
+
+class ReportListing(db.Model):
+    __tablename__ = 'report_listings'
+    __table_args__ = (
+        db.Index('ix_report_listings_vehicle', 'vehicle_id'),
+    )
+
+    listing_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    vehicle_id = db.Column(db.Integer, nullable=True)
+    brand = db.Column(db.String(50), nullable=False, default='unknown')
+    year = db.Column(db.Integer, nullable=False, default=0)
+    price = db.Column(db.Numeric(12, 2), nullable=False)
+    status = db.Column(db.String(20), nullable=False)
+    created_day = db.Column(db.Date, nullable=False)
+
+    def __repr__(self):
+        return f"<ReportListing {self.listing_id} ({self.status})>"
@@ -0,0 +1,11 @@
+from extensions import db
+
+class ReportReview(db.Model):
+    __tablename__ = 'report_reviews'
+
+    review_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    rating = db.Column(db.Integer, nullable=False)
+    created_day = db.Column(db.Date, nullable=False)
+
+    def __repr__(self):
+        return f"<ReportReview {self.review_id} rating={self.rating}>"
@@ -0,0 +1,12 @@
+from extensions import db
+
+class ReportVehicle(db.Model):
+    __tablename__ = 'report_vehicles'
+
+    vehicle_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    brand = db.Column(db.String(50), nullable=False)
+    model = db.Column(db.String(50), nullable=False)
+    year = db.Column(db.Integer, nullable=False)
+
+    def __repr__(self):
+        return f"<ReportVehicle {self.brand} {self.model} {self.year} (ID: {self.vehicle_id})>"
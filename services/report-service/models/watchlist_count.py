@@ -0,0 +1,13 @@
+from extensions import db
+
+class WatchlistCount(db.Model):
+    __tablename__ = 'watchlist_counts'
+    __table_args__ = (
+        db.Index('ix_watchlist_counts_watchers', 'watchers', 'listing_id'),
+    )
+
+    listing_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    watchers = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<WatchlistCount {self.listing_id}: {self.watchers}>"
@@ -0,0 +1,91 @@
+from extensions import db, r
+from models.ingest_watermark import IngestWatermark
+from services.rollupService import RollupService
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timezone
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+INGEST_BATCH_SIZE = int(os.getenv("REPORT_INGEST_BATCH_SIZE", 500))
+INGEST_BLOCK_MS = int(os.getenv("REPORT_INGEST_BLOCK_MS", 5000))
+DEAD_LETTER_PREFIX = "deadletter:report:"
+DEAD_LETTER_MAXLEN = int(os.getenv("REPORT_DEAD_LETTER_MAXLEN", 100000))
+
+STREAM_HANDLERS = {
+    "events:vehicle": RollupService.apply_vehicle,
+    "events:listing": RollupService.apply_listing,
+    "events:transaction": RollupService.apply_transaction,
+    "events:review": RollupService.apply_review,
+    "events:watchlist": RollupService.apply_watchlist,
+}
+
+def parse_event(fields):
+    return {
+        "event_id": int(fields["event_id"]),
+        "type": fields["type"],
+        "aggregate_id": fields["aggregate_id"],
+        "payload": json.loads(fields["payload"]),
+        "occurred_at": fields.get("occurred_at")
+    }
+
+class IngestService:
+    @staticmethod
+    def watermarks():
+        return {w.stream: w for w in IngestWatermark.query.all()}
+    @staticmethod
+    def _advance(stream, last_id, count):
+        stmt = insert(IngestWatermark).values(
+            stream=stream, last_id=last_id, events_applied=count, updated_at=datetime.now(timezone.utc)
+        )
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=["stream"],
+            set_={
+                "last_id": stmt.excluded.last_id,
+                "events_applied": IngestWatermark.__table__.c.events_applied + stmt.excluded.events_applied,
+                "updated_at": stmt.excluded.updated_at
+            }
+        ))
+    @staticmethod
+    def ingest_once(batch_size=INGEST_BATCH_SIZE, block_ms=None):
+        marks = {stream: w.last_id for stream, w in IngestService.watermarks().items()}
+        db.session.rollback()
+        response = r.xread(
+            {stream: marks.get(stream, "0-0") for stream in STREAM_HANDLERS},
+            count=batch_size, block=block_ms
+        )
+        applied = 0
+        for stream, entries in response or []:
+            handler = STREAM_HANDLERS[stream]
+            for entry_id, fields in entries:
+                if fields:
+                    IngestService._apply_one(stream, handler, entry_id, fields)
+            try:
+                IngestService._advance(stream, entries[-1][0], len(entries))
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            applied += len(entries)
+        return applied
+    @staticmethod
+    def _apply_one(stream, handler, entry_id, fields):
+        try:
+            with db.session.begin_nested():
+                handler(parse_event(fields))
+        except Exception as e:
+            logger.error(f"Dead-lettering event {entry_id} from {stream}: {e}", exc_info=True)
+            r.xadd(f"{DEAD_LETTER_PREFIX}{stream}", {**fields, "entry_id": entry_id, "error": str(e)[:500]},
+                   maxlen=DEAD_LETTER_MAXLEN, approximate=True)
+    @staticmethod
+    def run(batch_size=INGEST_BATCH_SIZE, block_ms=INGEST_BLOCK_MS):
+        while True:
+            try:
+                IngestService.ingest_once(batch_size, block_ms)
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Report ingest loop failed: {e}", exc_info=True)
+                time.sleep(block_ms / 1000)
@@ -0,0 +1,63 @@
+from extensions import db, r
+from models.daily_stat import DailyStat
+from models.price_bucket_stat import PriceBucketStat
+from models.watchlist_count import WatchlistCount
+from services.ingestService import IngestService, STREAM_HANDLERS, DEAD_LETTER_PREFIX
+from sqlalchemy import func
+from datetime import date, timedelta
+
+DEFAULT_RANGE_DAYS = 30
+MAX_RANGE_DAYS = 366
+MAX_TOP_LIMIT = 100
+
+class ReportService:
+    @staticmethod
+    def date_range(start, end):
+        end = date.fromisoformat(end) if end else date.today()
+        start = date.fromisoformat(start) if start else end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+        if start > end:
+            raise ValueError("from must be before to")
+        if (end - start).days >= MAX_RANGE_DAYS:
+            raise ValueError(f"Range must be at most {MAX_RANGE_DAYS} days")
+        return start, end
+    @staticmethod
+    def daily_stats(start, end):
+        return DailyStat.query.filter(DailyStat.day.between(start, end)).order_by(DailyStat.day).all()
+    @staticmethod
+    def price_distribution(brand=None, year=None):
+        query = db.session.query(
+            PriceBucketStat.price_bucket,
+            func.sum(PriceBucketStat.active_listings),
+            func.sum(PriceBucketStat.price_sum)
+        ).filter(PriceBucketStat.active_listings > 0)
+        if brand:
+            query = query.filter(PriceBucketStat.brand == brand)
+        if year:
+            query = query.filter(PriceBucketStat.year == year)
+        return query.group_by(PriceBucketStat.price_bucket).order_by(PriceBucketStat.price_bucket).all()
+    @staticmethod
+    def brand_summary():
+        return db.session.query(
+            PriceBucketStat.brand,
+            PriceBucketStat.year,
+            func.sum(PriceBucketStat.active_listings),
+            func.sum(PriceBucketStat.price_sum)
+        ).filter(PriceBucketStat.active_listings > 0).group_by(
+            PriceBucketStat.brand, PriceBucketStat.year
+        ).order_by(PriceBucketStat.brand, PriceBucketStat.year).all()
+    @staticmethod
+    def top_watched(limit=20):
+        limit = max(1, min(limit or 20, MAX_TOP_LIMIT))
+        return WatchlistCount.query.filter(WatchlistCount.watchers > 0).order_by(
+            WatchlistCount.watchers.desc(), WatchlistCount.listing_id
+        ).limit(limit).all()
+    @staticmethod
+    def ingest_status():
+        marks = IngestService.watermarks()
+        return [{
+            "stream": stream,
+            "last_id": marks[stream].last_id if stream in marks else None,
+            "events_applied": marks[stream].events_applied if stream in marks else 0,
+            "updated_at": marks[stream].updated_at.isoformat() if stream in marks else None,
+            "dead_lettered": r.xlen(f"{DEAD_LETTER_PREFIX}{stream}")
+        } for stream in STREAM_HANDLERS]
@@ -0,0 +1,146 @@
+from extensions import db
+from models.daily_stat import DailyStat
+from models.price_bucket_stat import PriceBucketStat
+from models.watchlist_count import WatchlistCount
+from models.report_listing import ReportListing
+from models.report_review import ReportReview
+from models.report_vehicle import ReportVehicle
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime
+from decimal import Decimal
+import os
+
+PRICE_BUCKET_SIZE = int(os.getenv("REPORT_PRICE_BUCKET_SIZE", 10000000))
+ACTIVE_STATUS = 'available'
+
+def event_day(value):
+    return datetime.fromisoformat(value).date() if value else datetime.utcnow().date()
+
+def price_bucket(price):
+    return int(Decimal(price) // PRICE_BUCKET_SIZE) * PRICE_BUCKET_SIZE
+
+class RollupService:
+    @staticmethod
+    def increment(model, keys, deltas):
+        stmt = insert(model).values(**keys, **deltas)
+        table = model.__table__
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={column: table.c[column] + stmt.excluded[column] for column in deltas}
+        ))
+    @staticmethod
+    def _price_contribution(listing, sign):
+        if listing is None or listing.status != ACTIVE_STATUS:
+            return
+        RollupService.increment(
+            PriceBucketStat,
+            {"brand": listing.brand, "year": listing.year, "price_bucket": price_bucket(listing.price)},
+            {"active_listings": sign, "price_sum": sign * Decimal(listing.price)}
+        )
+    @staticmethod
+    def _reattribute(listing, brand, year):
+        if listing.brand == brand and listing.year == year:
+            return
+        RollupService._price_contribution(listing, -1)
+        listing.brand = brand
+        listing.year = year
+        RollupService._price_contribution(listing, 1)
+    @staticmethod
+    def _resolve_vehicle(listing):
+        vehicle = ReportVehicle.query.get(listing.vehicle_id) if listing.vehicle_id else None
+        if vehicle:
+            RollupService._reattribute(listing, vehicle.brand, vehicle.year)
+    @staticmethod
+    def apply_vehicle(event):
+        payload = event["payload"]
+        if event["type"] == "vehicle.deleted":
+            ReportVehicle.query.filter_by(vehicle_id=int(event["aggregate_id"])).delete(synchronize_session=False)
+            return
+        stmt = insert(ReportVehicle).values(
+            vehicle_id=payload["vehicle_id"], brand=payload["brand"], model=payload["model"], year=payload["year"]
+        )
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=["vehicle_id"],
+            set_={c: stmt.excluded[c] for c in ("brand", "model", "year")}
+        ))
+        for listing in ReportListing.query.filter_by(vehicle_id=payload["vehicle_id"]).all():
+            RollupService._reattribute(listing, payload["brand"], payload["year"])
+    @staticmethod
+    def apply_listing(event):
+        payload = event["payload"]
+        listing_id = int(event["aggregate_id"])
+        listing = ReportListing.query.get(listing_id)
+        day = event_day(event["occurred_at"])
+
+        if event["type"] == "listing.deleted":
+            if listing:
+                RollupService._price_contribution(listing, -1)
+                db.session.delete(listing)
+            WatchlistCount.query.filter_by(listing_id=listing_id).delete(synchronize_session=False)
+            RollupService.increment(DailyStat, {"day": day}, {"listings_deleted": 1})
+            return
+
+        if listing is None:
+            vehicle = ReportVehicle.query.get(payload.get("vehicle_id")) if payload.get("vehicle_id") else None
+            listing = ReportListing(
+                listing_id=listing_id,
+                vehicle_id=payload.get("vehicle_id"),
+                brand=vehicle.brand if vehicle else 'unknown',
+                year=vehicle.year if vehicle else 0,
+                price=payload["price"],
+                status=payload["status"],
+                created_day=event_day(payload.get("created_at") or event["occurred_at"])
+            )
+            db.session.add(listing)
+            RollupService.increment(DailyStat, {"day": listing.created_day}, {"listings_created": 1})
+            RollupService._price_contribution(listing, 1)
+            return
+
+        if listing.brand == 'unknown' or payload.get("vehicle_id") not in (None, listing.vehicle_id):
+            listing.vehicle_id = payload.get("vehicle_id") or listing.vehicle_id
+            RollupService._resolve_vehicle(listing)
+        RollupService._price_contribution(listing, -1)
+        if payload["status"] == 'sold' and listing.status != 'sold':
+            RollupService.increment(DailyStat, {"day": day}, {"listings_sold": 1})
+        elif listing.status == 'sold' and payload["status"] != 'sold':
+            RollupService.increment(DailyStat, {"day": day}, {"listings_sold": -1})
+        listing.price = payload["price"]
+        listing.status = payload["status"]
+        RollupService._price_contribution(listing, 1)
+    @staticmethod
+    def apply_transaction(event):
+        if event["type"] != "transaction.completed":
+            return
+        payload = event["payload"]
+        RollupService.increment(
+            DailyStat,
+            {"day": event_day(event["occurred_at"])},
+            {"sales_count": 1, "sales_volume": Decimal(payload.get("price") or 0)}
+        )
+    @staticmethod
+    def apply_review(event):
+        payload = event["payload"]
+        review = ReportReview.query.get(int(event["aggregate_id"]))
+        if event["type"] == "review.deleted":
+            if review:
+                RollupService.increment(DailyStat, {"day": review.created_day}, {"reviews_created": -1, "rating_sum": -review.rating})
+                db.session.delete(review)
+            return
+        if review is None:
+            review = ReportReview(
+                review_id=int(event["aggregate_id"]),
+                rating=payload["rating"],
+                created_day=event_day(payload.get("created_at") or event["occurred_at"])
+            )
+            db.session.add(review)
+            RollupService.increment(DailyStat, {"day": review.created_day}, {"reviews_created": 1, "rating_sum": review.rating})
+            return
+        if review.rating != payload["rating"]:
+            RollupService.increment(DailyStat, {"day": review.created_day}, {"rating_sum": payload["rating"] - review.rating})
+            review.rating = payload["rating"]
+    @staticmethod
+    def apply_watchlist(event):
+        sign = 1 if event["type"] == "watchlist.added" else -1
+        RollupService.increment(WatchlistCount, {"listing_id": int(event["aggregate_id"])}, {"watchers": sign})
+        if sign > 0:
+            RollupService.increment(DailyStat, {"day": event_day(event["occurred_at"])}, {"watchlist_adds": 1})
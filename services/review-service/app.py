@@ -8,13 +8,21 @@ from flask_migrate import Migrate
 import redis
 import click
 from models.review import Review
+from models.review_aggregate import ReviewAggregate
+from models.outbox_event import OutboxEvent
 from services.reviewService import ReviewService
 from controllers.controller_api import api_bp
+from services.explainService import ExplainService
+from services.reviewAggregateService import ReviewAggregateService
+from services.benchmarkService import BenchmarkService
+from services.outboxService import OutboxService, RELAY_BATCH_SIZE, PUBLISHED_RETENTION_HOURS
+import sys
 
 load_dotenv()
 db = SQLAlchemy()
 jwt = JWTManager()
 migrate = Migrate(version_table = 'alembic_version_review')
+r = redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379"), decode_responses = True)
 
 def create_app():
     app = Flask(__name__)
@@ -29,5 +37,50 @@ def create_app():
     jwt.init_app(app)
     
     app.register_blueprint(api_bp)
+
+    @app.cli.command("outbox-relay")
+    @click.option("--batch-size", default=RELAY_BATCH_SIZE)
+    @click.option("--once", is_flag=True)
+    def outbox_relay_command(batch_size, once):
+        if once:
+            print(f"Đã phát {OutboxService.relay_batch(batch_size)} sự kiện.")
+            return
+        OutboxService.run_relay(batch_size)
+
+    @app.cli.command("purge-outbox")
+    @click.option("--retention-hours", default=PUBLISHED_RETENTION_HOURS)
+    def purge_outbox_command(retention_hours):
+        print(f"Đã xóa {OutboxService.purge_published(retention_hours)} sự kiện đã phát.")
+
+    @app.cli.command("rebuild-review-aggregates")
+    def rebuild_review_aggregates_command():
+        count = ReviewAggregateService.rebuild()
+        print(f"Đã tính lại {count} bản tổng hợp đánh giá.")
+
+    @app.cli.command("bench-reviews")
+    @click.option("--rows", default=1000000)
+    @click.option("--pages", default="0,10,100,1000,10000,49000")
+    @click.option("--runs", default=20)
+    def bench_reviews_command(rows, pages, runs):
+        results = BenchmarkService.review_pages(rows, [int(p) for p in pages.split(",")], runs)
+        print(f"{'page':>7}{'keyset p50':>13}{'keyset p95':>13}{'offset p50':>13}{'offset p95':>13}")
+        for row in results:
+            print(f"{row['page']:>7}{row['keyset_p50_ms']:>11.2f}ms{row['keyset_p95_ms']:>11.2f}ms"
+                  f"{row['offset_p50_ms']:>11.2f}ms{row['offset_p95_ms']:>11.2f}ms")
+
+    @app.cli.command("explain-hot-queries")
+    @click.option("--analyze", is_flag=True)
+    @click.option("--verbose", is_flag=True)
+    def explain_hot_queries_command(analyze, verbose):
+        failed = False
+        for result in ExplainService.explain_all(analyze):
+            status = "OK" if not result["seq_scans"] else "SEQ SCAN on " + ", ".join(result["seq_scans"])
+            failed = failed or bool(result["seq_scans"])
+            print(f"[{status}] {result['name']}")
+            if verbose or result["seq_scans"]:
+                for line in result["plan"]:
+                    print(f"    {line}")
+        if failed:
+            sys.exit(1)
     
     return app
\ No newline at end of file
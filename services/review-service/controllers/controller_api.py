@@ -1,5 +1,5 @@
 from flask import request, jsonify, Blueprint
-from services.reviewService import ReviewService
+from services.reviewService import ReviewService, REVIEW_FIELDS
 from functools import wraps
 from flask_jwt_extended import get_jwt, verify_jwt_in_request, jwt_required, get_jwt_identity
 
@@ -16,16 +16,28 @@ def admin_required():
             return fn(*args, **kwargs)
         return decorator
     return wrapper
-def serialize_review(review):
+def serialize_review(review, fields=REVIEW_FIELDS):
     if not review: return None
-    return {
-        'review_id': review.review_id,
-        'transaction_id': review.transaction_id,
-        'reviewer_id': review.reviewer_id,
-        'rating': review.rating,
-        'comment': review.comment,
-        'created_at': review.created_at.isoformat() if review.created_at else None
-    }
+    data = {field: getattr(review, field) for field in fields}
+    if data.get('created_at'):
+        data['created_at'] = data['created_at'].isoformat()
+    return data
+
+def review_page_response(loader, subject_id):
+    try:
+        fields = ReviewService.parse_fields(request.args.get("fields"))
+        reviews, next_cursor = loader(
+            subject_id,
+            request.args.get("cursor"),
+            request.args.get("limit", type=int),
+            fields
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({
+        "items": [serialize_review(review, fields) for review in reviews],
+        "next_cursor": next_cursor
+    }), 200
 @api_bp.route('/create-review')
 @jwt_required()
 def create_review():
@@ -57,11 +69,23 @@ def update_review(review_id):
     if not review:
         return jsonify({"error": message})
     return jsonify({"message": message, "review": serialize_review(review)})
-@api_bp('/review/<int:review_id>', methods = ["DELETE"])
+@api_bp.route('/review/<int:review_id>', methods = ["DELETE"])
 @jwt_required()
 def delete_review(review_id):
     current_user_id = int(get_jwt_identity())
     success, message = ReviewService.delete_review(review_id, current_user_id)
     if not success:
         return jsonify({"error": message})
-    return jsonify({"message": message})
\ No newline at end of file
+    return jsonify({"message": message})
+@api_bp.route('/reviews/transaction/<int:transaction_id>', methods = ["GET"])
+def get_reviews_by_transaction(transaction_id):
+    return review_page_response(ReviewService.get_reviews_by_transaction, transaction_id)
+@api_bp.route('/reviews/reviewer/<int:reviewer_id>', methods = ["GET"])
+def get_reviews_by_reviewer(reviewer_id):
+    return review_page_response(ReviewService.get_reviews_by_reviewer, reviewer_id)
+@api_bp.route('/reviews/summary/<scope>/<int:subject_id>', methods = ["GET"])
+def get_rating_summary(scope, subject_id):
+    summary = ReviewService.get_rating_summary(scope, subject_id)
+    if summary is None:
+        return jsonify({"error": "scope phải là 'transaction' hoặc 'reviewer'"}), 400
+    return jsonify(summary), 200
@@ -0,0 +1,33 @@
+"""initial review schema
+
+Revision ID: 5b2d9e4a7c01
+Revises: 
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b2d9e4a7c01'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('reviews',
+    sa.Column('review_id', sa.Integer(), nullable=False),
+    sa.Column('transaction_id', sa.Integer(), nullable=False),
+    sa.Column('reviewer_id', sa.Integer(), nullable=False),
+    sa.Column('rating', sa.Integer(), nullable=False),
+    sa.Column('comment', sa.String(length=500), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.CheckConstraint('rating >= 0 and rating <= 5', name='check_rating_range'),
+    sa.PrimaryKeyConstraint('review_id')
+    )
+
+
+def downgrade():
+    op.drop_table('reviews')
@@ -0,0 +1,30 @@
+"""hot query indexes
+
+Revision ID: c7a3f0e18d42
+Revises: 5b2d9e4a7c01
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7a3f0e18d42'
+down_revision = '5b2d9e4a7c01'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        DELETE FROM reviews a USING reviews b
+        WHERE a.transaction_id = b.transaction_id AND a.reviewer_id = b.reviewer_id AND a.review_id > b.review_id
+    """)
+    op.create_unique_constraint('uq_reviews_transaction_reviewer', 'reviews', ['transaction_id', 'reviewer_id'])
+    op.create_index('ix_reviews_reviewer_created', 'reviews', ['reviewer_id', 'created_at', 'review_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_reviews_reviewer_created', table_name='reviews')
+    op.drop_constraint('uq_reviews_transaction_reviewer', 'reviews', type_='unique')
@@ -0,0 +1,48 @@
+"""review aggregates
+
+Revision ID: e2b84d6f1a97
+Revises: c7a3f0e18d42
+Create Date: 2026-10-18 12:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b84d6f1a97'
+down_revision = 'c7a3f0e18d42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('review_aggregates',
+    sa.Column('scope', sa.String(length=20), nullable=False),
+    sa.Column('subject_id', sa.Integer(), nullable=False),
+    sa.Column('review_count', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Integer(), nullable=False),
+    sa.Column('rating_0', sa.Integer(), nullable=False),
+    sa.Column('rating_1', sa.Integer(), nullable=False),
+    sa.Column('rating_2', sa.Integer(), nullable=False),
+    sa.Column('rating_3', sa.Integer(), nullable=False),
+    sa.Column('rating_4', sa.Integer(), nullable=False),
+    sa.Column('rating_5', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('scope', 'subject_id')
+    )
+    for scope, column in (('transaction', 'transaction_id'), ('reviewer', 'reviewer_id')):
+        op.execute(f"""
+            INSERT INTO review_aggregates (scope, subject_id, review_count, rating_sum,
+                rating_0, rating_1, rating_2, rating_3, rating_4, rating_5, updated_at)
+            SELECT '{scope}', {column}, count(*), coalesce(sum(rating), 0),
+                count(*) FILTER (WHERE rating = 0), count(*) FILTER (WHERE rating = 1),
+                count(*) FILTER (WHERE rating = 2), count(*) FILTER (WHERE rating = 3),
+                count(*) FILTER (WHERE rating = 4), count(*) FILTER (WHERE rating = 5),
+                now()
+            FROM reviews GROUP BY {column}
+        """)
+
+
+def downgrade():
+    op.drop_table('review_aggregates')
@@ -0,0 +1,24 @@
+"""review transaction index
+
+Revision ID: f91c3b5a0d68
+Revises: e2b84d6f1a97
+Create Date: 2026-10-18 12:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f91c3b5a0d68'
+down_revision = 'e2b84d6f1a97'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_reviews_transaction_created', 'reviews', ['transaction_id', 'created_at', 'review_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_reviews_transaction_created', table_name='reviews')
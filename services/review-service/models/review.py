@@ -1,11 +1,16 @@
 from app import db
 from datetime import datetime, timezone
-from sqlalchemy import CheckConstraint
+from sqlalchemy import CheckConstraint, UniqueConstraint, Index
 from sqlalchemy.orm import validates        
 
 class Review(db.Model):
     __tablename__ = 'reviews'
-    __table_args__ = (CheckConstraint('rating >= 0 and rating <= 5', name = 'check_rating_range'),)
+    __table_args__ = (
+        CheckConstraint('rating >= 0 and rating <= 5', name = 'check_rating_range'),
+        UniqueConstraint('transaction_id', 'reviewer_id', name = 'uq_reviews_transaction_reviewer'),
+        Index('ix_reviews_reviewer_created', 'reviewer_id', 'created_at', 'review_id'),
+        Index('ix_reviews_transaction_created', 'transaction_id', 'created_at', 'review_id'),
+    )
 
     review_id = db.Column(db.Integer, primary_key=True)
     transaction_id = db.Column(db.Integer, nullable=False)
@@ -0,0 +1,30 @@
+from app import db
+from datetime import datetime, timezone
+
+RATING_VALUES = range(0, 6)
+
+class ReviewAggregate(db.Model):
+    __tablename__ = 'review_aggregates'
+
+    scope = db.Column(db.String(20), primary_key=True)
+    subject_id = db.Column(db.Integer, primary_key=True)
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    rating_0 = db.Column(db.Integer, nullable=False, default=0)
+    rating_1 = db.Column(db.Integer, nullable=False, default=0)
+    rating_2 = db.Column(db.Integer, nullable=False, default=0)
+    rating_3 = db.Column(db.Integer, nullable=False, default=0)
+    rating_4 = db.Column(db.Integer, nullable=False, default=0)
+    rating_5 = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+
+    @property
+    def average(self):
+        return round(self.rating_sum / self.review_count, 2) if self.review_count else None
+
+    @property
+    def histogram(self):
+        return {str(r): getattr(self, f"rating_{r}") for r in RATING_VALUES}
+
+    def __repr__(self):
+        return f'<ReviewAggregate {self.scope}:{self.subject_id} {self.review_count}>'
@@ -0,0 +1,63 @@
+from app import db
+from models.review import Review
+from services.reviewService import ReviewService
+from sqlalchemy import text
+import statistics
+import time
+
+BENCH_REVIEWER_ID = 2000000000
+
+SEED_REVIEWS_SQL = """
+INSERT INTO reviews (transaction_id, reviewer_id, rating, comment, created_at)
+SELECT
+    2000000000 - g,
+    :reviewer_id,
+    g % 6,
+    (ARRAY['Giao dịch nhanh gọn','Xe đúng mô tả','Người bán nhiệt tình','Giấy tờ đầy đủ','Giá hợp lý'])[1 + g % 5] ||
+    repeat(' Rất hài lòng.', 1 + g % 20),
+    now() - (g || ' seconds')::interval
+FROM generate_series(1, :rows) AS g
+"""
+
+class BenchmarkService:
+    @staticmethod
+    def _time_ms(fn, runs):
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - started) * 1000)
+            db.session.expunge_all()
+        samples.sort()
+        return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+    @staticmethod
+    def review_pages(rows, depths, runs=20, limit=20):
+        base = Review.query.filter_by(reviewer_id=BENCH_REVIEWER_ID).order_by(Review.created_at.desc(), Review.review_id.desc())
+        results = []
+        try:
+            db.session.execute(text(SEED_REVIEWS_SQL), {"reviewer_id": BENCH_REVIEWER_ID, "rows": rows})
+            db.session.execute(text("ANALYZE reviews"))
+            for depth in sorted(depths):
+                offset = depth * limit
+                if offset >= rows:
+                    continue
+                cursor = None
+                if offset:
+                    anchor = base.offset(offset - 1).limit(1).first()
+                    cursor = ReviewService.encode_cursor(anchor)
+                keyset_p50, keyset_p95 = BenchmarkService._time_ms(
+                    lambda: ReviewService.get_reviews_by_reviewer(BENCH_REVIEWER_ID, cursor, limit), runs
+                )
+                offset_p50, offset_p95 = BenchmarkService._time_ms(
+                    lambda: base.offset(offset).limit(limit).all(), runs
+                )
+                results.append({
+                    "page": depth + 1,
+                    "keyset_p50_ms": keyset_p50,
+                    "keyset_p95_ms": keyset_p95,
+                    "offset_p50_ms": offset_p50,
+                    "offset_p95_ms": offset_p95,
+                })
+        finally:
+            db.session.rollback()
+        return results
@@ -0,0 +1,31 @@
+from app import db
+from models.review import Review
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+import re
+
+SEQ_SCAN_PATTERN = re.compile(r"Seq Scan on (\w+)")
+
+class ExplainService:
+    @staticmethod
+    def hot_queries():
+        return [
+            ("review by transaction and reviewer",
+             Review.query.filter_by(transaction_id=1, reviewer_id=1)),
+            ("reviews by transaction, newest first",
+             Review.query.filter_by(transaction_id=1).order_by(Review.created_at.desc(), Review.review_id.desc()).limit(21)),
+            ("reviews by reviewer, newest first",
+             Review.query.filter_by(reviewer_id=1).order_by(Review.created_at.desc(), Review.review_id.desc()).limit(21)),
+        ]
+    @staticmethod
+    def explain_all(analyze=False):
+        results = []
+        for name, query in ExplainService.hot_queries():
+            sql = str(query.statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            db.session.execute(text("SET LOCAL enable_seqscan = off"))
+            prefix = "EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN "
+            plan = [row[0] for row in db.session.execute(text(prefix + sql))]
+            db.session.rollback()
+            seq_scans = sorted(set(SEQ_SCAN_PATTERN.findall("\n".join(plan))))
+            results.append({"name": name, "plan": plan, "seq_scans": seq_scans})
+        return results
@@ -0,0 +1,78 @@
+from app import db
+from models.review import Review
+from models.review_aggregate import ReviewAggregate, RATING_VALUES
+from sqlalchemy import func, case, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timezone
+
+SCOPES = {"transaction": Review.transaction_id, "reviewer": Review.reviewer_id}
+
+class ReviewAggregateService:
+    @staticmethod
+    def _apply(review, rating_deltas, count_delta):
+        now = datetime.now(timezone.utc)
+        rating_sum = sum(rating * delta for rating, delta in rating_deltas.items())
+        for scope, column in SCOPES.items():
+            values = {
+                "scope": scope,
+                "subject_id": getattr(review, column.key),
+                "review_count": count_delta,
+                "rating_sum": rating_sum,
+                "updated_at": now,
+                **{f"rating_{r}": rating_deltas.get(r, 0) for r in RATING_VALUES}
+            }
+            stmt = insert(ReviewAggregate).values(**values)
+            table = ReviewAggregate.__table__
+            increments = {
+                name: table.c[name] + stmt.excluded[name]
+                for name in ["review_count", "rating_sum", *(f"rating_{r}" for r in RATING_VALUES)]
+            }
+            db.session.execute(stmt.on_conflict_do_update(
+                index_elements=["scope", "subject_id"],
+                set_={**increments, "updated_at": stmt.excluded.updated_at}
+            ))
+    @staticmethod
+    def review_added(review):
+        ReviewAggregateService._apply(review, {review.rating: 1}, 1)
+    @staticmethod
+    def review_removed(review):
+        ReviewAggregateService._apply(review, {review.rating: -1}, -1)
+    @staticmethod
+    def rating_changed(review, old_rating):
+        if old_rating == review.rating:
+            return
+        ReviewAggregateService._apply(review, {old_rating: -1, review.rating: 1}, 0)
+    @staticmethod
+    def get_summary(scope, subject_id):
+        if scope not in SCOPES:
+            return None
+        aggregate = ReviewAggregate.query.get((scope, subject_id))
+        return {
+            "scope": scope,
+            "subject_id": subject_id,
+            "count": aggregate.review_count if aggregate else 0,
+            "sum": aggregate.rating_sum if aggregate else 0,
+            "average": aggregate.average if aggregate else None,
+            "histogram": aggregate.histogram if aggregate else {str(r): 0 for r in RATING_VALUES}
+        }
+    @staticmethod
+    def rebuild():
+        table = ReviewAggregate.__table__
+        now = datetime.now(timezone.utc)
+        db.session.execute(table.delete())
+        for scope, column in SCOPES.items():
+            rows = select(
+                literal(scope),
+                column,
+                func.count(Review.review_id),
+                func.coalesce(func.sum(Review.rating), 0),
+                literal(now),
+                *(func.count(case((Review.rating == r, 1))) for r in RATING_VALUES)
+            ).group_by(column)
+            db.session.execute(table.insert().from_select(
+                ["scope", "subject_id", "review_count", "rating_sum", "updated_at",
+                 *(f"rating_{r}" for r in RATING_VALUES)],
+                rows
+            ))
+        db.session.commit()
+        return ReviewAggregate.query.count()
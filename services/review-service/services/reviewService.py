@@ -1,9 +1,30 @@
 from models.review import Review
+from services.reviewAggregateService import ReviewAggregateService
+from services.outboxService import OutboxService
 from app import db  
+from sqlalchemy import tuple_
+from sqlalchemy.orm import load_only
+from datetime import datetime
+import base64
+import binascii
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+REVIEW_FIELDS = ("review_id", "transaction_id", "reviewer_id", "rating", "comment", "created_at")
+
+def review_payload(review):
+    return {
+        'review_id': review.review_id,
+        'transaction_id': review.transaction_id,
+        'reviewer_id': review.reviewer_id,
+        'rating': review.rating,
+        'comment': review.comment,
+        'created_at': review.created_at.isoformat() if review.created_at else None
+    }
+
 class ReviewService:
     @staticmethod
     def create_review(transaction_id, reviewer_id, rating, comment=None):
@@ -28,6 +49,9 @@ class ReviewService:
                 comment=comment
             )
             db.session.add(review)
+            db.session.flush()
+            ReviewAggregateService.review_added(review)
+            OutboxService.record("review", "created", review.review_id, review_payload(review))
             db.session.commit()
             return review, None
 
@@ -40,12 +64,54 @@ class ReviewService:
 
 
     @staticmethod
-    def get_reviews_by_transaction(transaction_id):
-        return Review.query.filter_by(transaction_id=transaction_id).all()
+    def encode_cursor(review):
+        raw = f"{review.created_at.isoformat()}|{review.review_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            created_at, review_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+            return datetime.fromisoformat(created_at), int(review_id)
+        except (ValueError, UnicodeDecodeError, binascii.Error):
+            raise ValueError("Invalid cursor")
+
+    @staticmethod
+    def parse_fields(fields):
+        if not fields:
+            return REVIEW_FIELDS
+        requested = tuple(f.strip() for f in fields.split(",") if f.strip())
+        unknown = [f for f in requested if f not in REVIEW_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return requested
+
+    @staticmethod
+    def _page(query, cursor, limit, fields=REVIEW_FIELDS):
+        limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+        columns = {"review_id", "created_at", *fields}
+        query = query.options(load_only(*(getattr(Review, c) for c in REVIEW_FIELDS if c in columns)))
+        if cursor:
+            created_at, review_id = ReviewService.decode_cursor(cursor)
+            query = query.filter(tuple_(Review.created_at, Review.review_id) < tuple_(created_at, review_id))
+        reviews = query.order_by(Review.created_at.desc(), Review.review_id.desc()).limit(limit + 1).all()
+        next_cursor = None
+        if len(reviews) > limit:
+            reviews = reviews[:limit]
+            next_cursor = ReviewService.encode_cursor(reviews[-1])
+        return reviews, next_cursor
+
+    @staticmethod
+    def get_reviews_by_transaction(transaction_id, cursor=None, limit=DEFAULT_PAGE_SIZE, fields=REVIEW_FIELDS):
+        return ReviewService._page(Review.query.filter_by(transaction_id=transaction_id), cursor, limit, fields)
+
+    @staticmethod
+    def get_reviews_by_reviewer(reviewer_id, cursor=None, limit=DEFAULT_PAGE_SIZE, fields=REVIEW_FIELDS): 
+        return ReviewService._page(Review.query.filter_by(reviewer_id=reviewer_id), cursor, limit, fields)
 
     @staticmethod
-    def get_reviews_by_reviewer(reviewer_id): 
-        return Review.query.filter_by(reviewer_id=reviewer_id).order_by(Review.created_at.desc()).all()
+    def get_rating_summary(scope, subject_id):
+        return ReviewAggregateService.get_summary(scope, subject_id)
 
     @staticmethod
     def get_review_by_id_and_reviewer(review_id, user_id): 
@@ -61,6 +127,8 @@ class ReviewService:
             return False, "Bạn không có quyền xóa đánh giá này."
 
         try:
+            ReviewAggregateService.review_removed(review)
+            OutboxService.record("review", "deleted", review.review_id, review_payload(review))
             db.session.delete(review)
             db.session.commit()
             return True, "Đánh giá đã được xóa thành công."
@@ -79,6 +147,7 @@ class ReviewService:
             return None, "Bạn không có quyền sửa đánh giá này."
 
         updated = False
+        old_rating = review.rating
         try:
             if data["rating"] is not None:
                 try:
@@ -94,6 +163,8 @@ class ReviewService:
                 updated = True
 
             if updated:
+                ReviewAggregateService.rating_changed(review, old_rating)
+                OutboxService.record("review", "updated", review.review_id, review_payload(review))
                 db.session.commit()
                 return review, None 
             else:
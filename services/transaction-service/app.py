@@ -0,0 +1,80 @@
+import os
+from flask import Flask
+from flask_cors import CORS
+from extensions import db, jwt, migrate, r
+import click
+from models.transaction import Transaction
+from models.idempotency_key import IdempotencyKey
+from models.outbox_event import OutboxEvent
+from controllers.controller_api import api_bp
+from controllers.internal_controller import internal_bp
+from services.idempotencyService import IdempotencyService
+from services.transactionService import TransactionService, SWEEP_INTERVAL, STALE_PENDING_SECONDS
+from services.loadTestService import LoadTestService
+from services.outboxService import OutboxService, RELAY_BATCH_SIZE, PUBLISHED_RETENTION_HOURS
+import sys
+
+
+def create_app():
+    app = Flask(__name__)
+    CORS(app)
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv("DATABASE_URL")
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "secretkey")
+    app.config['INTERNAL_SERVICE_TOKEN'] = os.getenv('INTERNAL_SERVICE_TOKEN')
+
+    db.init_app(app)
+    migrate.init_app(app, db)
+    jwt.init_app(app)
+
+    app.register_blueprint(api_bp)
+    app.register_blueprint(internal_bp)
+
+    @app.cli.command("outbox-relay")
+    @click.option("--batch-size", default=RELAY_BATCH_SIZE)
+    @click.option("--once", is_flag=True)
+    def outbox_relay_command(batch_size, once):
+        if once:
+            print(f"Đã phát {OutboxService.relay_batch(batch_size)} sự kiện.")
+            return
+        OutboxService.run_relay(batch_size)
+
+    @app.cli.command("purge-outbox")
+    @click.option("--retention-hours", default=PUBLISHED_RETENTION_HOURS)
+    def purge_outbox_command(retention_hours):
+        print(f"Đã xóa {OutboxService.purge_published(retention_hours)} sự kiện đã phát.")
+
+    @app.cli.command("purge-idempotency-keys")
+    @click.option("--ttl-hours", default=None, type=int)
+    def purge_idempotency_keys_command(ttl_hours):
+        deleted = IdempotencyService.purge_expired(ttl_hours) if ttl_hours else IdempotencyService.purge_expired()
+        print(f"Đã xóa {deleted} idempotency key hết hạn.")
+
+    @app.cli.command("sweep-stale-purchases")
+    @click.option("--interval", default=SWEEP_INTERVAL)
+    @click.option("--max-age-seconds", default=STALE_PENDING_SECONDS)
+    @click.option("--once", is_flag=True)
+    def sweep_stale_purchases_command(interval, max_age_seconds, once):
+        if once:
+            failed, expired = TransactionService.sweep(max_age_seconds)
+            print(f"Đã hủy {failed} giao dịch treo, xóa {expired} idempotency key đang xử lý.")
+            return
+        TransactionService.run_sweeper(interval, max_age_seconds)
+
+    @app.cli.command("load-test-purchase")
+    @click.option("--listing-id", required=True, type=int)
+    @click.option("--url", default="http://localhost:5003")
+    @click.option("--buyers", default=200)
+    @click.option("--concurrency", default=50)
+    @click.option("--retries", default=2)
+    def load_test_purchase_command(listing_id, url, buyers, concurrency, retries):
+        report = LoadTestService.purchase_storm(url, listing_id, buyers, concurrency, retries)
+        for key, value in report.items():
+            print(f"{key:>24}: {value}")
+        if report["completed_transactions"] != 1 or report["first_attempt_codes"].get(201, 0) != 1 \
+                or report["inconsistent_retries"]:
+            print("FAILED: expected exactly one winning purchase and consistent replays.")
+            sys.exit(1)
+        print("OK: exactly one buyer won and every retry replayed its original response.")
+
+    return app
@@ -0,0 +1,13 @@
+from ev_common.service_client import get_client
+import os
+
+LISTING_SERVICE_URL = os.environ.get('LISTING_SERVICE_URL', 'http://listing-service:5001')
+
+def listing_client():
+    return get_client("listing-service", LISTING_SERVICE_URL)
+
+def reserve_listing(listing_id, transaction_id):
+    return listing_client().post(f"/internal/listings/{listing_id}/reserve", json={"transaction_id": transaction_id})
+
+def release_listing(listing_id, transaction_id):
+    return listing_client().post(f"/internal/listings/{listing_id}/release", json={"transaction_id": transaction_id})
@@ -0,0 +1,94 @@
+from flask import request, jsonify, Blueprint
+from functools import wraps
+from flask_jwt_extended import get_jwt, verify_jwt_in_request, jwt_required, get_jwt_identity
+from services.transactionService import (
+    TransactionService, LISTING_NOT_FOUND, LISTING_UNAVAILABLE, LISTING_IN_PURCHASE, LISTING_SERVICE_ERROR
+)
+from services.idempotencyService import IdempotencyService, MAX_KEY_LENGTH
+
+api_bp = Blueprint('api', __name__, url_prefix='/api')
+
+PURCHASE_ERROR_CODES = {
+    LISTING_NOT_FOUND: 404,
+    LISTING_UNAVAILABLE: 409,
+    LISTING_IN_PURCHASE: 409,
+    LISTING_SERVICE_ERROR: 503,
+}
+
+def admin_required():
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            verify_jwt_in_request()
+            claim = get_jwt()
+            if claim.get("role")!= "Admin":
+                return jsonify({"error": "Admin access required"}), 403
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
+
+def serialize_transaction(transaction):
+    if not transaction: return None
+    return {
+        'transaction_id': transaction.transaction_id,
+        'listing_id': transaction.listing_id,
+        'buyer_id': transaction.buyer_id,
+        'vehicle_id': transaction.vehicle_id,
+        'price': float(transaction.price) if transaction.price is not None else None,
+        'status': transaction.status,
+        'failure_reason': transaction.failure_reason,
+        'created_at': transaction.created_at.isoformat() if transaction.created_at else None
+    }
+
+@api_bp.route('/transactions', methods=['POST'])
+@jwt_required()
+def purchase():
+    buyer_id = int(get_jwt_identity())
+    key = request.headers.get('Idempotency-Key')
+    if not key or len(key) > MAX_KEY_LENGTH:
+        return jsonify({"error": f"Idempotency-Key header is required (max {MAX_KEY_LENGTH} characters)"}), 400
+    data = request.get_json(silent=True) or {}
+    try:
+        listing_id = int(data.get("listing_id"))
+    except (TypeError, ValueError):
+        return jsonify({"error": "listing_id must be an integer"}), 400
+
+    key_id, replay = IdempotencyService.begin(buyer_id, key, IdempotencyService.request_hash({"listing_id": listing_id}))
+    if replay:
+        body, status_code = replay
+        response = jsonify(body)
+        response.headers['Idempotent-Replayed'] = 'true'
+        return response, status_code
+
+    try:
+        transaction, message = TransactionService.purchase(buyer_id, listing_id)
+    except Exception:
+        IdempotencyService.abandon(key_id)
+        raise
+    if transaction:
+        body, status_code = {"message": message, "transaction": serialize_transaction(transaction)}, 201
+    else:
+        body, status_code = {"error": message}, PURCHASE_ERROR_CODES.get(message, 400)
+    IdempotencyService.complete(key_id, body, status_code)
+    return jsonify(body), status_code
+
+@api_bp.route('/transactions/me', methods=['GET'])
+@jwt_required()
+def my_transactions():
+    buyer_id = int(get_jwt_identity())
+    transactions, next_cursor = TransactionService.get_transactions_by_buyer(
+        buyer_id,
+        request.args.get("cursor", type=int),
+        request.args.get("limit", type=int)
+    )
+    return jsonify({"items": [serialize_transaction(t) for t in transactions], "next_cursor": next_cursor}), 200
+
+@api_bp.route('/transactions/<int:transaction_id>', methods=['GET'])
+@jwt_required()
+def get_transaction(transaction_id):
+    transaction = TransactionService.get_transaction(transaction_id)
+    if not transaction:
+        return jsonify({"error": "Transaction not found."}), 404
+    if transaction.buyer_id != int(get_jwt_identity()) and get_jwt().get("role") != "Admin":
+        return jsonify({"error": "Transaction not found."}), 404
+    return jsonify(serialize_transaction(transaction)), 200
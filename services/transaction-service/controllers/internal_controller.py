@@ -0,0 +1,21 @@
+from flask import Blueprint, jsonify, request, current_app
+from functools import wraps
+from services.transactionService import TransactionService
+
+internal_bp = Blueprint('internal', __name__, url_prefix='/internal')
+
+def internal_required():
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            token = current_app.config.get('INTERNAL_SERVICE_TOKEN')
+            if not token or request.headers.get('X-Internal-Token') != token:
+                return jsonify({"error": "Internal access required"}), 403
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
+
+@internal_bp.route('/stats', methods=['GET'])
+@internal_required()
+def stats():
+    return jsonify(TransactionService.stats()), 200
@@ -0,0 +1,58 @@
+"""initial transaction schema
+
+Revision ID: 1a6e0c3f9b24
+Revises: 
+Create Date: 2026-10-18 13:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '1a6e0c3f9b24'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('transactions',
+    sa.Column('transaction_id', sa.Integer(), nullable=False),
+    sa.Column('listing_id', sa.Integer(), nullable=False),
+    sa.Column('buyer_id', sa.Integer(), nullable=False),
+    sa.Column('vehicle_id', sa.Integer(), nullable=True),
+    sa.Column('price', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('status', sa.Enum('pending', 'completed', 'failed', name='transaction_statuses'), nullable=False),
+    sa.Column('failure_reason', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('transaction_id')
+    )
+    op.create_index('ux_transactions_listing_active', 'transactions', ['listing_id'], unique=True,
+                    postgresql_where=sa.text("status IN ('pending', 'completed')"))
+    op.create_index('ix_transactions_buyer_created', 'transactions', ['buyer_id', 'transaction_id'], unique=False)
+    op.create_table('idempotency_keys',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('key', sa.String(length=100), nullable=False),
+    sa.Column('request_hash', sa.String(length=64), nullable=False),
+    sa.Column('status', sa.Enum('in_progress', 'completed', name='idempotency_statuses'), nullable=False),
+    sa.Column('response_code', sa.Integer(), nullable=True),
+    sa.Column('response_body', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'key', name='uq_idempotency_keys_user_key')
+    )
+    op.create_index('ix_idempotency_keys_created_at', 'idempotency_keys', ['created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_idempotency_keys_created_at', table_name='idempotency_keys')
+    op.drop_table('idempotency_keys')
+    op.drop_index('ix_transactions_buyer_created', table_name='transactions')
+    op.drop_index('ux_transactions_listing_active', table_name='transactions')
+    op.drop_table('transactions')
+    sa.Enum(name='idempotency_statuses').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='transaction_statuses').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,25 @@
+"""pending transactions index
+
+Revision ID: 3b7f0d9e2a65
+Revises: 6e2d9b4a1f70
+Create Date: 2026-10-19 09:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7f0d9e2a65'
+down_revision = '6e2d9b4a1f70'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_transactions_pending_created', 'transactions', ['created_at'], unique=False,
+                    postgresql_where=sa.text("status = 'pending'"))
+
+
+def downgrade():
+    op.drop_index('ix_transactions_pending_created', table_name='transactions', postgresql_where=sa.text("status = 'pending'"))
@@ -0,0 +1,37 @@
+"""outbox events
+
+Revision ID: 6e2d9b4a1f70
+Revises: 1a6e0c3f9b24
+Create Date: 2026-10-18 15:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '6e2d9b4a1f70'
+down_revision = '1a6e0c3f9b24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('outbox_events',
+    sa.Column('event_id', sa.BigInteger(), nullable=False),
+    sa.Column('aggregate', sa.String(length=50), nullable=False),
+    sa.Column('aggregate_id', sa.String(length=64), nullable=False),
+    sa.Column('event_type', sa.String(length=100), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('published_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('event_id')
+    )
+    op.create_index('ix_outbox_events_unpublished', 'outbox_events', ['event_id'], unique=False,
+                    postgresql_where=sa.text('published_at IS NULL'))
+
+
+def downgrade():
+    op.drop_index('ix_outbox_events_unpublished', table_name='outbox_events', postgresql_where=sa.text('published_at IS NULL'))
+    op.drop_table('outbox_events')
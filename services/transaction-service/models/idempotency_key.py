@@ -0,0 +1,21 @@
+from extensions import db
+from datetime import datetime, timezone
+from sqlalchemy.dialects.postgresql import JSONB
+
+class IdempotencyKey(db.Model):
+    __tablename__ = 'idempotency_keys'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'key', name='uq_idempotency_keys_user_key'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, nullable=False)
+    key = db.Column(db.String(100), nullable=False)
+    request_hash = db.Column(db.String(64), nullable=False)
+    status = db.Column(db.Enum('in_progress', 'completed', name='idempotency_statuses'), default='in_progress', nullable=False)
+    response_code = db.Column(db.Integer, nullable=True)
+    response_body = db.Column(JSONB, nullable=True)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<IdempotencyKey {self.user_id}:{self.key} ({self.status})>"
@@ -0,0 +1,26 @@
+from extensions import db
+from datetime import datetime, timezone
+
+ACTIVE_STATUSES = ('pending', 'completed')
+
+class Transaction(db.Model):
+    __tablename__ = 'transactions'
+    __table_args__ = (
+        db.Index('ux_transactions_listing_active', 'listing_id', unique=True,
+                 postgresql_where=db.text("status IN ('pending', 'completed')")),
+        db.Index('ix_transactions_buyer_created', 'buyer_id', 'transaction_id'),
+        db.Index('ix_transactions_pending_created', 'created_at', postgresql_where=db.text("status = 'pending'")),
+    )
+
+    transaction_id = db.Column(db.Integer, primary_key=True)
+    listing_id = db.Column(db.Integer, nullable=False)
+    buyer_id = db.Column(db.Integer, nullable=False)
+    vehicle_id = db.Column(db.Integer, nullable=True)
+    price = db.Column(db.Numeric(10, 2), nullable=True)
+    status = db.Column(db.Enum('pending', 'completed', 'failed', name='transaction_statuses'), default='pending', nullable=False)
+    failure_reason = db.Column(db.String(255), nullable=True)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+
+    def __repr__(self):
+        return f"<Transaction {self.transaction_id} listing={self.listing_id} ({self.status})>"
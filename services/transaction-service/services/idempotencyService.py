@@ -0,0 +1,63 @@
+from extensions import db
+from models.idempotency_key import IdempotencyKey
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
+import os
+
+IDEMPOTENCY_KEY_TTL_HOURS = int(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", 24))
+MAX_KEY_LENGTH = 100
+
+class IdempotencyService:
+    @staticmethod
+    def request_hash(payload):
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+    @staticmethod
+    def begin(user_id, key, request_hash):
+        row = db.session.execute(
+            insert(IdempotencyKey)
+            .values(user_id=user_id, key=key, request_hash=request_hash, status='in_progress',
+                    created_at=datetime.now(timezone.utc))
+            .on_conflict_do_nothing(constraint='uq_idempotency_keys_user_key')
+            .returning(IdempotencyKey.id)
+        ).first()
+        db.session.commit()
+        if row:
+            return row.id, None
+        existing = IdempotencyKey.query.filter_by(user_id=user_id, key=key).first()
+        if existing is None or existing.status == 'in_progress':
+            return None, ({"error": "A request with this Idempotency-Key is still in progress."}, 409)
+        if existing.request_hash != request_hash:
+            return None, ({"error": "Idempotency-Key was already used for a different request."}, 422)
+        return None, (existing.response_body, existing.response_code)
+    @staticmethod
+    def complete(key_id, body, status_code):
+        if status_code >= 500:
+            return IdempotencyService.abandon(key_id)
+        IdempotencyKey.query.filter_by(id=key_id).update(
+            {"status": "completed", "response_code": status_code, "response_body": body},
+            synchronize_session=False
+        )
+        db.session.commit()
+    @staticmethod
+    def abandon(key_id):
+        db.session.rollback()
+        IdempotencyKey.query.filter_by(id=key_id).delete(synchronize_session=False)
+        db.session.commit()
+    @staticmethod
+    def purge_expired(ttl_hours=IDEMPOTENCY_KEY_TTL_HOURS):
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=ttl_hours)
+        deleted = IdempotencyKey.query.filter(
+            IdempotencyKey.created_at < cutoff, IdempotencyKey.status == 'completed'
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
+    @staticmethod
+    def expire_in_progress(max_age_seconds):
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age_seconds)
+        deleted = IdempotencyKey.query.filter(
+            IdempotencyKey.created_at < cutoff, IdempotencyKey.status == 'in_progress'
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
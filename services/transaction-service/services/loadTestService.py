@@ -0,0 +1,61 @@
+from models.transaction import Transaction
+from flask_jwt_extended import create_access_token
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from collections import Counter
+import requests
+import time
+import uuid
+
+LOAD_TEST_BUYER_OFFSET = 1000000
+
+class LoadTestService:
+    @staticmethod
+    def purchase_storm(base_url, listing_id, buyers=200, concurrency=50, retries=2):
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=concurrency))
+        tokens = [
+            (LOAD_TEST_BUYER_OFFSET + i, create_access_token(identity=str(LOAD_TEST_BUYER_OFFSET + i)))
+            for i in range(buyers)
+        ]
+        url = f"{base_url.rstrip('/')}/api/transactions"
+
+        def attempt(buyer):
+            buyer_id, token = buyer
+            headers = {"Authorization": f"Bearer {token}", "Idempotency-Key": str(uuid.uuid4())}
+            outcomes = []
+            for _ in range(retries + 1):
+                started = time.perf_counter()
+                try:
+                    response = session.post(url, json={"listing_id": listing_id}, headers=headers, timeout=30)
+                    status, body = response.status_code, response.json()
+                except (requests.exceptions.RequestException, ValueError):
+                    status, body = 0, None
+                outcomes.append((status, body, (time.perf_counter() - started) * 1000))
+            return buyer_id, outcomes
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(attempt, tokens))
+        elapsed = time.perf_counter() - started
+
+        first_codes = Counter(outcomes[0][0] for _, outcomes in results)
+        inconsistent_retries = sum(
+            1 for _, outcomes in results
+            if any((status, body) != (outcomes[0][0], outcomes[0][1]) for status, body, _ in outcomes[1:])
+        )
+        latencies = sorted(ms for _, outcomes in results for _, _, ms in outcomes)
+        requests_sent = len(latencies)
+        completed = Transaction.query.filter_by(listing_id=listing_id, status='completed').count()
+        return {
+            "listing_id": listing_id,
+            "buyers": buyers,
+            "requests": requests_sent,
+            "first_attempt_codes": dict(first_codes),
+            "inconsistent_retries": inconsistent_retries,
+            "completed_transactions": completed,
+            "elapsed_seconds": round(elapsed, 3),
+            "requests_per_second": round(requests_sent / elapsed, 1) if elapsed else None,
+            "p50_ms": round(latencies[len(latencies) // 2], 2) if latencies else None,
+            "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 2) if latencies else None,
+        }
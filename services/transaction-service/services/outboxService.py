@@ -0,0 +1,5 @@
+from extensions import db, r
+from models.outbox_event import OutboxEvent
+from ev_common.outbox import Outbox, RELAY_BATCH_SIZE, PUBLISHED_RETENTION_HOURS
+
+OutboxService = Outbox(db, r, OutboxEvent)
@@ -0,0 +1,159 @@
+from extensions import db
+from models.transaction import Transaction
+from clients.listing_client import reserve_listing, release_listing
+from services.outboxService import OutboxService
+from services.idempotencyService import IdempotencyService
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime, timedelta, timezone
+import requests
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+STALE_PENDING_SECONDS = int(os.getenv("STALE_PENDING_SECONDS", 300))
+SWEEP_BATCH_SIZE = int(os.getenv("SWEEP_BATCH_SIZE", 100))
+SWEEP_INTERVAL = float(os.getenv("SWEEP_INTERVAL", 60))
+
+LISTING_NOT_FOUND = "Listing not found."
+LISTING_UNAVAILABLE = "Listing is no longer available."
+LISTING_IN_PURCHASE = "Listing is already being purchased."
+LISTING_SERVICE_ERROR = "Listing service unavailable, please retry."
+PURCHASE_TIMED_OUT = "Purchase did not complete in time."
+
+def transaction_payload(transaction):
+    return {
+        'transaction_id': transaction.transaction_id,
+        'listing_id': transaction.listing_id,
+        'buyer_id': transaction.buyer_id,
+        'vehicle_id': transaction.vehicle_id,
+        'price': str(transaction.price) if transaction.price is not None else None,
+        'status': transaction.status,
+        'created_at': transaction.created_at.isoformat() if transaction.created_at else None
+    }
+
+class TransactionService:
+    @staticmethod
+    def _fail(transaction, reason):
+        transaction.status = 'failed'
+        transaction.failure_reason = reason
+        db.session.commit()
+    @staticmethod
+    def _release(transaction):
+        try:
+            response = release_listing(transaction.listing_id, transaction.transaction_id)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to release listing {transaction.listing_id}: {e}")
+            return False
+        if response.status_code != 200:
+            logger.error(f"Failed to release listing {transaction.listing_id}: HTTP {response.status_code}")
+            return False
+        return True
+    @staticmethod
+    def _abort(transaction):
+        if TransactionService._release(transaction):
+            TransactionService._fail(transaction, LISTING_SERVICE_ERROR)
+        else:
+            logger.warning(f"Leaving transaction {transaction.transaction_id} pending until its listing is released")
+    @staticmethod
+    def purchase(buyer_id, listing_id):
+        transaction = Transaction(listing_id=listing_id, buyer_id=buyer_id, status='pending')
+        db.session.add(transaction)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return None, LISTING_IN_PURCHASE
+
+        try:
+            response = reserve_listing(listing_id, transaction.transaction_id)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Reserve listing {listing_id} failed: {e}")
+            TransactionService._abort(transaction)
+            return None, LISTING_SERVICE_ERROR
+
+        if response.status_code == 200:
+            listing = response.json().get("listing", {})
+            transaction.vehicle_id = listing.get("vehicle_id")
+            transaction.price = listing.get("price")
+            transaction.status = 'completed'
+            OutboxService.record("transaction", "completed", transaction.transaction_id, transaction_payload(transaction))
+            db.session.commit()
+            return transaction, "Purchase completed."
+        if response.status_code in (404, 409):
+            reason = LISTING_NOT_FOUND if response.status_code == 404 else LISTING_UNAVAILABLE
+            TransactionService._fail(transaction, reason)
+            return None, reason
+        TransactionService._abort(transaction)
+        return None, LISTING_SERVICE_ERROR
+    @staticmethod
+    def sweep_stale_pending(max_age_seconds=STALE_PENDING_SECONDS, batch_size=SWEEP_BATCH_SIZE):
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age_seconds)
+        stale = (
+            Transaction.query
+            .filter(Transaction.status == 'pending', Transaction.created_at < cutoff)
+            .order_by(Transaction.transaction_id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        failed = 0
+        for transaction in stale:
+            if not TransactionService._release(transaction):
+                continue
+            transaction.status = 'failed'
+            transaction.failure_reason = PURCHASE_TIMED_OUT
+            failed += 1
+        db.session.commit()
+        return failed
+    @staticmethod
+    def sweep(max_age_seconds=STALE_PENDING_SECONDS, batch_size=SWEEP_BATCH_SIZE):
+        failed = TransactionService.sweep_stale_pending(max_age_seconds, batch_size)
+        expired = IdempotencyService.expire_in_progress(max_age_seconds)
+        return failed, expired
+    @staticmethod
+    def run_sweeper(interval=SWEEP_INTERVAL, max_age_seconds=STALE_PENDING_SECONDS):
+        while True:
+            try:
+                failed, expired = TransactionService.sweep(max_age_seconds)
+                if failed or expired:
+                    logger.info(f"Failed {failed} stale transactions, expired {expired} idempotency keys")
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Stale purchase sweep failed: {e}", exc_info=True)
+            time.sleep(interval)
+    @staticmethod
+    def stats():
+        by_status = dict(
+            db.session.query(Transaction.status, func.count(Transaction.transaction_id)).group_by(Transaction.status).all()
+        )
+        since = datetime.now(timezone.utc) - timedelta(hours=24)
+        volume, last_24h = db.session.query(
+            func.coalesce(func.sum(Transaction.price), 0),
+            func.count(Transaction.transaction_id).filter(Transaction.created_at >= since)
+        ).filter(Transaction.status == 'completed').one()
+        return {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "completed_volume": float(volume),
+            "completed_last_24h": last_24h
+        }
+    @staticmethod
+    def get_transaction(transaction_id):
+        return Transaction.query.get(transaction_id)
+    @staticmethod
+    def get_transactions_by_buyer(buyer_id, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+        query = Transaction.query.filter_by(buyer_id=buyer_id)
+        if cursor:
+            query = query.filter(Transaction.transaction_id < cursor)
+        transactions = query.order_by(Transaction.transaction_id.desc()).limit(limit + 1).all()
+        next_cursor = None
+        if len(transactions) > limit:
+            transactions = transactions[:limit]
+            next_cursor = transactions[-1].transaction_id
+        return transactions, next_cursor
@@ -8,14 +8,20 @@ from flask_migrate import Migrate
 import redis
 import click
 from models.user import User
+from models.outbox_event import OutboxEvent
 from services.userService import UserService
+from services.mailService import MailWorker
+from services.jobQueue import JobWorker
+from services.bulkJobService import BulkJobService, bulk_queue
+from services.outboxService import OutboxService, RELAY_BATCH_SIZE, PUBLISHED_RETENTION_HOURS
 from controllers.controller_api import api_bp
+from controllers.internal_controller import internal_bp
 
 load_dotenv()
 db = SQLAlchemy()
 jwt = JWTManager()
 migrate = Migrate(version_table = 'alembic_version_users')
-r = None
+r = redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379"), decode_responses = True)
 
 def create_app():
     app = Flask(__name__)
@@ -29,14 +35,26 @@ def create_app():
     migrate.init_app(app, db)
     jwt.init_app(app)
     
-    global r
-    redis_url = os.getenv("REDIS_URL", "redis://redis:6379")
     try:
-        r = redis.from_url(redis_url, decode_responses = True)
         r.ping()
     except redis.exceptions.ConnectionError as e:
         print(e)
     app.register_blueprint(api_bp)
+    app.register_blueprint(internal_bp)
+
+    @app.cli.command("outbox-relay")
+    @click.option("--batch-size", default=RELAY_BATCH_SIZE)
+    @click.option("--once", is_flag=True)
+    def outbox_relay_command(batch_size, once):
+        if once:
+            print(f"Đã phát {OutboxService.relay_batch(batch_size)} sự kiện.")
+            return
+        OutboxService.run_relay(batch_size)
+
+    @app.cli.command("purge-outbox")
+    @click.option("--retention-hours", default=PUBLISHED_RETENTION_HOURS)
+    def purge_outbox_command(retention_hours):
+        print(f"Đã xóa {OutboxService.purge_published(retention_hours)} sự kiện đã phát.")
     @app.cli.command("create-admin")
     @click.argument("username")
     @click.argument("email")
@@ -58,4 +76,15 @@ def create_app():
             else:
                 print(f"Tài khoản admin '{username}' đã được tạo thành công.")
             
+
+    @app.cli.command("mail-worker")
+    @click.option("--worker-id", default=None)
+    def mail_worker_command(worker_id):
+        MailWorker(worker_id).run_forever()
+
+    @app.cli.command("bulk-worker")
+    @click.option("--worker-id", default=None)
+    def bulk_worker_command(worker_id):
+        JobWorker(bulk_queue, BulkJobService.handler(UserService.bulk_moderate_chunk), worker_id).run_forever()
+
     return app
\ No newline at end of file
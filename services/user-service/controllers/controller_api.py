@@ -1,7 +1,9 @@
 from flask import request, Blueprint, jsonify
 from flask_jwt_extended import (create_access_token, get_jwt, get_jwt_identity, jwt_required, verify_jwt_in_request)
 from app import jwt
-from services.userService import UserService
+from services.userService import UserService, BULK_ACTIONS
+from services.bulkJobService import BulkJobService, BULK_SYNC_LIMIT, parse_ids
+from services.passwordHasher import PasswordHasherBusy
 from functools import wraps
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
@@ -27,16 +29,29 @@ def admin_required():
                 return jsonify(error="Admin only!"), 403
         return decorator
     return wrapper
+@api_bp.errorhandler(PasswordHasherBusy)
+def password_hasher_busy(e):
+    response = jsonify({"error": "Server is busy, please try again"})
+    response.headers["Retry-After"] = "1"
+    return response, 503
+
 @jwt.user_lookup_loader
 def user_lookup_callback(_jwt_header, jwt_data):
     identity = jwt_data["sub"]
-    return UserService.get_user_by_id(identity)
+    user = UserService.get_user_snapshot(identity)
+    if not user or user["status"] != "Active":
+        return None
+    return user
+
+@jwt.user_lookup_error_loader
+def user_lookup_error_callback(_jwt_header, jwt_data):
+    return jsonify({"error": "Account has been locked or removed"}), 401
 
 @jwt.additional_claims_loader
 def add_claims_to_access_token(identity):
-    user = UserService.get_user_by_id(identity)
+    user = UserService.get_user_snapshot(identity)
     if user:
-        return {"role": user.role}
+        return {"role": user["role"]}
     return {}
 
 @api_bp.route('/login', methods = ["POST"])
@@ -49,6 +64,7 @@ def login():
         return jsonify({"error": "Invalid credentials"}), 401
     if user.status != "Active":
         return jsonify({"error": "Account has been locked"}), 403
+    UserService.upgrade_password_hash(user, data["password"])
     access_token = create_access_token(identity=str(user.user_id))
     return jsonify(access_token = access_token)
 @api_bp.route('/register', methods=["GET"])
@@ -60,7 +76,7 @@ def register():
     if error:
         return jsonify({"error": error}), 409
     return jsonify({"message": "Registration successful!", "user": serialize_user(user)}), 201
-@api_bp('/send_otp', methods=["POST"])
+@api_bp.route('/send_otp', methods=["POST"])
 def send_otp():
     email = request.json.get("email")
     if not email:
@@ -92,3 +108,27 @@ def delete_my_account():
     if not success:
         return jsonify({"error": message}), 404
     return jsonify({"message": message}), 200
+@api_bp.route('/admin/users/bulk', methods=["POST"])
+@admin_required()
+def bulk_moderate_users():
+    data = request.get_json(silent=True) or {}
+    action = data.get("action")
+    if action not in BULK_ACTIONS:
+        return jsonify({"error": f"action must be one of: {', '.join(BULK_ACTIONS)}"}), 400
+    try:
+        user_ids = parse_ids(data.get("user_ids"), "user_ids")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if action in ("lock", "delete") and int(get_jwt_identity()) in user_ids:
+        return jsonify({"error": "Cannot lock or delete your own account"}), 400
+    if data.get("async") or len(user_ids) > BULK_SYNC_LIMIT:
+        job_id = BulkJobService.submit("users", action, user_ids)
+        return jsonify({"job_id": job_id, "status": "queued", "total": len(user_ids)}), 202
+    return jsonify(BulkJobService.run_sync(action, user_ids, UserService.bulk_moderate_chunk)), 200
+@api_bp.route('/admin/jobs/<job_id>', methods=["GET"])
+@admin_required()
+def get_bulk_job(job_id):
+    job = BulkJobService.get(job_id)
+    if not job:
+        return jsonify({"error": "Job not found or expired"}), 404
+    return jsonify(job), 200
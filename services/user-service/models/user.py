@@ -1,8 +1,8 @@
 from app import db
-from werkzeug.security import generate_password_hash, check_password_hash
+from services.passwordHasher import PasswordHasher
 
 class User(db.Model):
-    __table__ = "users"
+    __tablename__ = "users"
     
     user_id = db.Column(db.Integer, primary_key = True, autoincrement=True)
     username = db.Column(db.String(100), unique=True, nullable = False)
@@ -12,6 +12,8 @@ class User(db.Model):
     status = db.Column(db.Enum('Active', 'Locked', name='user_statuses'), default = "Active")
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = PasswordHasher.hash(password)
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
\ No newline at end of file
+        return PasswordHasher.verify(self.password_hash, password)
+    def password_needs_rehash(self):
+        return PasswordHasher.needs_rehash(self.password_hash)
\ No newline at end of file
@@ -0,0 +1,97 @@
+from app import r
+from services.jobQueue import JobQueue
+from datetime import datetime, timezone
+import os
+import uuid
+
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", 1000))
+BULK_SYNC_LIMIT = int(os.getenv("BULK_SYNC_LIMIT", 1000))
+BULK_MAX_IDS = int(os.getenv("BULK_MAX_IDS", 100000))
+BULK_JOB_TTL = int(os.getenv("BULK_JOB_TTL", 86400))
+JOB_INT_FIELDS = ("total", "processed", "affected")
+FINISHED_STATUSES = ("completed", "failed")
+
+bulk_queue = JobQueue("bulk-moderation")
+
+def parse_ids(values, field="ids"):
+    if not isinstance(values, list) or not values:
+        raise ValueError(f"{field} must be a non-empty list")
+    try:
+        ids = sorted({int(v) for v in values})
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} must contain integers")
+    if len(ids) > BULK_MAX_IDS:
+        raise ValueError(f"At most {BULK_MAX_IDS} {field} per request")
+    return ids
+
+def chunked(ids, size=BULK_CHUNK_SIZE):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+class BulkJobService:
+    @staticmethod
+    def _key(job_id):
+        return f"bulkjob:{job_id}"
+    @staticmethod
+    def run_sync(action, ids, run_chunk):
+        affected = []
+        for chunk in chunked(ids):
+            affected.extend(run_chunk(action, chunk))
+        skipped = sorted(set(ids) - set(affected))
+        return {
+            "action": action,
+            "requested": len(ids),
+            "affected": len(affected),
+            "skipped": len(skipped),
+            "skipped_ids": skipped[:BULK_SYNC_LIMIT]
+        }
+    @staticmethod
+    def submit(kind, action, ids):
+        job_id = uuid.uuid4().hex
+        key = BulkJobService._key(job_id)
+        pipe = r.pipeline()
+        pipe.hset(key, mapping={
+            "job_id": job_id,
+            "kind": kind,
+            "action": action,
+            "status": "queued",
+            "total": len(ids),
+            "processed": 0,
+            "affected": 0,
+            "created_at": datetime.now(timezone.utc).isoformat()
+        })
+        pipe.expire(key, BULK_JOB_TTL)
+        pipe.execute()
+        bulk_queue.enqueue({"job_id": job_id, "action": action, "ids": ids})
+        return job_id
+    @staticmethod
+    def process(job, heartbeat, run_chunk):
+        key = BulkJobService._key(job["job_id"])
+        state = r.hgetall(key)
+        if not state or state.get("status") in FINISHED_STATUSES:
+            return
+        r.hset(key, "status", "running")
+        try:
+            for chunk in chunked(job["ids"][int(state.get("processed", 0)):]):
+                affected = run_chunk(job["action"], chunk)
+                pipe = r.pipeline()
+                pipe.hincrby(key, "processed", len(chunk))
+                pipe.hincrby(key, "affected", len(affected))
+                pipe.execute()
+                heartbeat()
+        except Exception as e:
+            r.hset(key, mapping={"status": "failed", "error": str(e), "finished_at": datetime.now(timezone.utc).isoformat()})
+            raise
+        r.hset(key, mapping={"status": "completed", "finished_at": datetime.now(timezone.utc).isoformat()})
+    @staticmethod
+    def handler(run_chunk):
+        return lambda job, heartbeat: BulkJobService.process(job, heartbeat, run_chunk)
+    @staticmethod
+    def get(job_id):
+        job = r.hgetall(BulkJobService._key(job_id))
+        if not job:
+            return None
+        for field in JOB_INT_FIELDS:
+            job[field] = int(job.get(field, 0))
+        job["progress"] = round(job["processed"] / job["total"], 4) if job["total"] else 1.0
+        return job
@@ -0,0 +1,188 @@
+from app import r
+from email.mime.text import MIMEText
+import json
+import logging
+import os
+import random
+import smtplib
+import socket
+import time
+
+logger = logging.getLogger(__name__)
+
+MAIL_OUTBOX_KEY = "mail:outbox"
+MAIL_RETRY_KEY = "mail:retry"
+MAIL_DEAD_KEY = "mail:dead"
+MAIL_PROCESSING_PREFIX = "mail:processing"
+MAIL_HEARTBEAT_PREFIX = "mail:heartbeat"
+
+SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", 465))
+SMTP_USE_SSL = os.getenv("SMTP_USE_SSL", "true").lower() == "true"
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", 10))
+SENDER_EMAIL = os.getenv("SENDER_EMAIL")
+APP_PASSWORD = os.getenv("APP_PASSWORD")
+
+MAIL_BATCH_SIZE = int(os.getenv("MAIL_BATCH_SIZE", 50))
+MAIL_RATE_PER_SECOND = float(os.getenv("MAIL_RATE_PER_SECOND", 5))
+MAIL_MAX_ATTEMPTS = int(os.getenv("MAIL_MAX_ATTEMPTS", 5))
+MAIL_MAX_BACKOFF = int(os.getenv("MAIL_MAX_BACKOFF", 300))
+MAIL_IDLE_DISCONNECT = int(os.getenv("MAIL_IDLE_DISCONNECT", 60))
+MAIL_HEARTBEAT_TTL = int(os.getenv("MAIL_HEARTBEAT_TTL", 60))
+MAIL_RECOVER_INTERVAL = int(os.getenv("MAIL_RECOVER_INTERVAL", 30))
+
+class MailService:
+    @staticmethod
+    def enqueue(to, subject, body):
+        job = {"to": to, "subject": subject, "body": body, "attempts": 0, "queued_at": time.time()}
+        r.rpush(MAIL_OUTBOX_KEY, json.dumps(job))
+
+class MailWorker:
+    def __init__(self, worker_id=None):
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.processing_key = f"{MAIL_PROCESSING_PREFIX}:{self.worker_id}"
+        self.heartbeat_key = f"{MAIL_HEARTBEAT_PREFIX}:{self.worker_id}"
+        self.last_recover = 0
+        self.connection = None
+        self.last_used = 0
+        self.tokens = MAIL_RATE_PER_SECOND
+        self.last_refill = time.monotonic()
+
+    def _connect(self):
+        if SMTP_USE_SSL:
+            server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+        else:
+            server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+        if APP_PASSWORD:
+            server.login(SENDER_EMAIL, APP_PASSWORD)
+        return server
+
+    def _disconnect(self):
+        if self.connection is not None:
+            try:
+                self.connection.quit()
+            except smtplib.SMTPException:
+                pass
+            except OSError:
+                pass
+            self.connection = None
+
+    def _get_connection(self):
+        if self.connection is not None and time.monotonic() - self.last_used > MAIL_IDLE_DISCONNECT:
+            self._disconnect()
+        if self.connection is None:
+            self.connection = self._connect()
+        return self.connection
+
+    def _throttle(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(MAIL_RATE_PER_SECOND, self.tokens + (now - self.last_refill) * MAIL_RATE_PER_SECOND)
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            time.sleep((1 - self.tokens) / MAIL_RATE_PER_SECOND)
+
+    def _send(self, job):
+        msg = MIMEText(job["body"], "plain", "utf-8")
+        msg["Subject"] = job["subject"]
+        msg["From"] = SENDER_EMAIL
+        msg["To"] = job["to"]
+        self._throttle()
+        try:
+            self._get_connection().sendmail(SENDER_EMAIL, job["to"], msg.as_string())
+        except smtplib.SMTPServerDisconnected:
+            self.connection = None
+            self._get_connection().sendmail(SENDER_EMAIL, job["to"], msg.as_string())
+        self.last_used = time.monotonic()
+
+    def _fail(self, job, error):
+        job["attempts"] += 1
+        job["last_error"] = str(error)
+        if job["attempts"] >= MAIL_MAX_ATTEMPTS:
+            logger.error(f"Giving up on mail to {job['to']} after {job['attempts']} attempts: {error}")
+            r.rpush(MAIL_DEAD_KEY, json.dumps(job))
+            return
+        delay = min(MAIL_MAX_BACKOFF, 2 ** job["attempts"]) * random.uniform(0.8, 1.2)
+        logger.warning(f"Mail to {job['to']} failed, retrying in {delay:.0f}s: {error}")
+        r.zadd(MAIL_RETRY_KEY, {json.dumps(job): time.time() + delay})
+
+    def _dead(self, raw, error):
+        logger.error(f"Dead-lettering mail job: {error}")
+        try:
+            job = json.loads(raw)
+            job["last_error"] = str(error)
+            raw = json.dumps(job)
+        except (TypeError, ValueError):
+            pass
+        r.rpush(MAIL_DEAD_KEY, raw)
+
+    def heartbeat(self):
+        r.set(self.heartbeat_key, int(time.time()), ex=MAIL_HEARTBEAT_TTL)
+
+    def _requeue(self, processing_key):
+        moved = 0
+        while r.lmove(processing_key, MAIL_OUTBOX_KEY, "RIGHT", "LEFT"):
+            moved += 1
+        return moved
+
+    def recover(self):
+        moved = self._requeue(self.processing_key)
+        for processing_key in r.scan_iter(match=f"{MAIL_PROCESSING_PREFIX}:*"):
+            worker_id = processing_key[len(MAIL_PROCESSING_PREFIX) + 1:]
+            if worker_id != self.worker_id and not r.exists(f"{MAIL_HEARTBEAT_PREFIX}:{worker_id}"):
+                moved += self._requeue(processing_key)
+        self.last_recover = time.monotonic()
+        if moved:
+            logger.warning(f"Requeued {moved} mail jobs from stale processing lists")
+        return moved
+
+    def promote_due_retries(self):
+        for raw in r.zrangebyscore(MAIL_RETRY_KEY, "-inf", time.time(), start=0, num=MAIL_BATCH_SIZE):
+            if r.zrem(MAIL_RETRY_KEY, raw):
+                r.rpush(MAIL_OUTBOX_KEY, raw)
+
+    def next_batch(self, block_timeout=1):
+        first = r.blmove(MAIL_OUTBOX_KEY, self.processing_key, block_timeout, "LEFT", "RIGHT")
+        if first is None:
+            return []
+        batch = [first]
+        while len(batch) < MAIL_BATCH_SIZE:
+            raw = r.lmove(MAIL_OUTBOX_KEY, self.processing_key, "LEFT", "RIGHT")
+            if raw is None:
+                break
+            batch.append(raw)
+        return batch
+
+    def run_once(self, block_timeout=1):
+        self.heartbeat()
+        if time.monotonic() - self.last_recover > MAIL_RECOVER_INTERVAL:
+            self.recover()
+        self.promote_due_retries()
+        batch = self.next_batch(block_timeout)
+        for raw in batch:
+            try:
+                job = json.loads(raw)
+                self._send(job)
+            except (smtplib.SMTPException, OSError) as e:
+                self._disconnect()
+                self._fail(job, e)
+            except Exception as e:
+                self._dead(raw, e)
+            self.heartbeat()
+            r.lrem(self.processing_key, 1, raw)
+        return len(batch)
+
+    def run_forever(self):
+        self.heartbeat()
+        self.recover()
+        logger.info(f"Mail worker {self.worker_id} started")
+        try:
+            while True:
+                if not self.run_once():
+                    if self.connection is not None and time.monotonic() - self.last_used > MAIL_IDLE_DISCONNECT:
+                        self._disconnect()
+        finally:
+            self._disconnect()
+            r.delete(self.heartbeat_key)
@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from werkzeug.security import generate_password_hash, check_password_hash, DEFAULT_PBKDF2_ITERATIONS
+import os
+import threading
+
+PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:600000")
+PASSWORD_HASH_SALT_LENGTH = int(os.getenv("PASSWORD_HASH_SALT_LENGTH", 16))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", 16))
+PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", 5))
+
+def normalize_method(method):
+    name, *args = method.split(":")
+    if name == "scrypt":
+        defaults = (2 ** 15, 8, 1)
+        return (name,) + tuple(int(args[i]) if len(args) > i else default for i, default in enumerate(defaults))
+    if name == "pbkdf2":
+        hash_name = args[0] if args else "sha256"
+        iterations = int(args[1]) if len(args) > 1 else DEFAULT_PBKDF2_ITERATIONS
+        return (name, hash_name, iterations)
+    return (name, *args)
+
+PASSWORD_HASH_TARGET = normalize_method(PASSWORD_HASH_METHOD)
+
+class PasswordHasherBusy(Exception):
+    pass
+
+class PasswordHasher:
+    _executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+    _slots = threading.BoundedSemaphore(PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_SIZE)
+
+    @staticmethod
+    def _run(fn, *args, **kwargs):
+        if not PasswordHasher._slots.acquire(blocking=False):
+            raise PasswordHasherBusy("Password hashing queue is full")
+        try:
+            future = PasswordHasher._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            PasswordHasher._slots.release()
+            raise
+        future.add_done_callback(lambda _: PasswordHasher._slots.release())
+        try:
+            return future.result(timeout=PASSWORD_HASH_TIMEOUT)
+        except FutureTimeoutError:
+            raise PasswordHasherBusy("Password hashing timed out")
+    @staticmethod
+    def hash(password):
+        return PasswordHasher._run(
+            generate_password_hash, password,
+            method=PASSWORD_HASH_METHOD, salt_length=PASSWORD_HASH_SALT_LENGTH
+        )
+    @staticmethod
+    def verify(password_hash, password):
+        return PasswordHasher._run(check_password_hash, password_hash, password)
+    @staticmethod
+    def needs_rehash(password_hash):
+        try:
+            return normalize_method(password_hash.split("$", 1)[0]) != PASSWORD_HASH_TARGET
+        except ValueError:
+            return True
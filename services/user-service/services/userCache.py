@@ -0,0 +1,82 @@
+from app import r
+from collections import OrderedDict
+import json
+import logging
+import os
+import threading
+import time
+import redis
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 300))
+USER_LOCAL_CACHE_TTL = float(os.getenv("USER_LOCAL_CACHE_TTL", 5))
+USER_LOCAL_CACHE_SIZE = int(os.getenv("USER_LOCAL_CACHE_SIZE", 2048))
+
+class LocalTTLCache:
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+class UserCache:
+    _local = LocalTTLCache(USER_LOCAL_CACHE_SIZE, USER_LOCAL_CACHE_TTL)
+
+    @staticmethod
+    def _key(user_id):
+        return f"user:snapshot:{user_id}"
+    @staticmethod
+    def get(user_id, loader):
+        key = UserCache._key(user_id)
+        snapshot = UserCache._local.get(key)
+        if snapshot is not None:
+            return snapshot
+        try:
+            cached = r.get(key)
+            if cached is not None:
+                snapshot = json.loads(cached)
+                UserCache._local.set(key, snapshot)
+                return snapshot
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"User cache unavailable: {e}")
+        snapshot = loader()
+        if snapshot is None:
+            return None
+        UserCache._local.set(key, snapshot)
+        try:
+            r.setex(key, USER_CACHE_TTL, json.dumps(snapshot))
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Failed to store user cache key {key}: {e}")
+        return snapshot
+    @staticmethod
+    def invalidate(*user_ids):
+        keys = [UserCache._key(int(user_id)) for user_id in user_ids]
+        for key in keys:
+            UserCache._local.delete(key)
+        if not keys:
+            return
+        try:
+            r.delete(*keys)
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Failed to invalidate user cache: {e}")
@@ -1,32 +1,47 @@
-import os
-import smtplib
 import secrets
 import string
-from email.mime.text import MIMEText
 
 from app import db, r
+from sqlalchemy import func, update, delete
 from models.user import User
+from services.userCache import UserCache
+from services.mailService import MailService
+from services.outboxService import OutboxService
+
+BULK_STATUS_ACTIONS = {"lock": "Locked", "unlock": "Active"}
+BULK_ACTIONS = tuple(BULK_STATUS_ACTIONS) + ("delete",)
+
+def user_payload(user):
+    return {"user_id": user.user_id, "username": user.username, "role": user.role, "status": user.status}
 
 class UserService:
-    SENDER_EMAIL = os.getenv("SENDER_EMAIL")
-    APP_PASSWORD = os.getenv("APP_PASSWORD")
-    
     @staticmethod
     def get_user_by_id(user_id):
         return User.query.get(user_id)
+    @staticmethod
+    def get_user_snapshot(user_id):
+        def load():
+            user = UserService.get_user_by_id(user_id)
+            if not user:
+                return None
+            return user_payload(user)
+        return UserCache.get(int(user_id), load)
     
     @staticmethod
     def create_user(email, username, password, role = "Member", status = "Active"):
-        if User.query.filter_by(email):
+        if User.query.filter_by(email = email).first():
             return None, "Email already exist"
-        if User.query.filter_by(username):
+        if User.query.filter_by(username = username).first():
             return None, "Username already exist"
         if len(password) < 8:
             return None, "The minimum length of the password must be 8"
         user = User(username = username, email = email, role = role, status = status)
         user.set_password(password=password)
         db.session.add(user)
+        db.session.flush()
+        OutboxService.record("user", "created", user.user_id, user_payload(user))
         db.session.commit()
+        return user, None
     @staticmethod
     def get_user_by_email(email):
         return User.query.filter_by(email = email).first()
@@ -40,6 +55,18 @@ class UserService:
             user = User.query.filter_by(email = email_username).first()
         return user
     @staticmethod
+    def upgrade_password_hash(user, password):
+        if not user.password_needs_rehash():
+            return False
+        user.set_password(password)
+        db.session.commit()
+        return True
+    @staticmethod
+    def stats():
+        by_role = dict(db.session.query(User.role, func.count(User.user_id)).group_by(User.role).all())
+        by_status = dict(db.session.query(User.status, func.count(User.user_id)).group_by(User.status).all())
+        return {"total": sum(by_role.values()), "by_role": by_role, "by_status": by_status}
+    @staticmethod
     def get_all_users():
         return User.query.all()
     @staticmethod
@@ -56,7 +83,9 @@ class UserService:
             if len(data['password']) < 8:
                 return None, "The minimum length of the password must be 8"
             user.set_password(data['password'])
+        OutboxService.record("user", "updated", user.user_id, user_payload(user))
         db.session.commit()
+        UserCache.invalidate(user.user_id)
         return user, None
     @staticmethod
     def delete_user(user_id):
@@ -64,7 +93,9 @@ class UserService:
         if not user:
             return False, "User not found"
         db.session.delete(user)
+        OutboxService.record("user", "deleted", user_id, {"user_id": user_id})
         db.session.commit()
+        UserCache.invalidate(user_id)
         return True, "User deleted successfully"
     @staticmethod
     def toggle_user_lock(user_id):
@@ -75,30 +106,43 @@ class UserService:
             user.status = "Locked"
         else:
             user.status = "Active"
+        OutboxService.record("user", "updated", user.user_id, user_payload(user))
         db.session.commit()
+        UserCache.invalidate(user.user_id)
         return user, None
     @staticmethod
+    def bulk_moderate_chunk(action, user_ids):
+        if action == "delete":
+            stmt = delete(User).where(User.user_id.in_(user_ids)).returning(User.user_id)
+            affected = [row.user_id for row in db.session.execute(stmt)]
+            OutboxService.record_many("user", "deleted", [(user_id, {"user_id": user_id}) for user_id in affected])
+        else:
+            status = BULK_STATUS_ACTIONS[action]
+            stmt = (
+                update(User)
+                .where(User.user_id.in_(user_ids), User.status != status)
+                .values(status=status)
+                .returning(User.user_id, User.username, User.role, User.status)
+            )
+            rows = db.session.execute(stmt).all()
+            affected = [row.user_id for row in rows]
+            OutboxService.record_many("user", "updated", [(row.user_id, user_payload(row)) for row in rows])
+        db.session.commit()
+        UserCache.invalidate(*affected)
+        return affected
+    @staticmethod
     def send_reset_otp(email):
         user = UserService.get_user_by_email(email=email)
         if not user:
             return False, "User not found"
         otp = ''.join(secrets.choice(string.digits) for _ in range(6))
-        r.setex(f"otp: {email}", 300, otp)
-        
-        try:
-            subject = "Your OTP Code"
-            body = f"Your OTP code is: {otp}. It will expire in 5 minutes."
-            msg = MIMEText(body, "plan", "utf-8")
-            msg["Subject"] = subject
-            msg["From"] = UserService.SENDER_EMAIL
-            msg["To"] = email
-            with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-                server.login(UserService.SENDER_EMAIL, UserService.APP_PASSWORD)
-                server.sendmail(UserService.SENDER_EMAIL, email, msg.as_string())
-            return True, "OTP has been sent to your email."
-        except Exception as e:
-            print(f"ERROR sending email: {e}")
-            return False, "Failed to send OTP email."
+        r.setex(f"otp:{email}", 300, otp)
+        MailService.enqueue(
+            to=email,
+            subject="Your OTP Code",
+            body=f"Your OTP code is: {otp}. It will expire in 5 minutes."
+        )
+        return True, "OTP has been sent to your email."
     @staticmethod
     def verify_otp_and_reset_password(email, input_otp, new_password):
         saved_otp = r.get(f"otp:{email}")
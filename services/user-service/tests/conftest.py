@@ -0,0 +1,21 @@
+import os
+import sys
+import types
+
+import pytest
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+    collect_ignore_glob = ["test_*.py"]
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if fakeredis is not None:
+    sys.modules.setdefault("app", types.SimpleNamespace(r=fakeredis.FakeRedis(decode_responses=True)))
+
+@pytest.fixture
+def redis_client():
+    client = sys.modules["app"].r
+    client.flushall()
+    return client
@@ -0,0 +1,72 @@
+import json
+import socket
+
+import pytest
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+
+from services import mailService
+from services.mailService import MailService, MailWorker, MAIL_DEAD_KEY, MAIL_OUTBOX_KEY, MAIL_RETRY_KEY
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+class RecordingHandler:
+    def __init__(self):
+        self.envelopes = []
+    async def handle_DATA(self, server, session, envelope):
+        self.envelopes.append(envelope)
+        return "250 OK"
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    handler = RecordingHandler()
+    controller = aiosmtpd_controller.Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    monkeypatch.setattr(mailService, "SMTP_HOST", "127.0.0.1")
+    monkeypatch.setattr(mailService, "SMTP_PORT", controller.port)
+    monkeypatch.setattr(mailService, "SMTP_USE_SSL", False)
+    monkeypatch.setattr(mailService, "APP_PASSWORD", None)
+    monkeypatch.setattr(mailService, "SENDER_EMAIL", "noreply@example.com")
+    monkeypatch.setattr(mailService, "MAIL_RATE_PER_SECOND", 1000)
+    yield handler
+    controller.stop()
+
+def test_sends_queued_mail_and_clears_processing_list(redis_client, smtp_server):
+    for i in range(3):
+        MailService.enqueue(f"user{i}@example.com", "OTP", f"code {i}")
+    worker = MailWorker("test")
+    assert worker.run_once(block_timeout=1) == 3
+    assert sorted(e.rcpt_tos[0] for e in smtp_server.envelopes) == [f"user{i}@example.com" for i in range(3)]
+    assert redis_client.llen(worker.processing_key) == 0
+    assert redis_client.llen(MAIL_OUTBOX_KEY) == 0
+
+def test_non_smtp_error_is_dead_lettered_without_stopping_the_batch(redis_client, smtp_server):
+    redis_client.rpush(MAIL_OUTBOX_KEY, json.dumps({"subject": "missing recipient", "body": "x", "attempts": 0}))
+    MailService.enqueue("ok@example.com", "OTP", "code")
+    worker = MailWorker("test")
+    assert worker.run_once(block_timeout=1) == 2
+    assert [e.rcpt_tos[0] for e in smtp_server.envelopes] == ["ok@example.com"]
+    assert json.loads(redis_client.lindex(MAIL_DEAD_KEY, 0))["subject"] == "missing recipient"
+    assert redis_client.llen(worker.processing_key) == 0
+
+def test_smtp_failure_schedules_retry(redis_client, monkeypatch):
+    monkeypatch.setattr(mailService, "SMTP_HOST", "127.0.0.1")
+    monkeypatch.setattr(mailService, "SMTP_PORT", free_port())
+    monkeypatch.setattr(mailService, "SMTP_USE_SSL", False)
+    monkeypatch.setattr(mailService, "MAIL_RATE_PER_SECOND", 1000)
+    MailService.enqueue("user@example.com", "OTP", "code")
+    worker = MailWorker("test")
+    worker.run_once(block_timeout=1)
+    retried = [json.loads(raw) for raw in redis_client.zrange(MAIL_RETRY_KEY, 0, -1)]
+    assert [job["attempts"] for job in retried] == [1]
+
+def test_recover_requeues_lists_of_dead_workers_only(redis_client):
+    redis_client.rpush(f"{mailService.MAIL_PROCESSING_PREFIX}:crashed", "orphan")
+    redis_client.rpush(f"{mailService.MAIL_PROCESSING_PREFIX}:alive", "in-flight")
+    MailWorker("alive").heartbeat()
+    assert MailWorker("fresh").recover() == 1
+    assert redis_client.lrange(MAIL_OUTBOX_KEY, 0, -1) == ["orphan"]
+    assert redis_client.llen(f"{mailService.MAIL_PROCESSING_PREFIX}:alive") == 1
@@ -8,13 +8,17 @@ from flask_migrate import Migrate
 import redis
 import click
 from models.vehicle import Vehicle
+from models.outbox_event import OutboxEvent
 from services.vehicleService import VehicleService
 from controllers.controller_api import api_dp
+from controllers.internal_controller import internal_bp
+from services.outboxService import OutboxService, RELAY_BATCH_SIZE, PUBLISHED_RETENTION_HOURS
 
 load_dotenv()
 db = SQLAlchemy()
 jwt = JWTManager()
 migrate = Migrate(version_table = 'alembic_version_vehicles')
+r = redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379"), decode_responses = True)
 
 def create_app():
     app = Flask(__name__)
@@ -30,4 +34,20 @@ def create_app():
     jwt.init_app(app)
     
     app.register_blueprint(api_dp)
-    return app
\ No newline at end of file
+    app.register_blueprint(internal_bp)
+
+    @app.cli.command("outbox-relay")
+    @click.option("--batch-size", default=RELAY_BATCH_SIZE)
+    @click.option("--once", is_flag=True)
+    def outbox_relay_command(batch_size, once):
+        if once:
+            print(f"Đã phát {OutboxService.relay_batch(batch_size)} sự kiện.")
+            return
+        OutboxService.run_relay(batch_size)
+
+    @app.cli.command("purge-outbox")
+    @click.option("--retention-hours", default=PUBLISHED_RETENTION_HOURS)
+    def purge_outbox_command(retention_hours):
+        print(f"Đã xóa {OutboxService.purge_published(retention_hours)} sự kiện đã phát.")
+
+    return app
@@ -3,6 +3,8 @@ from functools import wraps
 from app import jwt
 from flask_jwt_extended import get_jwt, verify_jwt_in_request
 from services.vehicleService import VehicleService
+import csv
+import io
 
 api_dp = Blueprint('api', __name__, url_prefix='/api')
 
@@ -12,7 +14,7 @@ def admin_required():
         def decorator(*args, **kwargs):
             verify_jwt_in_request()
             claim = get_jwt()
-            if claim.get("role") != "admin":
+            if claim.get("role") != "Admin":
                 return jsonify({"error": "Admin access required"}), 403
             return fn(*args, **kwargs)
         return decorator
@@ -21,8 +23,9 @@ def role_required():
     def wrapper(fn):
         @wraps(fn)
         def decorator(*args, **kwargs):
+            verify_jwt_in_request()
             claims = get_jwt()
-            if claims.get("role") != "Admin" or claims.get("role") != "Staff":
+            if claims.get("role") not in ("Admin", "Staff"):
                 return jsonify({"error": "Admin or Staff access required"}), 403
             return fn(*args, **kwargs)
         return decorator
@@ -61,4 +64,38 @@ def get_vehicle(vehicle_id):
     vehicle, message = VehicleService.get_vehicle_by_id(vehicle_id)
     if not vehicle:
         return jsonify({"error": message})
-    return jsonify({"message": message, "vehicle": serialize_vehicle(vehicle)}), 200
\ No newline at end of file
+    return jsonify({"message": message, "vehicle": serialize_vehicle(vehicle)}), 200
+@api_dp.route('/vehicles/bulk', methods = ["POST"])
+@admin_required()
+def bulk_create_vehicles():
+    if request.mimetype == "text/csv":
+        rows = csv.DictReader(io.TextIOWrapper(request.stream, encoding="utf-8-sig", newline=""))
+    else:
+        rows = request.get_json(silent=True)
+        if not isinstance(rows, list):
+            return jsonify({"error": "Body must be a JSON array or a text/csv stream"}), 400
+    report = VehicleService.bulk_create_vehicles(rows)
+    return jsonify(report), 201 if report["created"] else 400
+@api_dp.route('/vehicles/bulk', methods = ["PUT"])
+@admin_required()
+def bulk_update_vehicles():
+    if request.mimetype == "text/csv":
+        rows = csv.DictReader(io.TextIOWrapper(request.stream, encoding="utf-8-sig", newline=""))
+    else:
+        rows = request.get_json(silent=True)
+        if not isinstance(rows, list):
+            return jsonify({"error": "Body must be a JSON array or a text/csv stream"}), 400
+    report = VehicleService.bulk_update_vehicles(rows)
+    return jsonify(report), 200
+@api_dp.route('/vehicles/bulk', methods = ["DELETE"])
+@admin_required()
+def bulk_delete_vehicles():
+    data = request.get_json(silent=True) or {}
+    vehicle_ids = data.get("vehicle_ids")
+    if not isinstance(vehicle_ids, list):
+        return jsonify({"error": "vehicle_ids must be a list"}), 400
+    try:
+        vehicle_ids = sorted({int(v) for v in vehicle_ids})
+    except (TypeError, ValueError):
+        return jsonify({"error": "vehicle_ids must contain integers"}), 400
+    return jsonify(VehicleService.bulk_delete_vehicles(vehicle_ids)), 200
@@ -0,0 +1,48 @@
+from flask import request, jsonify, Blueprint, current_app
+from functools import wraps
+from services.vehicleService import VehicleService
+from controllers.controller_api import serialize_vehicle
+
+internal_bp = Blueprint('internal', __name__, url_prefix='/internal')
+
+MAX_BULK_IDS = 1000
+
+def internal_required():
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            token = current_app.config.get('INTERNAL_SERVICE_TOKEN')
+            if not token or request.headers.get('X-Internal-Token') != token:
+                return jsonify({"error": "Internal access required"}), 403
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
+
+@internal_bp.route('/vehicles/bulk', methods=["POST"])
+@internal_required()
+def get_vehicles_bulk():
+    data = request.get_json(silent=True) or {}
+    vehicle_ids = data.get("vehicle_ids")
+    if not isinstance(vehicle_ids, list):
+        return jsonify({"error": "vehicle_ids must be a list"}), 400
+    try:
+        vehicle_ids = {int(v) for v in vehicle_ids}
+    except (TypeError, ValueError):
+        return jsonify({"error": "vehicle_ids must contain integers"}), 400
+    if len(vehicle_ids) > MAX_BULK_IDS:
+        return jsonify({"error": f"At most {MAX_BULK_IDS} vehicle_ids per request"}), 400
+    vehicles = VehicleService.get_vehicles_by_ids(vehicle_ids)
+    return jsonify({"vehicles": [serialize_vehicle(v) for v in vehicles]}), 200
+
+@internal_bp.route('/vehicles', methods=["GET"])
+@internal_required()
+def list_vehicles():
+    after_id = request.args.get("after_id", 0, type=int)
+    limit = min(request.args.get("limit", MAX_BULK_IDS, type=int), MAX_BULK_IDS)
+    vehicles = VehicleService.get_vehicles_after(after_id, limit)
+    return jsonify({"vehicles": [serialize_vehicle(v) for v in vehicles]}), 200
+
+@internal_bp.route('/stats', methods=["GET"])
+@internal_required()
+def stats():
+    return jsonify(VehicleService.stats()), 200
@@ -1,7 +1,7 @@
 from app import db
 
 class Vehicle(db.Model):
-    __table__ = "vehicles"
+    __tablename__ = "vehicles"
     
     vehicle_id = db.Column(db.Integer, primary_key = True, autoincrement=True)
     brand = db.Column(db.String(50), nullable=False)
@@ -1,28 +1,83 @@
 from app import db
 from models.vehicle import Vehicle
+from services.outboxService import OutboxService
+from sqlalchemy import insert, func
+from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_FIELDS = ['brand', 'model', 'year', 'mileage']
+BULK_CHUNK_SIZE = 500
+
+def vehicle_payload(vehicle):
+    return {
+        'vehicle_id': vehicle.vehicle_id,
+        'brand': vehicle.brand,
+        'model': vehicle.model,
+        'year': vehicle.year,
+        'mileage': vehicle.mileage
+    }
 
 class VehicleService:
     @staticmethod
-    def create_vehicle(data):
-        required_fields = ['brand', 'model', 'year', 'mileage']
-        if not all(field in data for field in required_fields):
+    def _validate_vehicle(data, partial=False):
+        if not isinstance(data, dict):
+            return None, "Vehicle data must be an object."
+        if not partial and not all(field in data for field in REQUIRED_FIELDS):
             return None, "Missing required vehicle data."
-        if data["year"] > datetime.now().year:
+        row = {}
+        for field in ('brand', 'model'):
+            if field in data:
+                value = str(data[field]).strip() if data[field] is not None else ""
+                if not value or len(value) > 50:
+                    return None, f"Invalid {field}"
+                row[field] = value
+        for field in ('year', 'mileage'):
+            if field in data:
+                try:
+                    row[field] = int(data[field])
+                except (TypeError, ValueError):
+                    return None, f"Invalid {field}"
+        if 'year' in row and row["year"] > datetime.now().year:
             return None, "Invalid year of manufacture"
-        new_vehicle = Vehicle(
-            brand=data['brand'],
-            model=data['model'],
-            year=data['year'],
-            mileage=data['mileage']
-        )
+        if 'mileage' in row and row["mileage"] < 0:
+            return None, "Invalid mileage"
+        return row, None
+    @staticmethod
+    def create_vehicle(data):
+        row, error = VehicleService._validate_vehicle(data)
+        if error:
+            return None, error
+        new_vehicle = Vehicle(**row)
         db.session.add(new_vehicle)
+        db.session.flush()
+        OutboxService.record("vehicle", "created", new_vehicle.vehicle_id, vehicle_payload(new_vehicle))
         db.session.commit()
         return new_vehicle, "Vehicle created successfully."
     @staticmethod
     def get_vehicle_by_id(vehicle_id):
         return Vehicle.query.get(vehicle_id)
     @staticmethod
+    def get_vehicles_by_ids(vehicle_ids):
+        if not vehicle_ids:
+            return []
+        return Vehicle.query.filter(Vehicle.vehicle_id.in_(list(vehicle_ids))).all()
+    @staticmethod
+    def stats(top_brands=10):
+        brands = (
+            db.session.query(Vehicle.brand, func.count(Vehicle.vehicle_id).label("count"))
+            .group_by(Vehicle.brand).order_by(func.count(Vehicle.vehicle_id).desc()).limit(top_brands).all()
+        )
+        return {
+            "total": db.session.query(func.count(Vehicle.vehicle_id)).scalar(),
+            "top_brands": [{"brand": brand, "count": count} for brand, count in brands]
+        }
+    @staticmethod
+    def get_vehicles_after(after_id, limit):
+        return Vehicle.query.filter(Vehicle.vehicle_id > after_id).order_by(Vehicle.vehicle_id).limit(limit).all()
+    @staticmethod
     def update_vehicle(vehicle_id, data):
         vehicle = VehicleService.get_vehicle_by_id(vehicle_id)
         if not vehicle:
@@ -33,12 +88,109 @@ class VehicleService:
         vehicle.year = data.get('year', vehicle.year)
         vehicle.mileage = data.get('mileage', vehicle.mileage)
         
+        OutboxService.record("vehicle", "updated", vehicle.vehicle_id, vehicle_payload(vehicle))
         db.session.commit()
-        return True, "Update vehicle successfully"
+        return vehicle, "Update vehicle successfully"
     @staticmethod
     def delete_vehicle(vehicle_id):
         vehicle = VehicleService.get_vehicle_by_id(vehicle_id)
         if not vehicle:
             return False, "Vehicle not found"
         db.session.delete(vehicle)
-        db.session.commit()
\ No newline at end of file
+        OutboxService.record("vehicle", "deleted", vehicle_id, {'vehicle_id': vehicle_id})
+        db.session.commit()
+        return True, "Vehicle deleted successfully"
+    @staticmethod
+    def _chunked(rows, size=BULK_CHUNK_SIZE):
+        chunk = []
+        for item in rows:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    @staticmethod
+    def _insert_chunk(chunk):
+        rows = [row for _, row in chunk]
+        try:
+            inserted = db.session.execute(
+                insert(Vehicle).values(rows)
+                .returning(Vehicle.vehicle_id, Vehicle.brand, Vehicle.model, Vehicle.year, Vehicle.mileage)
+            ).all()
+            OutboxService.record_many("vehicle", "created", [(row.vehicle_id, vehicle_payload(row)) for row in inserted])
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error(f"Bulk vehicle insert failed: {e}", exc_info=True)
+            return [], [{"row": index, "error": "Database error"} for index, _ in chunk]
+        return [row.vehicle_id for row in inserted], []
+    @staticmethod
+    def bulk_create_vehicles(rows):
+        created, errors = [], []
+        def valid_rows():
+            for index, data in enumerate(rows, start=1):
+                row, error = VehicleService._validate_vehicle(data)
+                if error:
+                    errors.append({"row": index, "error": error})
+                    continue
+                yield index, row
+        for chunk in VehicleService._chunked(valid_rows()):
+            ids, chunk_errors = VehicleService._insert_chunk(chunk)
+            created.extend(ids)
+            errors.extend(chunk_errors)
+        return {"created": len(created), "vehicle_ids": created, "failed": len(errors), "errors": errors}
+    @staticmethod
+    def bulk_update_vehicles(rows):
+        updated, errors = 0, []
+        def valid_rows():
+            for index, data in enumerate(rows, start=1):
+                row, error = VehicleService._validate_vehicle(data, partial=True)
+                if error:
+                    errors.append({"row": index, "error": error})
+                    continue
+                try:
+                    row['vehicle_id'] = int(data.get('vehicle_id'))
+                except (TypeError, ValueError):
+                    errors.append({"row": index, "error": "Missing vehicle_id"})
+                    continue
+                yield index, row
+        for chunk in VehicleService._chunked(valid_rows()):
+            existing = {
+                vehicle_id for (vehicle_id,) in
+                db.session.query(Vehicle.vehicle_id).filter(Vehicle.vehicle_id.in_([row['vehicle_id'] for _, row in chunk]))
+            }
+            mappings = []
+            for index, row in chunk:
+                if row['vehicle_id'] not in existing:
+                    errors.append({"row": index, "error": "Vehicle not found"})
+                else:
+                    mappings.append(row)
+            if not mappings:
+                continue
+            try:
+                db.session.bulk_update_mappings(Vehicle, mappings)
+                OutboxService.record_many("vehicle", "updated", [
+                    (v.vehicle_id, vehicle_payload(v))
+                    for v in VehicleService.get_vehicles_by_ids([row['vehicle_id'] for row in mappings])
+                ])
+                db.session.commit()
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                logger.error(f"Bulk vehicle update failed: {e}", exc_info=True)
+                errors.extend({"row": index, "error": "Database error"} for index, row in chunk if row['vehicle_id'] in existing)
+                continue
+            updated += len(mappings)
+        return {"updated": updated, "failed": len(errors), "errors": errors}
+    @staticmethod
+    def bulk_delete_vehicles(vehicle_ids):
+        deleted, not_found = [], []
+        for chunk in VehicleService._chunked(vehicle_ids):
+            ids = db.session.execute(
+                Vehicle.__table__.delete().where(Vehicle.vehicle_id.in_(chunk)).returning(Vehicle.vehicle_id)
+            ).scalars().all()
+            OutboxService.record_many("vehicle", "deleted", [(vehicle_id, {'vehicle_id': vehicle_id}) for vehicle_id in ids])
+            db.session.commit()
+            deleted.extend(ids)
+            not_found.extend(set(chunk) - set(ids))
+        return {"deleted": len(deleted), "not_found": sorted(not_found)}